@@ -19,15 +19,22 @@ Requirements:
     Python 3.8+ (no external dependencies for fetching; optionally 'requests')
 """
 
+import functools
+import gzip
 import json
+import pickle
 import os
 import sys
 import re
 import ssl
 import argparse
 import subprocess
+import tarfile
 import urllib.request
 import urllib.error
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from pybtex.database import parse_string as _pybtex_parse
@@ -90,11 +97,41 @@ def _bib_to_harvard(bibtex_str: str) -> str:
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from solve_it_library import KnowledgeBase
 
+# orjson (C-implemented) parses and serializes the KB payloads several
+# times faster than stdlib json; fall back to the stdlib when it is not
+# installed.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _embed_json(obj) -> str:
+    """Serialize obj as a JSON.parse("…") expression for <script> embedding.
+
+    Engines route a JSON string through their dedicated JSON parser, which is
+    markedly faster than evaluating the equivalent object literal. The
+    payload is quoted as a JS string literal, with </ broken up so it cannot
+    close the surrounding <script> tag.
+    """
+    literal = json.dumps(_dumps(obj), ensure_ascii=False)
+    return "JSON.parse(" + literal.replace("</", "<\\/") + ")"
+
 # ─────────────────────────────────────────────────────────────────────────────
 # GitHub endpoints
 # ─────────────────────────────────────────────────────────────────────────────
 GITHUB_RAW_BASE  = "https://raw.githubusercontent.com/SOLVE-IT-DF/solve-it/main"
 GITHUB_API_BASE  = "https://api.github.com/repos/SOLVE-IT-DF/solve-it/contents"
+GITHUB_TARBALL_URL = "https://api.github.com/repos/SOLVE-IT-DF/solve-it/tarball/main"
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Network helpers
@@ -103,9 +140,43 @@ GITHUB_API_BASE  = "https://api.github.com/repos/SOLVE-IT-DF/solve-it/contents"
 # Set to an unverified SSL context when --no-verify-ssl is passed
 _ssl_context: ssl.SSLContext | None = None
 
+# One shared requests.Session (when requests is installed) keeps HTTPS
+# connections alive across the hundreds of per-file fetches instead of
+# paying a TLS handshake per call; urllib remains the dependency-free
+# fallback, matching the module docstring.
+try:
+    import requests as _requests
+except ImportError:
+    _requests = None
+_session: "_requests.Session | None" = None
+
+
+def configure_ssl(no_verify: bool) -> None:
+    """Set the module's SSL context for remote fetches (--no-verify-ssl)."""
+    global _ssl_context
+    if no_verify:
+        _ssl_context = ssl._create_unverified_context()
+        print("[warn] SSL certificate verification disabled (--no-verify-ssl).", file=sys.stderr)
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = _requests.Session()
+        _session.headers["User-Agent"] = "SOLVE-IT-Generator/1.0"
+    return _session
+
 
 def fetch_url(url: str, timeout: int = 15) -> str | None:
     """Return decoded text content of a URL, or None on failure."""
+    if _requests is not None:
+        try:
+            resp = _get_session().get(url, timeout=timeout, verify=_ssl_context is None)
+            resp.raise_for_status()
+            return resp.text
+        except Exception as exc:
+            print(f"  [warn] {url}: {exc}", file=sys.stderr)
+            return None
     try:
         req = urllib.request.Request(url, headers={"User-Agent": "SOLVE-IT-Generator/1.0"})
         with urllib.request.urlopen(req, timeout=timeout, context=_ssl_context) as resp:
@@ -119,8 +190,8 @@ def fetch_json(url: str) -> dict | list | None:
     text = fetch_url(url)
     if text:
         try:
-            return json.loads(text)
-        except json.JSONDecodeError as exc:
+            return _loads(text)
+        except ValueError as exc:
             print(f"  [warn] JSON error {url}: {exc}", file=sys.stderr)
     return None
 
@@ -129,104 +200,219 @@ def fetch_json(url: str) -> dict | list | None:
 # Data loading
 # ─────────────────────────────────────────────────────────────────────────────
 
-def load_from_github() -> dict:
-    """Fetch all SOLVE-IT data from GitHub."""
-    print("Connecting to GitHub …")
+def _load_from_github_tarball() -> dict | None:
+    """Fetch the whole repository as one tarball and extract the data/ files.
+
+    One round-trip replaces the three directory listings plus a request per
+    file, and sidesteps the unauthenticated per-request rate limit. Returns
+    None on any failure so the caller can fall back to per-file fetching.
+    """
+    print("  Fetching repository tarball …")
     db: dict = {"techniques": [], "weaknesses": [], "mitigations": [], "objectives": []}
+    cite_files: dict = {}
+    try:
+        req = urllib.request.Request(GITHUB_TARBALL_URL,
+                                     headers={"User-Agent": "SOLVE-IT-Generator/1.0"})
+        with urllib.request.urlopen(req, timeout=60, context=_ssl_context) as resp, \
+                tarfile.open(fileobj=resp, mode="r|gz") as tar:
+            for member in tar:
+                if not member.isfile():
+                    continue
+                # Member names carry a "<org>-<repo>-<sha>/" prefix
+                path = member.name.split("/", 1)[1] if "/" in member.name else member.name
+                if not path.startswith("data/"):
+                    continue
+                parts = path.split("/")
+                data = tar.extractfile(member).read()
+                if (len(parts) == 3 and parts[1] in ("techniques", "weaknesses", "mitigations")
+                        and path.endswith(".json")):
+                    try:
+                        db[parts[1]].append(_loads(data))
+                    except ValueError as exc:
+                        print(f"  [warn] {path}: {exc}", file=sys.stderr)
+                elif path == "data/solve-it.json":
+                    cfg = _loads(data)
+                    # solve-it.json may be a bare list or a dict wrapping objectives
+                    db["objectives"] = cfg if isinstance(cfg, list) else cfg.get("objectives", [])
+                elif (len(parts) == 3 and parts[1] == "references"
+                        and parts[2].startswith("DFCite-")
+                        and (path.endswith(".bib") or path.endswith(".txt"))):
+                    cite_files[parts[2]] = data.decode("utf-8")
+    except Exception as exc:
+        print(f"  [warn] Tarball fetch failed ({exc}); falling back to per-file fetching.",
+              file=sys.stderr)
+        return None
 
-    for category in ("techniques", "weaknesses", "mitigations"):
-        print(f"  Fetching {category} listing …")
-        listing = fetch_json(f"{GITHUB_API_BASE}/data/{category}")
-        if not listing:
-            sys.exit(f"ERROR: Could not list data/{category} from GitHub. "
-                     "Check network access or use --local.")
-        files = [f for f in listing if f["name"].endswith(".json")]
-        print(f"  Found {len(files)} {category} files.")
-        for f in files:
-            obj = fetch_json(f"{GITHUB_RAW_BASE}/data/{category}/{f['name']}")
-            if obj:
-                db[category].append(obj)
-
-    # solve-it.json holds the canonical objectives / tactic ordering
-    print("  Fetching objectives (solve-it.json) …")
-    cfg = fetch_json(f"{GITHUB_RAW_BASE}/data/solve-it.json")
-    if cfg:
-        # solve-it.json may be a bare list or a dict wrapping objectives
-        db["objectives"] = cfg if isinstance(cfg, list) else cfg.get("objectives", [])
-    else:
-        print("  [warn] Could not fetch solve-it.json – objectives will be empty.")
+    if not db["techniques"]:
+        # A tarball that fetched fine but produced no data members means the
+        # layout assumptions no longer hold — fall back rather than emit a
+        # silently empty viewer (the per-file path exits loudly on failure).
+        print("  [warn] Tarball contained no data files; falling back to per-file fetching.",
+              file=sys.stderr)
+        return None
 
-    # Fetch citations from .bib/.txt files
-    print("  Fetching citations …")
     citations = {}
-    refs_listing = fetch_json(f"{GITHUB_API_BASE}/data/references")
-    if refs_listing:
-        # Collect citation IDs from filenames
-        cite_ids = set()
-        file_map = {}
-        for f in refs_listing:
-            name = f["name"]
-            if name.startswith("DFCite-") and (name.endswith(".bib") or name.endswith(".txt")):
-                cite_id = name.rsplit(".", 1)[0]
-                cite_ids.add(cite_id)
-                file_map[name] = f
-        for cite_id in sorted(cite_ids):
-            display = ""
-            has_bib = f"{cite_id}.bib" in file_map
-            has_txt = f"{cite_id}.txt" in file_map
-            raw_txt = ""
-            if has_txt:
-                txt_url = f"{GITHUB_RAW_BASE}/data/references/{cite_id}.txt"
-                try:
-                    with urllib.request.urlopen(txt_url) as resp:
-                        raw_txt = resp.read().decode("utf-8").strip()
-                        display = raw_txt
-                except Exception:
-                    pass
-            raw_bib = ""
-            if has_bib:
-                bib_url = f"{GITHUB_RAW_BASE}/data/references/{cite_id}.bib"
-                try:
-                    with urllib.request.urlopen(bib_url) as resp:
-                        raw_bib = resp.read().decode("utf-8").strip()
-                except Exception:
-                    pass
-            citations[cite_id] = {"text": display, "bib": has_bib, "txt": has_txt, "raw_bib": raw_bib, "raw_txt": raw_txt}
+    for cite_id in sorted({name.rsplit(".", 1)[0] for name in cite_files}):
+        raw_txt = cite_files.get(f"{cite_id}.txt", "").strip()
+        raw_bib = cite_files.get(f"{cite_id}.bib", "").strip()
+        citations[cite_id] = {"text": raw_txt, "bib": f"{cite_id}.bib" in cite_files,
+                              "txt": f"{cite_id}.txt" in cite_files,
+                              "raw_bib": raw_bib, "raw_txt": raw_txt}
+    db["citations"] = citations
+    return db
+
+
+def _load_from_github_per_file() -> dict:
+    """Fetch the SOLVE-IT data file by file (fallback for the tarball path)."""
+    db: dict = {"techniques": [], "weaknesses": [], "mitigations": [], "objectives": []}
+
+    # One bounded pool serves all per-file fetches: the workload is pure
+    # network I/O, so issuing requests concurrently collapses hundreds of
+    # sequential round-trips into a few. executor.map preserves order.
+    # 16 workers stays within GitHub's tolerance for unauthenticated
+    # clients, and every fetch carries fetch_url's 15 s timeout, so a stuck
+    # connection can stall its worker but never hang the pool indefinitely.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for category in ("techniques", "weaknesses", "mitigations"):
+            print(f"  Fetching {category} listing …")
+            listing = fetch_json(f"{GITHUB_API_BASE}/data/{category}")
+            if not listing:
+                sys.exit(f"ERROR: Could not list data/{category} from GitHub. "
+                         "Check network access or use --local.")
+            files = [f for f in listing if f["name"].endswith(".json")]
+            print(f"  Found {len(files)} {category} files.")
+            urls = [f"{GITHUB_RAW_BASE}/data/{category}/{f['name']}" for f in files]
+            db[category] = [obj for obj in executor.map(fetch_json, urls) if obj]
+
+        # solve-it.json holds the canonical objectives / tactic ordering
+        print("  Fetching objectives (solve-it.json) …")
+        cfg = fetch_json(f"{GITHUB_RAW_BASE}/data/solve-it.json")
+        if cfg:
+            # solve-it.json may be a bare list or a dict wrapping objectives
+            db["objectives"] = cfg if isinstance(cfg, list) else cfg.get("objectives", [])
+        else:
+            print("  [warn] Could not fetch solve-it.json – objectives will be empty.")
+
+        # Fetch citations from .bib/.txt files
+        print("  Fetching citations …")
+        citations = {}
+        refs_listing = fetch_json(f"{GITHUB_API_BASE}/data/references")
+        if refs_listing:
+            # Collect citation IDs from filenames
+            cite_ids = set()
+            file_map = {}
+            for f in refs_listing:
+                name = f["name"]
+                if name.startswith("DFCite-") and (name.endswith(".bib") or name.endswith(".txt")):
+                    cite_id = name.rsplit(".", 1)[0]
+                    cite_ids.add(cite_id)
+                    file_map[name] = f
+
+            def fetch_citation(cite_id: str) -> dict:
+                has_bib = f"{cite_id}.bib" in file_map
+                has_txt = f"{cite_id}.txt" in file_map
+                raw_txt = ""
+                if has_txt:
+                    raw_txt = (fetch_url(f"{GITHUB_RAW_BASE}/data/references/{cite_id}.txt") or "").strip()
+                raw_bib = ""
+                if has_bib:
+                    raw_bib = (fetch_url(f"{GITHUB_RAW_BASE}/data/references/{cite_id}.bib") or "").strip()
+                return {"text": raw_txt, "bib": has_bib, "txt": has_txt,
+                        "raw_bib": raw_bib, "raw_txt": raw_txt}
+
+            ordered_ids = sorted(cite_ids)
+            citations = dict(zip(ordered_ids, executor.map(fetch_citation, ordered_ids)))
     db["citations"] = citations
+    return db
+
 
+def load_from_github() -> dict:
+    """Fetch all SOLVE-IT data from GitHub."""
+    print("Connecting to GitHub …")
+    db = _load_from_github_tarball()
+    if db is None:
+        db = _load_from_github_per_file()
     print(f"  Loaded: {len(db['techniques'])} techniques, "
           f"{len(db['weaknesses'])} weaknesses, {len(db['mitigations'])} mitigations, "
-          f"{len(db['objectives'])} objectives, {len(citations)} citations.")
+          f"{len(db['objectives'])} objectives, {len(db['citations'])} citations.")
     return db
 
 
 def load_from_local(repo_path: str) -> dict:
-    """Read SOLVE-IT data from a local clone of the repository."""
+    """Read SOLVE-IT data from a local clone of the repository.
+
+    Note: main()'s local path loads through KnowledgeBase (which provides
+    the SOLVE-IT-X extension hooks), so nothing in this repo calls this
+    function any more. It is kept as a standalone, dependency-light loader
+    for scripts that want the raw data dict without a KnowledgeBase — the
+    threading/caching below benefits those callers, not the default CLI
+    path.
+    """
     root = Path(repo_path)
     if not root.exists():
         sys.exit(f"ERROR: Path does not exist: {repo_path}")
 
     db: dict = {"techniques": [], "weaknesses": [], "mitigations": [], "objectives": []}
 
-    for category in ("techniques", "weaknesses", "mitigations"):
-        folder = root / "data" / category
-        if not folder.exists():
-            print(f"  [warn] {folder} not found – skipping.", file=sys.stderr)
-            continue
-        files = list(folder.glob("*.json"))
-        print(f"  Loading {len(files)} {category} from {folder} …")
-        for fp in sorted(files):
-            try:
-                db[category].append(json.loads(fp.read_text(encoding="utf-8")))
-            except Exception as exc:
-                print(f"  [warn] {fp}: {exc}", file=sys.stderr)
+    def _parse_file(fp: Path):
+        # read_bytes + loads(bytes) skips the intermediate str decode
+        try:
+            return _loads(fp.read_bytes())
+        except Exception as exc:
+            print(f"  [warn] {fp}: {exc}", file=sys.stderr)
+            return None
+
+    # Parsed-object cache: unpickling already-built objects beats re-parsing
+    # hundreds of JSON files. Each directory is keyed by its files'
+    # (name, mtime_ns, size) stamps, so any change to any file invalidates
+    # just that category. Written before any enrichment mutates the objects.
+    cache_path = Path.home() / ".cache" / "solve-it" / "kb_cache.pickle"
+    try:
+        cache = pickle.loads(cache_path.read_bytes())
+    except Exception:
+        cache = {}
+    cache_dirty = False
+
+    # Hundreds of small files: the loop is dominated by per-file syscall
+    # latency, so read and parse them through a thread pool (map preserves
+    # the sorted order).
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        for category in ("techniques", "weaknesses", "mitigations"):
+            folder = root / "data" / category
+            if not folder.exists():
+                print(f"  [warn] {folder} not found – skipping.", file=sys.stderr)
+                continue
+            # scandir hands back name + cached stat per entry in one sweep,
+            # without a Path object or an extra stat() syscall per file
+            with os.scandir(folder) as it:
+                dir_entries = sorted((e for e in it if e.name.endswith(".json") and e.is_file()),
+                                     key=lambda e: e.name)
+            stamp = tuple((e.name, e.stat().st_mtime_ns, e.stat().st_size) for e in dir_entries)
+            cache_key = str(folder.resolve())
+            entry = cache.get(cache_key)
+            if entry and entry[0] == stamp:
+                print(f"  Loading {len(entry[1])} {category} from cache …")
+                db[category] = entry[1]
+                continue
+            print(f"  Loading {len(dir_entries)} {category} from {folder} …")
+            db[category] = [obj for obj in executor.map(_parse_file, (Path(e.path) for e in dir_entries))
+                            if obj is not None]
+            cache[cache_key] = (stamp, db[category])
+            cache_dirty = True
+
+    if cache_dirty:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as exc:
+            print(f"  [warn] Could not write KB cache: {exc}", file=sys.stderr)
 
     cfg_path = root / "data" / "solve-it.json"
     if not cfg_path.exists():
         cfg_path = root / "solve-it.json"  # fallback for older layouts
     if cfg_path.exists():
         try:
-            cfg = json.loads(cfg_path.read_text(encoding="utf-8"))
+            cfg = _loads(cfg_path.read_bytes())
             # solve-it.json may be a bare list of objectives, or a dict wrapping them
             db["objectives"] = cfg if isinstance(cfg, list) else cfg.get("objectives", [])
         except Exception as exc:
@@ -416,10 +602,54 @@ def extract_git_credits(repo_root: Path) -> dict:
     return credits
 
 
+def cached_git_credits(repo_root: Path) -> dict:
+    """extract_git_credits with a disk cache keyed by the current HEAD.
+
+    The full-history git log walks dominate regeneration time, but their
+    result only changes when history does — so a cached extraction for the
+    same HEAD is reused. Credits come purely from git log, making the HEAD
+    SHA a complete cache key. Falls back to a fresh extraction whenever HEAD
+    can't be resolved or the cache is unreadable.
+    """
+    head = None
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, cwd=str(repo_root), timeout=10,
+        )
+        if result.returncode == 0:
+            head = result.stdout.strip()
+    except Exception:
+        pass
+
+    cache_path = repo_root / ".git" / "solveit_credits.json"
+    if head:
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("head") == head:
+                print("  Git credits: reusing cached extraction for current HEAD.")
+                return cached["credits"]
+        except Exception:
+            pass
+
+    credits = extract_git_credits(repo_root)
+    if head:
+        try:
+            cache_path.write_text(json.dumps({"head": head, "credits": credits}),
+                                  encoding="utf-8")
+        except Exception as exc:
+            print(f"  [warn] Could not write credits cache: {exc}", file=sys.stderr)
+    return credits
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Pre-processing / cross-referencing
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Shared immutable default for absent list fields — avoids allocating a
+# fresh empty list per miss in the hot loops below
+_EMPTY: tuple = ()
+
 WEAKNESS_CATS = ["ASTM_INCOMP", "ASTM_INAC_EX", "ASTM_INAC_AS", "ASTM_INAC_ALT", "ASTM_INAC_COR", "ASTM_MISINT"]
 CAT_LABELS = {
     "ASTM_INCOMP":    "Incomplete (INCOMP)",
@@ -434,44 +664,161 @@ CAT_LABELS = {
 def build_indices(db: dict, kb=None) -> dict:
     """Build lookup dicts and reverse maps."""
     idx: dict = {}
+    weaknesses_by_id   = {w["id"]: w for w in db["weaknesses"]}
     idx["techniques"]  = {t["id"]: t for t in db["techniques"]}
-    idx["weaknesses"]  = {w["id"]: w for w in db["weaknesses"]}
+    idx["weaknesses"]  = weaknesses_by_id
     idx["mitigations"] = {m["id"]: m for m in db["mitigations"]}
 
-    # weakness → list[technique_id]
-    w2t: dict = {}
-    for t in db["techniques"]:
-        for wid in (t.get("weaknesses") or []):
-            w2t.setdefault(wid, []).append(t["id"])
-    idx["weakness_to_techniques"] = w2t
+    # Mitigation count per weakness, computed once — the status computation
+    # below otherwise re-walks the weakness dict per technique
+    wid_to_mitcount = {wid: len(w.get("mitigations") or _EMPTY)
+                       for wid, w in weaknesses_by_id.items()}
 
-    # mitigation → list[weakness_id]
-    m2w: dict = {}
-    for w in db["weaknesses"]:
-        for mid in (w.get("mitigations") or []):
-            m2w.setdefault(mid, []).append(w["id"])
-    idx["mitigation_to_weaknesses"] = m2w
+    # Check if global_config provides a custom status function
+    use_config_status = (kb is not None and kb.global_config
+                         and hasattr(kb.global_config, 'get_status_for_technique'))
 
-    # Compute status for each technique if not already present
+    # Single pass over techniques: accumulate the weakness → technique
+    # reverse map and fill in missing statuses together
+    w2t: dict = {}
+    w2t_setdefault = w2t.setdefault
     for t in db["techniques"]:
+        tid = t["id"]
+        wlist = t.get("weaknesses") or _EMPTY
+        for wid in wlist:
+            w2t_setdefault(wid, []).append(tid)
         if "status" not in t:
-            # Check if global_config provides a custom status function
-            if kb is not None and kb.global_config and hasattr(kb.global_config, 'get_status_for_technique'):
-                t["status"] = kb.global_config.get_status_for_technique(kb, t["id"])
+            if use_config_status:
+                t["status"] = kb.global_config.get_status_for_technique(kb, tid)
             else:
                 has_desc = bool((t.get("description") or "").strip())
-                num_weak = len(t.get("weaknesses") or [])
-                num_mit  = sum(
-                    len(idx["weaknesses"][wid].get("mitigations") or [])
-                    for wid in (t.get("weaknesses") or [])
-                    if wid in idx["weaknesses"]
-                )
-                if num_weak == 0:
+                num_mit  = sum(wid_to_mitcount.get(wid, 0) for wid in wlist)
+                if not wlist:
                     t["status"] = "placeholder"
                 elif not has_desc or num_mit == 0:
                     t["status"] = "partial"
                 else:
                     t["status"] = "complete"
+        elif isinstance(t["status"], str):
+            # Statuses from the data files are parse-fresh strings; intern
+            # them so every technique shares the three canonical objects
+            t["status"] = sys.intern(t["status"])
+    idx["weakness_to_techniques"] = w2t
+
+    # mitigation → list[weakness_id]
+    m2w: dict = {}
+    m2w_setdefault = m2w.setdefault
+    for w in db["weaknesses"]:
+        wid = w["id"]
+        for mid in (w.get("mitigations") or _EMPTY):
+            m2w_setdefault(mid, []).append(wid)
+    idx["mitigation_to_weaknesses"] = m2w
+
+    # Integer-indexed CSR encodings of the two reverse maps (positions into
+    # the id-sorted item lists). The viewer's startup enrichment walks these
+    # flat arrays instead of allocating a string Set per mitigation.
+    t_pos = {t["id"]: i for i, t in enumerate(db["techniques"])}
+    w_pos = {w["id"]: i for i, w in enumerate(db["weaknesses"])}
+
+    w2t_ptr, w2t_idx = [0], []
+    for w in db["weaknesses"]:
+        w2t_idx.extend(t_pos[tid] for tid in w2t.get(w["id"], []) if tid in t_pos)
+        w2t_ptr.append(len(w2t_idx))
+
+    m2w_ptr, m2w_idx, mit_ids = [0], [], []
+    for m in db["mitigations"]:
+        mit_ids.append(m["id"])
+        m2w_idx.extend(w_pos[wid] for wid in m2w.get(m["id"], []) if wid in w_pos)
+        m2w_ptr.append(len(m2w_idx))
+
+    idx["csr"] = {"mit_ids": mit_ids,
+                  "m2w_ptr": m2w_ptr, "m2w_idx": m2w_idx,
+                  "w2t_ptr": w2t_ptr, "w2t_idx": w2t_idx}
+
+    # Reference → citing-items reverse index, mirroring exactly what the
+    # viewer's getRefIndex used to derive by scanning the full DB at runtime.
+    # Keys are DFCite ids (or the trimmed citation text for plain-string
+    # references), emitted in alphabetical order so the viewer can rely on
+    # the entry order for its A–Z listing.
+    citations = db.get("citations") or {}
+    ref_index: dict = {}
+    ref_has_summary: dict = {}
+    for plural, items in (("techniques", db["techniques"]),
+                          ("weaknesses", db["weaknesses"]),
+                          ("mitigations", db["mitigations"])):
+        for item in items:
+            for r in (item.get("references") or _EMPTY):
+                if isinstance(r, dict) and r.get("DFCite_id"):
+                    cite_id = r["DFCite_id"]
+                    cite = citations.get(cite_id)
+                    text = (cite.get("text") or cite_id) if cite else cite_id
+                    relevance = r.get("relevance_summary_280") or ""
+                    key = cite_id
+                else:
+                    text = str(r)
+                    relevance = ""
+                    cite_id = ""
+                    key = text.strip()
+                if not key or key.lower() == "todo":
+                    continue
+                entry = ref_index.setdefault(
+                    key, {"text": text.strip(), "citeId": cite_id,
+                          "techniques": [], "weaknesses": [], "mitigations": []})
+                if item["id"] not in entry[plural]:
+                    entry[plural].append(item["id"])
+                if relevance:
+                    ref_has_summary.setdefault(key, {})[f"{plural}:{item['id']}"] = True
+    idx["ref_index"] = {key: ref_index[key] for key in sorted(ref_index)}
+    idx["ref_has_summary"] = ref_has_summary
+
+    # Numeric row metadata the viewer reads constantly: mitigation count
+    # per weakness and subtechnique count per technique
+    for w in db["weaknesses"]:
+        w["_mitCount"] = len(w.get("mitigations") or _EMPTY)
+    for t in db["techniques"]:
+        t["_subCount"] = len(t.get("subtechniques") or _EMPTY)
+
+    # Category bitmask per weakness (bit i set when the weakness carries
+    # WEAKNESS_CATS[i]) so the viewer's category filter is a single AND
+    # instead of a per-item Set probe over the category list.
+    for w in db["weaknesses"]:
+        cats = set(w.get("categories") or _EMPTY)
+        w["_catMask"] = sum(1 << i for i, c in enumerate(WEAKNESS_CATS) if c in cats)
+
+    # Numeric sort ranks for the technique table's string columns. The sort
+    # order is fixed at generation time, so comparing precomputed ints in JS
+    # replaces a localeCompare call per comparison. Name-based keys are
+    # lowercased to match the case-insensitive ordering every other name
+    # sort uses (_nameLC / cmpName).
+    t2obj_name: dict = {}
+    for obj in db["objectives"]:
+        for tid in (obj.get("techniques") or _EMPTY):
+            t2obj_name[tid] = (obj.get("name") or "").lower()
+    # Sub-techniques deliberately inherit their parent's objective name,
+    # mirroring the viewer's T2Obj inheritance: the Objective column renders
+    # the inherited name for them too, so the rank orders rows exactly as
+    # the column displays (and as the baseline T2Obj-based comparator did).
+    for t in db["techniques"]:
+        if t["id"] in t2obj_name:
+            for sid in (t.get("subtechniques") or _EMPTY):
+                t2obj_name.setdefault(sid, t2obj_name[t["id"]])
+
+    def _rank(key_fn) -> dict:
+        return {t["id"]: i for i, t in enumerate(sorted(db["techniques"], key=key_fn))}
+
+    idx["rank_t_id"]     = _rank(lambda t: t["id"])
+    idx["rank_t_name"]   = _rank(lambda t: (t.get("name") or "").lower())
+    idx["rank_t_obj"]    = _rank(lambda t: t2obj_name.get(t["id"], ""))
+    idx["rank_t_status"] = _rank(lambda t: t.get("status", "placeholder"))
+
+    # Per-objective technique orderings (by technique name, case-insensitive
+    # to match the viewer's cmpName ordering) are fixed at generation time;
+    # precompute them so the matrix build doesn't sort each column at runtime.
+    tech_names = {t["id"]: (t.get("name") or "").lower() for t in db["techniques"]}
+    idx["objectives_sorted_tids"] = [
+        sorted((obj.get("techniques") or _EMPTY), key=lambda tid: tech_names.get(tid, ""))
+        for obj in db["objectives"]
+    ]
 
     return idx
 
@@ -480,14 +827,17 @@ def build_indices(db: dict, kb=None) -> dict:
 # HTML generation helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+@functools.lru_cache(maxsize=None)
 def esc(text: str) -> str:
-    if not text:
-        return ""
-    return (text
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;"))
+    # Cached: ids, names and labels get escaped repeatedly across the
+    # prerendered matrix and template fragments, and the input set is
+    # bounded by the KB's contents. translate() does one pass instead of
+    # four chained replace() scans.
+    return text.translate(_ESC_TABLE) if text else ""
+
 
 
 def technique_status_class(status: str) -> str:
@@ -496,12 +846,85 @@ def technique_status_class(status: str) -> str:
 
 
 def weakness_cats(w: dict) -> list[str]:
+    # Category *membership* is bit-set encoded for the viewer (_catMask,
+    # built in build_indices); this helper only materialises the name list
+    # and has no hot callers on the Python side.
     return w.get("categories", [])
 
 
+def prerender_matrix(db: dict, idx: dict, status_labels: dict, status_colours: dict) -> str:
+    """Render the matrix columns/cells as static HTML for the default view.
+
+    The markup must match what the viewer's buildMatrix() produces — the JS
+    hydrates listeners onto these nodes and the same update pass fills in
+    counts and visibility. First paint then needs no JS DOM construction.
+    """
+    tmap = {t["id"]: t for t in db["techniques"]}
+
+    def cell_html(t: dict, is_sub: bool) -> str:
+        st = t.get("status") or "placeholder"
+        cls = technique_status_class(st)
+        title = esc(f"{t['id']} — {t.get('name', '')} ({status_labels.get(st, st)})")
+        if is_sub:
+            return (f'<div class="tech-cell sub-cell {cls}" data-id="{esc(t["id"])}" title="{title}">'
+                    f'<div class="tech-cell-id">{esc(t["id"])}</div>'
+                    f'<div class="tech-cell-name">{esc(t.get("name", ""))}</div>'
+                    f'</div>')
+        style = ""
+        bg = t.get("_bg_colour")
+        if bg and bg != status_colours.get(st, {}).get("bg"):
+            style = f' style="border-left-color:{esc(bg)}"'
+        pfx = esc(t.get("_prefix") or "")
+        sfx = esc(t.get("_suffix") or "")
+        ext_sfx = t.get("_extension_suffix") or ""  # raw HTML, as in the JS
+        subs = len(t.get("subtechniques") or _EMPTY)
+        parts = [
+            f'<div class="tech-cell {cls}" data-id="{esc(t["id"])}" title="{title}" draggable="true"{style}>',
+            f'<div class="tech-cell-id">{esc(t["id"])}</div>',
+            f'<div class="tech-cell-name">{pfx}{esc(t.get("name", ""))}{sfx}</div>',
+        ]
+        if ext_sfx:
+            parts.append(f'<div style="font-size:.68rem;color:var(--gray-500);margin-top:2px">{ext_sfx}</div>')
+        if subs:
+            parts.append(f'<div class="tech-cell-sub">+ {subs} sub-technique{"s" if subs > 1 else ""}</div>')
+        parts.append('</div>')
+        return "".join(parts)
+
+    total_objs = len(db["objectives"])
+    col_max_width = f"{100 / total_objs}%" if total_objs else "none"
+    cols = []
+    for i, obj in enumerate(db["objectives"]):
+        cells = []
+        for tid in idx["objectives_sorted_tids"][i]:
+            t = tmap.get(tid)
+            if not t:
+                continue
+            cells.append(cell_html(t, False))
+            for sid in (t.get("subtechniques") or _EMPTY):
+                sub = tmap.get(sid)
+                if sub:
+                    cells.append(cell_html(sub, True))
+        cols.append(
+            f'<div class="tactic-col" style="max-width:{col_max_width};animation-delay:{i * 0.025}s">'
+            f'<div class="tactic-header" title="{esc(obj.get("description") or obj.get("name", ""))}">'
+            f'<span class="tactic-id">{esc(obj.get("id") or "")}</span>'
+            f'<span>{esc(obj.get("name", ""))}</span>'
+            f'<span class="tcount"></span>'
+            f'</div>'
+            f'<div class="tactic-cells">{"".join(cells)}</div>'
+            f'</div>'
+        )
+    return "".join(cols)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main HTML generator
 # ─────────────────────────────────────────────────────────────────────────────
+# The page template below is deliberately one f-string: it is evaluated once
+# per run, so swapping it for a precompiled string.Template would trade the
+# readability of inline expressions (and churn every {{ }} escape) for a
+# constant-factor saving on a single call. If generate_html ever becomes
+# render-many (e.g. a watch mode), revisit.
 
 def generate_html(db: dict, idx: dict, custom: bool = False, kb=None, source_date: str | None = None) -> str:
     # ── Enrich data with SOLVE-IT-X extension content ─────────────────
@@ -540,7 +963,7 @@ def generate_html(db: dict, idx: dict, custom: bool = False, kb=None, source_dat
                       'examples', 'CASE_input_classes', 'CASE_output_classes', 'weaknesses', 'references',
                       'properties', 'contributors', 'reviewers']
         hidden = [f for f in all_fields if not kb.should_display_field(f)]
-        hidden_fields_json = json.dumps(hidden)
+        hidden_fields_json = _dumps(hidden)
 
         # Status labels and colours from global_solveit_config
         status_labels = {"complete": "stable", "partial": "partial", "placeholder": "placeholder"}
@@ -563,12 +986,24 @@ def generate_html(db: dict, idx: dict, custom: bool = False, kb=None, source_dat
         }
 
     generated_at = source_date or datetime.now().strftime("%Y-%m-%d")
-    # Sanitise </script> sequences to prevent early tag closure when embedded in HTML
-    data_json    = json.dumps(db, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
-    idx_json     = json.dumps({
+    # The weakness category arrays are fully encoded by the _catMask bit-set
+    # (the vocabulary is exactly WEAKNESS_CATS), so the payload drops the
+    # repeated strings and the viewer rebuilds the arrays from the mask.
+    for w in db["weaknesses"]:
+        w.pop("categories", None)
+    data_json    = _embed_json(db)
+    idx_json     = _embed_json({
         "weakness_to_techniques":  idx["weakness_to_techniques"],
         "mitigation_to_weaknesses": idx["mitigation_to_weaknesses"],
-    }, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+        "rank_t_id":     idx["rank_t_id"],
+        "rank_t_name":   idx["rank_t_name"],
+        "rank_t_obj":    idx["rank_t_obj"],
+        "rank_t_status": idx["rank_t_status"],
+        "objectives_sorted_tids": idx["objectives_sorted_tids"],
+        "csr": idx["csr"],
+        "ref_index": idx["ref_index"],
+        "ref_has_summary": idx["ref_has_summary"],
+    })
 
     page_title = "SOLVE-IT-X: Custom View" if custom else "SOLVE-IT: the digital forensics knowledge base"
     brand_name = "SOLVE-IT-X: Custom View" if custom else "SOLVE-IT"
@@ -594,27 +1029,44 @@ def generate_html(db: dict, idx: dict, custom: bool = False, kb=None, source_dat
     colour_red_border = status_colours["placeholder"]["border"]
     extension_main_html_escaped = extension_main_html.replace("{", "{{").replace("}", "}}") if extension_main_html else ""
 
+    # Prerendered matrix markup for the default view; the JS hydrates
+    # listeners onto it instead of constructing the DOM at load.
+    matrix_html = prerender_matrix(db, idx, status_labels, status_colours)
+
+    # Objective dropdown options, pre-rendered so the viewer doesn't build
+    # them element-by-element at startup
+    obj_option_html = "".join(
+        f'<option value="{i}">{i + 1}. {esc(obj.get("name", ""))}</option>'
+        for i, obj in enumerate(db["objectives"])
+    )
+
     n_t = len(db["techniques"])
     n_w = len(db["weaknesses"])
     n_m = len(db["mitigations"])
     n_o = len(db["objectives"])
 
-    # Status counts
-    statuses = [t.get("status", "placeholder") for t in db["techniques"]]
-    # Unique non-trivial references across all item types
+    # One fused traversal: status tallies (techniques only) and the unique
+    # non-trivial reference set across all item types
+    status_counts: Counter = Counter()
     _all_refs: set = set()
-    for _items in (db["techniques"], db["weaknesses"], db["mitigations"]):
-        for _item in _items:
-            for _r in (_item.get("references") or []):
-                if isinstance(_r, dict) and "DFCite_id" in _r:
-                    _all_refs.add(_r["DFCite_id"])
-                elif isinstance(_r, str) and _r.strip() and _r.strip().lower() != "todo":
-                    _all_refs.add(_r.strip())
+    for _cat in ("techniques", "weaknesses", "mitigations"):
+        _is_tech = _cat == "techniques"
+        for _item in db[_cat]:
+            if _is_tech:
+                status_counts[_item.get("status", "placeholder")] += 1
+            for _r in (_item.get("references") or _EMPTY):
+                if isinstance(_r, dict):
+                    if "DFCite_id" in _r:
+                        _all_refs.add(_r["DFCite_id"])
+                elif isinstance(_r, str):
+                    _stripped = _r.strip()
+                    if _stripped and _stripped.lower() != "todo":
+                        _all_refs.add(_stripped)
     n_r = len(_all_refs)
 
-    n_complete    = statuses.count("complete")
-    n_partial     = statuses.count("partial")
-    n_placeholder = statuses.count("placeholder")
+    n_complete    = status_counts["complete"]
+    n_partial     = status_counts["partial"]
+    n_placeholder = status_counts["placeholder"]
 
     return f"""<!DOCTYPE html>
 <html lang="en">
@@ -1082,6 +1534,9 @@ body.custom-mode .disabled-btn {{
   border-right: 1px solid var(--gray-300);
   animation: fadeUp .25s ease forwards;
   opacity: 0;
+  /* Let the browser skip layout+paint of columns scrolled out of view */
+  content-visibility: auto;
+  contain-intrinsic-size: 160px 600px;
 }}
 .tactic-col:last-child {{ border-right: none; }}
 
@@ -1141,6 +1596,7 @@ body.custom-mode .disabled-btn {{
   cursor: pointer;
   transition: background .1s;
   position: relative;
+  contain: layout paint style;
 }}
 .tech-cell:active {{ cursor: grabbing; }}
 .tech-cell:last-child {{ border-bottom: none; }}
@@ -1273,9 +1729,15 @@ body.custom-mode .disabled-btn {{
   vertical-align: top;
 }}
 .attck-table tr:last-child td {{ border-bottom: none; }}
+/* Spacer rows used by the windowed table renderer */
+.attck-table tbody tr.vspacer {{ cursor: default; }}
+.attck-table tbody tr.vspacer:hover {{ background: transparent; }}
+.attck-table tr.vspacer td {{ padding: 0; border: 0; }}
 .attck-table tbody tr {{ transition: background var(--transition); cursor: pointer; }}
 .attck-table tbody tr:hover {{ background: var(--blue-pale); }}
 .attck-table tbody tr[draggable="true"]:active {{ cursor: grabbing; }}
+/* Shared numeric-cell styling; replaces the inline style every row repeated */
+.attck-table td.col-num {{ text-align: center; font-family: var(--font-mono); font-size: .8rem; }}
 .attck-table tbody tr.selected {{ background: var(--blue-pale); }}
 
 .tid  {{ font-family: var(--font-mono); color: var(--blue); font-weight: 600; white-space: nowrap; font-size: .8rem; }}
@@ -1330,6 +1792,9 @@ body.custom-mode .disabled-btn {{
   overflow: hidden;
   visibility: hidden;
 }}
+/* A closed panel is invisible and off-screen; strict containment lets the
+   browser drop it from layout entirely. */
+.detail-panel:not(.open) {{ contain: strict; }}
 .detail-panel.open {{ right: 0; box-shadow: var(--shadow-lg); visibility: visible; transition-delay: 0s; }}
 
 /* Expanded (slide-screenshot) mode: wider panel with grid layout */
@@ -1758,6 +2223,9 @@ body.custom-mode .disabled-btn {{
 .detail-section {{
   padding: 16px 18px;
   border-bottom: 1px solid var(--gray-100);
+  /* Long detail panels scroll; let the browser skip sections below the fold */
+  content-visibility: auto;
+  contain-intrinsic-size: auto 120px;
 }}
 .detail-section:last-child {{ border-bottom: none; }}
 .detail-section-title {{
@@ -2322,6 +2790,7 @@ tr[data-show-type="reference"].selected {{ background: var(--blue-pale); }}
     <span class="filterbar-label" id="t2-obj-label">Objective</span>
     <select id="t2-obj-filter" style="font-size:.8rem;padding:3px 8px;border:1px solid var(--gray-300);border-radius:6px;background:#fff;color:var(--gray-800);max-width:260px;">
       <option value="all" id="t2-obj-all-option">All objectives</option>
+      {obj_option_html}
     </select>
     <div class="filterbar-sep"></div>
     <span class="result-count" id="t2-count"></span>
@@ -2372,7 +2841,7 @@ tr[data-show-type="reference"].selected {{ background: var(--blue-pale); }}
     <div id="view-matrix" class="view">
       {extension_main_html_escaped}
       <div class="matrix-container">
-        <div class="matrix" id="matrix"></div>
+        <div class="matrix" id="matrix">{matrix_html}</div>
       </div>
     </div>
 
@@ -2451,12 +2920,39 @@ const STATUS_BG_COLOURS = {{complete:'{colour_green_bg}', partial:'{colour_yello
 // Expose on window for programmatic / console access
 window.DB = DB; window.IDX = IDX;
 
+// Cached handles for the static elements the hot paths look up repeatedly
+const byId = document.getElementById.bind(document);
+const EL = {{
+  panel: byId('detailPanel'),
+  mainArea: byId('mainArea'),
+  body: byId('dp-body'),
+  dpId: byId('dp-id'),
+  dpName: byId('dp-name'),
+  dpObjective: byId('dp-objective'),
+  dpOrigObjective: byId('dp-original-objective'),
+  dpBack: byId('dpBack'),
+  dpExpand: byId('dpExpand'),
+  dpPresent: byId('dpPresent'),
+  dpDrag: byId('dpDrag'),
+  burgerMenu: byId('burgerMenu'),
+  burgerLabel: byId('burgerLabel'),
+  matrix: byId('matrix'),
+}};
+
 // ── Build lookup maps ────────────────────────────────────────────────
 const TMap = Object.fromEntries(DB.techniques.map(t  => [t.id,  t]));
 const WMap = Object.fromEntries(DB.weaknesses.map(w  => [w.id,  w]));
 const MMap = Object.fromEntries(DB.mitigations.map(m => [m.id, m]));
 const CiteMap = DB.citations || {{}};
 
+// Lowercased name cache so name comparators use a plain compare instead of
+// a locale-aware localeCompare per call (needed eagerly: cmpName is bound
+// from it at load). The heavier per-item search/escape caches are built in
+// ensureEnriched(), off the first-paint path.
+for (const _list of [DB.techniques, DB.weaknesses, DB.mitigations]) {{
+  _list.forEach(o => {{ o._nameLC = (o.name || '').toLowerCase(); }});
+}}
+
 function citeText(citeId) {{
   const c = CiteMap[citeId];
   return c ? (c.text || citeId) : citeId;
@@ -2489,14 +2985,14 @@ function resolveRef(ref) {{
 
 function renderRef(ref, itemType, itemId) {{
   const r = resolveRef(ref);
-  const clickable = r.citeId ? ` data-show-id="${{esc(r.citeId)}}" data-show-type="reference" style="cursor:pointer"` : '';
+  const clickable = r.citeId ? ` data-show-id="${{escId(r.citeId)}}" data-show-type="reference" style="cursor:pointer"` : '';
   let html = `<div class="ref-item"${{clickable}}>${{linkify(r.text)}}`;
   if (r.citeId) {{
-    html += ` <span style="font-size:.72rem;color:#a78bfa;font-family:var(--font-mono)">[` + esc(r.citeId) + `]</span>`;
+    html += ` <span style="font-size:.72rem;color:#a78bfa;font-family:var(--font-mono)">[` + escId(r.citeId) + `]</span>`;
     const cite = CiteMap[r.citeId];
     if (cite) {{
-      html += `<span class="copy-cite" title="Copy citation text" onclick="copyCite('${{esc(r.citeId)}}','txt');event.stopPropagation()">&#128203;</span>`;
-      if (cite.bib) html += `<span class="copy-cite" title="Copy BibTeX" onclick="copyCite('${{esc(r.citeId)}}','bib');event.stopPropagation()">&#128218;</span>`;
+      html += `<span class="copy-cite" title="Copy citation text" onclick="copyCite('${{escId(r.citeId)}}','txt');event.stopPropagation()">&#128203;</span>`;
+      if (cite.bib) html += `<span class="copy-cite" title="Copy BibTeX" onclick="copyCite('${{escId(r.citeId)}}','bib');event.stopPropagation()">&#128218;</span>`;
     }}
   }}
   const editIcon = (!CUSTOM_MODE && itemType && itemId && r.citeId)
@@ -2584,19 +3080,74 @@ function extractShortCite(plain) {{
   return `(${{firstAuthor}}, ${{year}})`;
 }}
 
-// Compute mitigation enrichment
-DB.mitigations.forEach(m => {{
-  const wids  = IDX.mitigation_to_weaknesses[m.id] || [];
-  m._wcount   = wids.length;
-  const tset  = new Set();
-  wids.forEach(wid => (IDX.weakness_to_techniques[wid] || []).forEach(tid => tset.add(tid)));
-  m._tcount   = tset.size;
-}});
+// Deferred startup enrichment: the mitigation weakness/technique counts and
+// the per-person stats below are only needed by the mitigations view and the
+// credit popups, not by the first matrix paint. A Web Worker doesn't fit a
+// single self-contained file, so instead the work runs at idle (or on first
+// use via ensureEnriched()) to keep the main thread free during load.
+let _enriched = false;
+function ensureEnriched() {{
+  if (_enriched) return;
+  _enriched = true;
+  // Per-item caches: one lowercased search blob (so the search predicate is
+  // a single indexOf per item, with the query lowercased once per input in
+  // S.searchLC) and escaped id/name for the row builders. The blobs are
+  // deliberately built here rather than emitted from Python — serialized
+  // they would largely duplicate the descriptions already in the payload.
+  for (const list of [DB.techniques, DB.weaknesses, DB.mitigations]) {{
+    list.forEach(o => {{
+      o._search = ((o.id || '') + ' ' + (o.name || '') + ' ' + (o.description || '')).toLowerCase();
+      o._idEsc = esc(o.id || '');
+      o._nameEsc = esc(o.name || '');
+    }});
+  }}
+  DB.weaknesses.forEach(w => {{
+    w._hasMit = w._mitCount > 0;
+    w._tids = IDX.weakness_to_techniques[w.id] || [];
+  }});
+  buildGramIndex();
+  // Mitigation enrichment: _wcount/_tcount are locked in here, once — the
+  // mitigations table sort comparators only ever read these primitives.
+  // The counts come from walking the integer CSR edge arrays (mitigation →
+  // weakness → technique) with a stamped scratch array — no string Sets.
+  const csr = IDX.csr;
+  const seen = new Int32Array(DB.techniques.length);
+  let stamp = 0;
+  csr.mit_ids.forEach((mid, m) => {{
+    const mObj = MMap[mid];
+    if (!mObj) return;
+    mObj._wids = IDX.mitigation_to_weaknesses[mid] || [];
+    mObj._wcount = csr.m2w_ptr[m + 1] - csr.m2w_ptr[m];
+    stamp++;
+    const applies = [];
+    for (let p = csr.m2w_ptr[m]; p < csr.m2w_ptr[m + 1]; p++) {{
+      const w = csr.m2w_idx[p];
+      for (let q = csr.w2t_ptr[w]; q < csr.w2t_ptr[w + 1]; q++) {{
+        const t = csr.w2t_idx[q];
+        if (seen[t] !== stamp) {{ seen[t] = stamp; applies.push(DB.techniques[t].id); }}
+      }}
+    }}
+    mObj._tcount = applies.length;
+    mObj._applies_to = applies;  // deduped technique ids, reused by the detail panel
+  }});
+  // Per-person stats come pre-aggregated from Python (db.credits); just
+  // reshape into the compact popup form instead of re-walking every item's
+  // contributor/reviewer lists
+  Object.entries(DB.credits || {{}}).forEach(([name, c]) => {{
+    PersonStats[name] = {{
+      tc: c.techniques.contributed,  wc: c.weaknesses.contributed,  mc: c.mitigations.contributed,
+      tr: c.techniques.reviewed,     wr: c.weaknesses.reviewed,     mr: c.mitigations.reviewed,
+    }};
+  }});
+}}
 
 // Build technique-to-objective map and enrichment
 const T2Obj = {{}};
 DB.objectives.forEach((obj, idx) => {{
   obj._idx = idx;
+  // Name-sorted column ordering computed at generation time; custom-schema
+  // objectives lack this and fall back to a runtime sort in buildMatrix.
+  obj._sortedTids = (IDX.objectives_sorted_tids || [])[idx];
   (obj.techniques || []).forEach(tid => {{ T2Obj[tid] = obj; }});
 }});
 DB.techniques.forEach(t => {{
@@ -2613,40 +3164,43 @@ DB.techniques.forEach(t => {{
   }});
 }});
 
+// Precomputed filter keys for the techniques table (objective index and
+// type label), so the filter predicate compares primitives instead of
+// chasing T2Obj and subtechnique arrays per item per render. Recomputed
+// whenever T2Obj is rebuilt (custom schema upload/reset).
+function computeTechFilterKeys() {{
+  DB.techniques.forEach(t => {{
+    const obj = T2Obj[t.id];
+    t._objIdx = obj ? String(obj._idx) : null;
+    t._type = t._isSub ? 'sub' : t._subCount ? 'parent' : 'standalone';
+  }});
+}}
+computeTechFilterKeys();
+
 // Original technique-to-objective map (preserved for custom mode)
 const ORIGINAL_T2Obj = {{}};
 Object.keys(T2Obj).forEach(k => {{ ORIGINAL_T2Obj[k] = T2Obj[k]; }});
 
 // ── Person stats lookup ──────────────────────────────────────────────
+// Populated in ensureEnriched() from the aggregation Python already emits
+// as db.credits
 const PersonStats = {{}};
-function _addPersonStats(items, category) {{
-  items.forEach(item => {{
-    (item._contributors || []).forEach(name => {{
-      if (!PersonStats[name]) PersonStats[name] = {{tc:0,wc:0,mc:0,tr:0,wr:0,mr:0}};
-      PersonStats[name][category[0]+'c']++;
-    }});
-    (item._reviewers || []).forEach(name => {{
-      if (!PersonStats[name]) PersonStats[name] = {{tc:0,wc:0,mc:0,tr:0,wr:0,mr:0}};
-      PersonStats[name][category[0]+'r']++;
-    }});
-  }});
-}}
-_addPersonStats(DB.techniques, 'techniques');
-_addPersonStats(DB.weaknesses, 'weaknesses');
-_addPersonStats(DB.mitigations, 'mitigations');
+(window.requestIdleCallback || window.setTimeout)(ensureEnriched);
 
 // ── State ────────────────────────────────────────────────────────────
 const detailHistory = [];
 const S = {{
   view:    'matrix',
   search:  '',
+  searchLC: '',  // lowercased once per input, not per item
+  searchSet: null,  // matching-item set from the gram index (null = linear scan)
   tf:      'all',   // matrix status filter
   t2f:     'all',   // technique table status filter
   t2o:     'all',   // technique table objective filter
   t2t:     'all',   // technique table type filter
   ts:      'id',    // technique table sort column
   tsDir:   1,       // technique table sort direction
-  wf:      new Set(['ASTM_INCOMP','ASTM_INAC_EX','ASTM_INAC_AS','ASTM_INAC_ALT','ASTM_INAC_COR','ASTM_MISINT']),   // weakness category filter
+  wfMask:  63,      // weakness category filter as a bitmask over CATS (all set)
   mf:      'all',   // mitigation filter (has/none)
   ws:      'id',    // weakness sort column
   wsDir:   1,       // weakness sort direction (1=asc, -1=desc)
@@ -2668,7 +3222,31 @@ function esc(s) {{
     .replace(/&/g,'&amp;').replace(/</g,'&lt;')
     .replace(/>/g,'&gt;').replace(/"/g,'&quot;');
 }}
+// Ids are plain identifier characters in practice; skip the escape scan
+// for those and fall back to esc() for anything unusual.
+const ID_SAFE = /^[A-Za-z0-9_.:-]*$/;
+function escId(s) {{ return ID_SAFE.test(s) ? s : esc(s); }}
+
+// Plain ordinal compare — the IDs and names here are effectively ASCII, and
+// localeCompare pays for an ICU collator lookup on every call.
+const cmpAscii = (a,b) => a < b ? -1 : a > b ? 1 : 0;
+// One shared collator for the rare case where item names leave ASCII and
+// genuinely need locale ordering; localeCompare may build a collator per call.
+const COLLATOR = new Intl.Collator('en', {{sensitivity: 'base'}});
+// Picked at load: ordinal compare when every name is ASCII, collator otherwise.
+const cmpName = [DB.techniques, DB.weaknesses, DB.mitigations]
+  .every(list => list.every(o => !/[^\x00-\x7f]/.test(o._nameLC)))
+  ? cmpAscii : COLLATOR.compare;
+
 const CATS = ['ASTM_INCOMP','ASTM_INAC_EX','ASTM_INAC_AS','ASTM_INAC_ALT','ASTM_INAC_COR','ASTM_MISINT'];
+const CAT_BIT = Object.fromEntries(CATS.map((c, i) => [c, 1 << i]));
+const ALL_CAT_MASK = (1 << CATS.length) - 1;
+
+// Weakness categories ship interned as the _catMask bit-set; rebuild the
+// name arrays once here (the vocabulary is exactly CATS)
+DB.weaknesses.forEach(w => {{
+  w.categories = CATS.filter((c, i) => w._catMask & (1 << i));
+}});
 const CAT_LABELS = {{
   'ASTM_INCOMP':    'Incompleteness',
   'ASTM_INAC_EX':   'Inaccuracy: Existence',
@@ -2686,15 +3264,61 @@ function sortTh(label, key, stateKey, stateDirKey, style) {{
 }}
 
 function wCats(w) {{
-  return (w.categories || []);
+  // Cached so items without categories don't allocate a fresh [] per call
+  return w._cats || (w._cats = (w.categories || []));
+}}
+
+// Inverted 3-gram index over the item search blobs. For queries of three or
+// more characters the posting lists yield a small candidate set, verified
+// with indexOf so substring semantics are unchanged; shorter queries fall
+// back to the linear blob scan. Built at idle alongside the blobs — shipping
+// it from Python would add ~300 KB to the page for no behavioural gain.
+let _gramIndex = null;
+let _searchItems = [];
+function buildGramIndex() {{
+  _gramIndex = new Map();
+  _searchItems = [];
+  let n = 0;
+  for (const list of [DB.techniques, DB.weaknesses, DB.mitigations]) {{
+    for (const o of list) {{
+      o._sidx = n++;
+      _searchItems.push(o);
+      const blob = o._search;
+      const seen = new Set();
+      for (let j = 0; j + 3 <= blob.length; j++) {{
+        const g = blob.slice(j, j + 3);
+        if (seen.has(g)) continue;
+        seen.add(g);
+        let arr = _gramIndex.get(g);
+        if (!arr) _gramIndex.set(g, arr = []);
+        arr.push(o._sidx);
+      }}
+    }}
+  }}
+}}
+
+// Matching item set for the current query, or null to mean "use the linear
+// scan" (short query, or index not built yet)
+function computeSearchSet() {{
+  if (!S.searchLC || S.searchLC.length < 3 || !_gramIndex) return null;
+  // The rarest gram's posting list is the cheapest candidate set
+  let cand = null;
+  for (let j = 0; j + 3 <= S.searchLC.length; j++) {{
+    const arr = _gramIndex.get(S.searchLC.slice(j, j + 3));
+    if (!arr) return new Set();  // some gram occurs nowhere → no matches
+    if (!cand || arr.length < cand.length) cand = arr;
+  }}
+  const out = new Set();
+  for (const i of cand) {{
+    if (_searchItems[i]._search.indexOf(S.searchLC) !== -1) out.add(i);
+  }}
+  return out;
 }}
 
 function matchesSearch(item) {{
   if (!S.search) return true;
-  const q = S.search.toLowerCase();
-  return (item.id||'').toLowerCase().includes(q)
-      || (item.name||'').toLowerCase().includes(q)
-      || (item.description||'').toLowerCase().includes(q);
+  if (S.searchSet) return S.searchSet.has(item._sidx);
+  return item._search.indexOf(S.searchLC) !== -1;
 }}
 
 const REPO_URL = 'https://github.com/SOLVE-IT-DF/solve-it';
@@ -2758,228 +3382,216 @@ function dfciteRelevanceFormUrl(itemType, itemId, ref) {{
   return `${{REPO_URL}}/issues/new?${{p.toString()}}`;
 }}
 function updateBtn(type, obj) {{
-  const url = updateFormUrl(type, obj);
   const btnColor = {{technique:'var(--blue)', weakness:'var(--red)', mitigation:'var(--green)'}}[type] || 'var(--blue)';
   const btnHover = {{technique:'var(--blue-lt)', weakness:'#e74c3c', mitigation:'#22a05b'}}[type] || 'var(--blue-lt)';
   const label = {{technique:'technique', weakness:'weakness', mitigation:'mitigation'}}[type] || type;
   const folder = {{technique:'techniques', weakness:'weaknesses', mitigation:'mitigations'}}[type];
-  const srcUrl = `${{REPO_URL}}/blob/main/data/${{folder}}/${{obj.id}}.json`;
-  const el = document.createElement('div');
-  el.className = 'detail-section';
-  el.dataset.col = 'top-left';
-  el.style.cssText = 'padding:12px 18px;display:flex;align-items:center;gap:12px;flex-wrap:wrap';
-
-  if (CUSTOM_MODE) {{
-    const span = document.createElement('span');
-    span.className = 'propose-update-btn disabled-btn';
-    span.title = 'Editing is disabled in custom view mode';
-    span.textContent = 'Propose an update to this ' + label;
-    el.appendChild(span);
-
-    const a2 = document.createElement('a');
-    a2.href = srcUrl;
-    a2.target = '_blank';
-    a2.rel = 'noopener';
-    a2.className = 'view-source-btn';
-    a2.textContent = 'View source in GitHub';
-    el.appendChild(a2);
-  }} else {{
-    const a1 = document.createElement('a');
-    a1.href = url;
-    a1.target = '_blank';
-    a1.rel = 'noopener';
-    a1.className = 'propose-update-btn';
-    a1.style.background = btnColor;
-    a1.onmouseover = function(){{ this.style.background = btnHover; }};
-    a1.onmouseout = function(){{ this.style.background = btnColor; }};
-    a1.textContent = 'Propose an update to this ' + label;
-    el.appendChild(a1);
-
-    const a2 = document.createElement('a');
-    a2.href = srcUrl;
-    a2.target = '_blank';
-    a2.rel = 'noopener';
-    a2.className = 'view-source-btn';
-    a2.textContent = 'View source in GitHub';
-    el.appendChild(a2);
-  }}
-
-  return el.outerHTML;
+  const srcLink = `<a href="${{REPO_URL}}/blob/main/data/${{folder}}/${{esc(obj.id)}}.json" target="_blank" rel="noopener" class="view-source-btn">View source in GitHub</a>`;
+  // The issue URL is only built when the button is actually clicked (see the
+  // delegated listener below) — constructing URLSearchParams on every detail
+  // render was wasted work for a link most users never follow.
+  const propose = CUSTOM_MODE
+    ? `<span class="propose-update-btn disabled-btn" title="Editing is disabled in custom view mode">Propose an update to this ${{label}}</span>`
+    : `<a href="#" target="_blank" rel="noopener" class="propose-update-btn" data-update-type="${{type}}" data-update-id="${{esc(obj.id)}}" style="background:${{btnColor}}" onmouseover="this.style.background='${{btnHover}}'" onmouseout="this.style.background='${{btnColor}}'">Propose an update to this ${{label}}</a>`;
+  return `<div class="detail-section" data-col="top-left" style="padding:12px 18px;display:flex;align-items:center;gap:12px;flex-wrap:wrap">${{propose}}${{srcLink}}</div>`;
 }}
 
+
 function techStatus(t) {{
   return t.status || 'placeholder';
 }}
 
+const STATUS_CLASS = {{placeholder:'status-red', partial:'status-yellow', complete:'status-green'}};
 function statusClass(s) {{
-  return {{placeholder:'status-red', partial:'status-yellow', complete:'status-green'}}[s]||'status-red';
+  return STATUS_CLASS[s] || 'status-red';
 }}
 
 const STATUS_LABEL = {{complete:'{label_complete}', partial:'{label_partial}', placeholder:'{label_placeholder}'}};
+// Only three statuses exist, so badge markup is interned per status rather
+// than rebuilt per row
+const _statusBadges = {{}};
 function statusBadge(s) {{
-  return `<span class="status-badge ${{s}}">${{STATUS_LABEL[s]||s}}</span>`;
+  return _statusBadges[s] || (_statusBadges[s] = `<span class="status-badge ${{s}}">${{STATUS_LABEL[s]||s}}</span>`);
 }}
 
 // ── Rendering: Matrix ────────────────────────────────────────────────
-function renderMatrix() {{
-  const grid = document.getElementById('matrix');
-  grid.innerHTML = '';
+// The matrix DOM is built once and kept; renderMatrix only toggles cell
+// visibility, selection and counts on the persistent elements. A rebuild is
+// needed only when the column structure itself changes (custom schema
+// upload/reset), signalled via invalidateMatrix().
+let matrixStale = true;
+function invalidateMatrix() {{ matrixStale = true; }}
+
+// All matrix cell behaviour is delegated to the grid container — one click
+// and one dragstart listener instead of a listener set per cell.
+EL.matrix.addEventListener('click', (e) => {{
+  const badge = e.target.closest('.tech-cell-sub');
+  if (badge) {{
+    const tid = badge.closest('.tech-cell').dataset.id;
+    if (S.expandedSubs.has(tid)) S.expandedSubs.delete(tid);
+    else S.expandedSubs.add(tid);
+    renderMatrix();  // cheap: only toggles visibility on persistent cells
+    return;
+  }}
+  const cell = e.target.closest('.tech-cell');
+  if (cell) showDetail(cell.dataset.id, 'technique');
+}});
+// Allow dragging a technique into the SOLVE-IT workflow builder, which may
+// be open in a side-by-side window on a different origin. The builder only
+// needs the technique ID; it reconstructs the rest from the live KB.
+EL.matrix.addEventListener('dragstart', (e) => {{
+  const cell = e.target.closest('.tech-cell:not(.sub-cell)');
+  const t = cell && TMap[cell.dataset.id];
+  if (!t) return;
+  // text/plain with a sentinel survives the cross-origin drag and guards
+  // against stray dragged text creating nodes in the builder. Including the
+  // name makes it a readable reference when dropped into a document; the
+  // builder parses out the DFT-id and ignores the trailing name.
+  e.dataTransfer.setData('text/plain', 'SOLVE-IT-Technique:' + t.id + (t.name ? ':' + t.name : ''));
+  // Custom type for same-app drags where the browser preserves it.
+  e.dataTransfer.setData('application/solveit-technique', t.id);
+  e.dataTransfer.effectAllowed = 'copy';
+}});
 
-  const objs = DB.objectives.filter((obj, idx) => {{
-    if (S.matrixObj !== 'all' && String(idx) !== String(S.matrixObj)) return false;
-    const techs = filteredTechniques(obj.techniques || []);
-    return techs.length > 0 || !S.search;
-  }});
+function makeTechCell(t, isSub) {{
+  const st   = techStatus(t);
+  const cls  = statusClass(st);
+  const cell = document.createElement('div');
+  cell.className = `tech-cell${{isSub ? ' sub-cell' : ''}} ${{cls}}`;
+  cell.dataset.id = t.id;
+  cell.title = `${{t.id}} — ${{t.name}} (${{STATUS_LABEL[st]||st}})`;
+  if (isSub) {{
+    cell.innerHTML = `
+      <div class="tech-cell-id">${{t._idEsc}}</div>
+      <div class="tech-cell-name">${{t._nameEsc}}</div>
+    `;
+    return cell;
+  }}
+  cell.draggable = true;
+  // Apply custom border colour if extension overrides the default for this status
+  if (t._bg_colour && t._bg_colour !== STATUS_BG_COLOURS[st]) {{
+    cell.style.borderLeftColor = t._bg_colour;
+  }}
+  const pfx = t._prefix || '';
+  const sfx = t._suffix || '';
+  const extSfx = t._extension_suffix || '';
+  const subs = t._subCount;
+  cell.innerHTML = `
+    <div class="tech-cell-id">${{t._idEsc}}</div>
+    <div class="tech-cell-name">${{esc(pfx)}}${{t._nameEsc}}${{esc(sfx)}}</div>
+    ${{extSfx ? `<div style="font-size:.68rem;color:var(--gray-500);margin-top:2px">${{extSfx}}</div>` : ''}}
+    ${{subs > 0 ? `<div class="tech-cell-sub">+ ${{subs}} sub-technique${{subs>1?'s':''}}</div>` : ''}}
+  `;
+  return cell;
+}}
 
-  const totalObjs = DB.objectives.length;
-  const colMaxWidth = totalObjs > 0 ? (100 / totalObjs) + '%' : 'none';
+// Equalise tactic header heights to the tallest one. Header text never
+// changes after build, so this runs once per matrix (re)build — and again
+// when the webfonts land, since that can change line wrapping — instead of
+// forcing three synchronous layout passes on every render.
+function equalizeMatrixHeaders() {{
+  const headers = EL.matrix.querySelectorAll('.tactic-header');
+  headers.forEach(h => h.style.height = 'auto');
+  const maxH = Math.max(...Array.from(headers, h => h.offsetHeight));
+  if (maxH > 0) headers.forEach(h => h.style.height = maxH + 'px');
+}}
+if (document.fonts && document.fonts.ready) document.fonts.ready.then(equalizeMatrixHeaders);
 
-  let totalShown = 0;
-  let totalSubsShown = 0;
-  const subIds = new Set();
-  let colIdx = 0;
+// The page ships with the matrix markup prerendered by Python; with all
+// cell behaviour delegated to the grid, adopting it is just a matter of not
+// rebuilding.
+if (EL.matrix.children.length) {{
+  matrixStale = false;
+  equalizeMatrixHeaders();
+}}
 
-  objs.forEach((obj, i) => {{
-    const techs = filteredTechniques(obj.techniques || []);
-    if (techs.length === 0 && S.search) return;
-    totalShown += techs.length;
-    techs.forEach(tid => {{ const t = TMap[tid]; if (t) (t.subtechniques || []).forEach(s => subIds.add(s)); }});
+function buildMatrix() {{
+  ensureEnriched();  // makeTechCell reads the _idEsc/_nameEsc caches
+  const grid = EL.matrix;
+  grid.innerHTML = '';
+  const totalObjs = DB.objectives.length;
+  const colMaxWidth = totalObjs > 0 ? (100 / totalObjs) + '%' : 'none';
 
+  DB.objectives.forEach((obj, i) => {{
     const col = document.createElement('div');
     col.className = 'tactic-col';
     col.style.maxWidth = colMaxWidth;
-    col.style.animationDelay = `${{colIdx * 0.025}}s`;
-    colIdx++;
-
+    col.style.animationDelay = `${{i * 0.025}}s`;
     col.innerHTML = `
       <div class="tactic-header" title="${{esc(obj.description || obj.name)}}">
         <span class="tactic-id">${{esc(obj.id || '')}}</span>
         <span>${{esc(obj.name)}}</span>
-        <span class="tcount">${{techs.length}}/${{(obj.techniques||[]).length}} technique${{(obj.techniques||[]).length!==1?'s':''}}</span>
+        <span class="tcount"></span>
       </div>
-      <div class="tactic-cells" id="cells-${{i}}"></div>
+      <div class="tactic-cells"></div>
     `;
-    grid.appendChild(col);
-
-    const cellsDiv = col.querySelector(`#cells-${{i}}`);
-    techs.sort((a,b) => ((TMap[a]||{{}}).name||'').localeCompare((TMap[b]||{{}}).name||''));
-    let subsShown = 0;
-    techs.forEach(tid => {{
+    const cellsDiv = col.querySelector('.tactic-cells');
+    const tids = obj._sortedTids || (obj.techniques || []).slice()
+      .sort((a,b) => cmpName((TMap[a]||{{}})._nameLC||'', (TMap[b]||{{}})._nameLC||''));
+    tids.forEach(tid => {{
       const t = TMap[tid];
       if (!t) return;
-      const st   = techStatus(t);
-      const cls  = statusClass(st);
-      const sel  = S.selected && S.selected.id === t.id && S.selected.type === 'technique';
-      const subIds_t = t.subtechniques || [];
-      const subs = subIds_t.length;
-
-      // Determine if subtechniques should be shown
-      const searchMatchesSub = S.search && subIds_t.some(sid => {{
+      cellsDiv.appendChild(makeTechCell(t, false));
+      // Sub-cells live permanently after their parent; visibility is toggled
+      // by the update pass below.
+      (t.subtechniques || []).forEach(sid => {{
         const sub = TMap[sid];
-        return sub && matchesSearch(sub);
-      }});
-      const isExpanded = subs > 0 && (S.expandedSubs.has(t.id) || searchMatchesSub);
-
-      const cell = document.createElement('div');
-      cell.className = `tech-cell ${{cls}}${{sel?' selected':''}}`;
-      cell.dataset.id = t.id;
-      cell.title = `${{t.id}} — ${{t.name}} (${{STATUS_LABEL[st]||st}})`;
-      // Allow dragging a technique into the SOLVE-IT workflow builder, which may
-      // be open in a side-by-side window on a different origin. The builder only
-      // needs the technique ID; it reconstructs the rest from the live KB.
-      cell.draggable = true;
-      cell.addEventListener('dragstart', (e) => {{
-        // text/plain with a sentinel survives the cross-origin drag and guards
-        // against stray dragged text creating nodes in the builder. Including the
-        // name makes it a readable reference when dropped into a document; the
-        // builder parses out the DFT-id and ignores the trailing name.
-        e.dataTransfer.setData('text/plain', 'SOLVE-IT-Technique:' + t.id + (t.name ? ':' + t.name : ''));
-        // Custom type for same-app drags where the browser preserves it.
-        e.dataTransfer.setData('application/solveit-technique', t.id);
-        e.dataTransfer.effectAllowed = 'copy';
-      }});
-      // Apply custom border colour if extension overrides the default for this status
-      if (t._bg_colour && t._bg_colour !== STATUS_BG_COLOURS[st]) {{
-        cell.style.borderLeftColor = t._bg_colour;
-      }}
-      const pfx = t._prefix || '';
-      const sfx = t._suffix || '';
-      const extSfx = t._extension_suffix || '';
-      cell.innerHTML = `
-        <div class="tech-cell-id">${{esc(t.id)}}</div>
-        <div class="tech-cell-name">${{esc(pfx)}}${{esc(t.name)}}${{esc(sfx)}}</div>
-        ${{extSfx ? `<div style="font-size:.68rem;color:var(--gray-500);margin-top:2px">${{extSfx}}</div>` : ''}}
-        ${{subs > 0 ? `<div class="tech-cell-sub">${{isExpanded ? '&minus;' : '+'}} ${{subs}} sub-technique${{subs>1?'s':''}}</div>` : ''}}
-      `;
-      cell.addEventListener('click', (e) => {{
-        if (e.target.closest('.tech-cell-sub')) return;
-        showDetail(t.id, 'technique');
+        if (sub) cellsDiv.appendChild(makeTechCell(sub, true));
       }});
-      if (subs > 0) {{
-        cell.querySelector('.tech-cell-sub').addEventListener('click', (e) => {{
-          e.stopPropagation();
-          const badge = cell.querySelector('.tech-cell-sub');
-          if (S.expandedSubs.has(t.id)) {{
-            S.expandedSubs.delete(t.id);
-            // Remove sub-cells in-place
-            let next = cell.nextSibling;
-            while (next && next.classList && next.classList.contains('sub-cell')) {{
-              const toRemove = next;
-              next = next.nextSibling;
-              toRemove.remove();
-            }}
-            badge.textContent = `+ ${{subs}} sub-technique${{subs>1?'s':''}}`;
-          }} else {{
-            S.expandedSubs.add(t.id);
-            // Insert sub-cells in-place after parent
-            let insertAfter = cell;
-            subIds_t.forEach(sid => {{
-              const sub = TMap[sid];
-              if (!sub) return;
-              const subSt  = techStatus(sub);
-              const subCls = statusClass(subSt);
-              const subSel = S.selected && S.selected.id === sub.id && S.selected.type === 'technique';
-              const subCell = document.createElement('div');
-              subCell.className = `tech-cell sub-cell ${{subCls}}${{subSel?' selected':''}}`;
-              subCell.dataset.id = sub.id;
-              subCell.title = `${{sub.id}} — ${{sub.name}} (${{STATUS_LABEL[subSt]||subSt}})`;
-              subCell.innerHTML = `
-                <div class="tech-cell-id">${{esc(sub.id)}}</div>
-                <div class="tech-cell-name">${{esc(sub.name)}}</div>
-              `;
-              subCell.addEventListener('click', () => showDetail(sub.id, 'technique'));
-              insertAfter.after(subCell);
-              insertAfter = subCell;
-            }});
-            badge.innerHTML = `&minus; ${{subs}} sub-technique${{subs>1?'s':''}}`;
-          }}
-        }});
-      }}
-      cellsDiv.appendChild(cell);
+    }});
+    grid.appendChild(col);
+  }});
+  matrixStale = false;
+  equalizeMatrixHeaders();
+}}
+
+function renderMatrix() {{
+  const grid = EL.matrix;
+  if (matrixStale) buildMatrix();
 
-      // Render subtechnique cells on initial render when expanded (search match or previously toggled)
-      if (isExpanded) {{
-        subIds_t.forEach(sid => {{
+  let totalShown = 0;
+  let totalSubsShown = 0;
+  const subIds = new Set();
+  const isSel = (id) => !!(S.selected && S.selected.type === 'technique' && S.selected.id === id);
+
+  DB.objectives.forEach((obj, i) => {{
+    const col = grid.children[i];
+    if (!col) return;
+    const objVisible = S.matrixObj === 'all' || String(i) === String(S.matrixObj);
+    const techs = filteredTechniques(obj.techniques || []);
+    const shown = new Set(techs);
+    const colShown = objVisible && (techs.length > 0 || !S.search);
+    col.classList.toggle('hidden', !colShown);
+    if (colShown) totalShown += techs.length;
+    col.querySelector('.tcount').textContent =
+      `${{techs.length}}/${{(obj.techniques||[]).length}} technique${{(obj.techniques||[]).length!==1?'s':''}}`;
+
+    let parentVisible = false;
+    let parentExpanded = false;
+    for (const cell of col.lastElementChild.children) {{
+      const t = TMap[cell.dataset.id];
+      if (!t) continue;
+      if (!cell.classList.contains('sub-cell')) {{
+        const subIds_t = t.subtechniques || [];
+        parentVisible = colShown && shown.has(t.id);
+        if (parentVisible) subIds_t.forEach(s => subIds.add(s));
+        const searchMatchesSub = S.search && subIds_t.some(sid => {{
           const sub = TMap[sid];
-          if (!sub) return;
-          const subSt  = techStatus(sub);
-          const subCls = statusClass(subSt);
-          const subSel = S.selected && S.selected.id === sub.id && S.selected.type === 'technique';
-          const subCell = document.createElement('div');
-          subCell.className = `tech-cell sub-cell ${{subCls}}${{subSel?' selected':''}}`;
-          subCell.dataset.id = sub.id;
-          subCell.title = `${{sub.id}} — ${{sub.name}} (${{STATUS_LABEL[subSt]||subSt}})`;
-          subCell.innerHTML = `
-            <div class="tech-cell-id">${{esc(sub.id)}}</div>
-            <div class="tech-cell-name">${{esc(sub.name)}}</div>
-          `;
-          subCell.addEventListener('click', () => showDetail(sub.id, 'technique'));
-          cellsDiv.appendChild(subCell);
-          subsShown++;
+          return sub && matchesSearch(sub);
         }});
+        parentExpanded = subIds_t.length > 0 && (S.expandedSubs.has(t.id) || searchMatchesSub);
+        const badge = cell.querySelector('.tech-cell-sub');
+        if (badge) badge.innerHTML =
+          `${{parentExpanded ? '&minus;' : '+'}} ${{subIds_t.length}} sub-technique${{subIds_t.length>1?'s':''}}`;
+        cell.classList.toggle('hidden', !parentVisible);
+        cell.classList.toggle('selected', isSel(t.id));
+      }} else {{
+        const show = parentVisible && parentExpanded;
+        cell.classList.toggle('hidden', !show);
+        cell.classList.toggle('selected', isSel(t.id));
+        if (show) totalSubsShown++;
       }}
-    }});
-    totalSubsShown += subsShown;
+    }}
   }});
 
   const nSubs = subIds.size;
@@ -3004,11 +3616,6 @@ function renderMatrix() {{
     objIndicator.style.display = 'none';
   }}
 
-  // Equalise tactic header heights to the tallest one
-  const headers = grid.querySelectorAll('.tactic-header');
-  headers.forEach(h => h.style.height = 'auto');
-  const maxH = Math.max(...Array.from(headers, h => h.offsetHeight));
-  if (maxH > 0) headers.forEach(h => h.style.height = maxH + 'px');
 }};
 
 function filteredTechniques(ids) {{
@@ -3026,6 +3633,211 @@ function filteredTechniques(ids) {{
   }});
 }}
 
+// ── Windowed table rendering ─────────────────────────────────────────
+// The table views materialize only the rows near the viewport; spacer rows
+// above and below preserve the scrollbar geometry. Row height is measured
+// from the first materialized batch (rows within a view are near-uniform).
+const VROW_BUFFER = 10;
+const _vwindows = {{}};   // view element id -> {{items, rowHtml, rowH, first, last}}
+const _rowParts = [];    // scratch buffer reused by renderRowWindow
+
+function renderRowWindow(viewId) {{
+  const st = _vwindows[viewId];
+  const view = document.getElementById(viewId);
+  const tbody = view && view.querySelector('tbody');
+  if (!st || !tbody) return;
+  const rowH = st.rowH || 38;
+  const first = Math.max(0, Math.floor(view.scrollTop / rowH) - VROW_BUFFER);
+  const last = Math.min(st.items.length,
+    first + Math.ceil(view.clientHeight / rowH) + VROW_BUFFER * 2);
+  if (first === st.first && last === st.last) return;
+  st.first = first; st.last = last;
+  // Collect row strings and join once — cheaper than growing one string
+  // through repeated concatenation. The scratch array is module-level and
+  // reset per fill to avoid reallocating it every scroll tick.
+  const parts = _rowParts;
+  parts.length = 0;
+  if (first > 0)
+    parts.push(`<tr class="vspacer" style="height:${{Math.round(first * rowH)}}px"><td colspan="99"></td></tr>`);
+  for (let i = first; i < last; i++) parts.push(st.rowHtml(st.items[i]));
+  if (last < st.items.length)
+    parts.push(`<tr class="vspacer" style="height:${{Math.round((st.items.length - last) * rowH)}}px"><td colspan="99"></td></tr>`);
+  tbody.innerHTML = parts.join('');
+  // Selection is applied here rather than baked into the (cached) row
+  // strings, so a row's HTML never varies with state
+  if (S.selected) {{
+    const row = tbody.querySelector(`tr[data-show-id="${{CSS.escape(S.selected.id)}}"]`);
+    if (row && row.dataset.showType === S.selected.type) row.classList.add('selected');
+  }}
+  if (!st.rowH) {{
+    const rows = tbody.querySelectorAll('tr:not(.vspacer)');
+    let h = 0;
+    rows.forEach(r => h += r.offsetHeight);
+    if (rows.length && h) st.rowH = h / rows.length;
+  }}
+}}
+
+// Build the off-window row strings during idle time so later scrolling
+// serves pre-cached rows. A newer item set supersedes the walk (checked via
+// state identity), so stale warms stop on re-render.
+function warmRowCache(viewId) {{
+  const st = _vwindows[viewId];
+  if (!st || !window.requestIdleCallback) return;
+  let i = 0;
+  const step = (deadline) => {{
+    if (_vwindows[viewId] !== st) return;
+    while (i < st.items.length && deadline.timeRemaining() > 2) st.rowHtml(st.items[i++]);
+    if (i < st.items.length) requestIdleCallback(step);
+  }};
+  requestIdleCallback(step);
+}}
+
+function setWindowedRows(viewId, items, rowHtml) {{
+  const prev = _vwindows[viewId];
+  _vwindows[viewId] = {{items, rowHtml, rowH: prev ? prev.rowH : 0, first: -1, last: -1}};
+  renderRowWindow(viewId);
+  warmRowCache(viewId);
+}}
+
+const WINDOWED_VIEWS = ['view-techniques','view-weaknesses','view-mitigations','view-references'];
+WINDOWED_VIEWS.forEach(id => {{
+  const el = document.getElementById(id);
+  let pending = false;
+  el.addEventListener('scroll', () => {{
+    if (pending || !_vwindows[id]) return;
+    pending = true;
+    requestAnimationFrame(() => {{ pending = false; renderRowWindow(id); }});
+  }});
+}});
+
+// Cached viewport size, refreshed on resize, so click-time code (popup
+// placement) never queries window.inner* and risks a forced layout
+let WINW = window.innerWidth, WINH = window.innerHeight;
+
+// A taller viewport needs a larger window — refill on resize (coalesced to
+// one frame; renderRowWindow no-ops for views whose window didn't change)
+let _resizePending = false;
+window.addEventListener('resize', () => {{
+  WINW = window.innerWidth;
+  WINH = window.innerHeight;
+  if (_resizePending) return;
+  _resizePending = true;
+  requestAnimationFrame(() => {{
+    _resizePending = false;
+    WINDOWED_VIEWS.forEach(renderRowWindow);
+  }});
+}});
+
+// ── Sorted item caches ───────────────────────────────────────────────
+// Sorted arrays per (table, sort key), built once on first use. A direction
+// flip traverses the cached order backwards, and filtering preserves order,
+// so re-renders never call Array.prototype.sort.
+
+// String columns compare precomputed ranks (ints) from the Python side
+// rather than calling localeCompare per comparison. The baked objective
+// ranks only describe the original objectives, so while a custom schema is
+// active the objective column compares the live category names instead.
+let customSchemaActive = false;
+const tSortFns = {{
+  id:      (a,b) => IDX.rank_t_id[a.id] - IDX.rank_t_id[b.id],
+  name:    (a,b) => IDX.rank_t_name[a.id] - IDX.rank_t_name[b.id],
+  obj:     (a,b) => customSchemaActive
+    ? cmpName(((T2Obj[a.id]||{{}}).name||'').toLowerCase(), ((T2Obj[b.id]||{{}}).name||'').toLowerCase())
+    : IDX.rank_t_obj[a.id] - IDX.rank_t_obj[b.id],
+  type:    (a,b) => (a._isSub?1:0) - (b._isSub?1:0),
+  status:  (a,b) => IDX.rank_t_status[a.id] - IDX.rank_t_status[b.id],
+  desc:    (a,b) => (a.description?1:0) - (b.description?1:0),
+  details: (a,b) => (a.details?1:0) - (b.details?1:0),
+  weaks:   (a,b) => (a.weaknesses||[]).length - (b.weaknesses||[]).length,
+  refs:    (a,b) => (a.references||[]).length - (b.references||[]).length,
+  cout:    (a,b) => (a.CASE_output_classes||[]).length - (b.CASE_output_classes||[]).length,
+  cin:     (a,b) => (a.CASE_input_classes||[]).length - (b.CASE_input_classes||[]).length,
+  edits:   (a,b) => (a._edits||0) - (b._edits||0),
+}};
+
+const wSortFns = {{
+  id:   (a,b) => cmpAscii(a.id, b.id),
+  name: (a,b) => cmpName(a._nameLC, b._nameLC),
+  cats: (a,b) => wCats(a).length - wCats(b).length,
+  mits: (a,b) => a._mitCount - b._mitCount,
+  edits: (a,b) => (a._edits||0) - (b._edits||0),
+}};
+
+const mSortFns = {{
+  weaknesses: (a,b) => a._wcount - b._wcount,
+  techniques: (a,b) => a._tcount - b._tcount,
+  id:   (a,b) => cmpAscii(a.id, b.id),
+  name: (a,b) => cmpName(a._nameLC, b._nameLC),
+  edits: (a,b) => (a._edits||0) - (b._edits||0),
+}};
+
+// Header rows only change with the sort key/direction; cache the built
+// markup per (table, key, dir) so renders skip the sortTh calls
+const _theadCache = new Map();
+function cachedThead(cacheKey, build) {{
+  let html = _theadCache.get(cacheKey);
+  if (html === undefined) {{ html = build(); _theadCache.set(cacheKey, html); }}
+  return html;
+}}
+
+// Filtered result arrays per full view state — typing "abc" then
+// backspacing to "ab" reuses the earlier scan, as does re-rendering after
+// a selection highlight. The DB never changes, so entries stay valid; a
+// small LRU cap bounds memory.
+const _viewCache = new Map();
+
+// Per-view key of the state last rendered into the DOM; switching back to a
+// tab whose inputs haven't changed skips the rebuild entirely (selection
+// highlighting is applied separately by updateSelectionHighlights)
+const _lastViewKey = {{}};
+function viewUnchanged(viewId, key) {{
+  if (_lastViewKey[viewId] === key && document.getElementById(viewId).firstChild) return true;
+  _lastViewKey[viewId] = key;
+  return false;
+}}
+function cachedFilter(key, compute) {{
+  let items = _viewCache.get(key);
+  if (items) {{
+    _viewCache.delete(key);  // refresh LRU position
+    _viewCache.set(key, items);
+    return items;
+  }}
+  items = compute();
+  _viewCache.set(key, items);
+  if (_viewCache.size > 32) _viewCache.delete(_viewCache.keys().next().value);
+  return items;
+}}
+
+const _sortedCache = {{t: {{}}, w: {{}}, m: {{}}}};
+
+// A custom schema remaps techniques to new categories; every cache that
+// baked the old objective assignments has to go: memoized rows (Objective
+// column), filtered view results, the techniques view key, and the sorted
+// orders for the objective column.
+function invalidateTechniqueViews() {{
+  DB.techniques.forEach(t => {{ t._row = null; }});
+  _viewCache.clear();
+  delete _lastViewKey['view-techniques'];
+  delete _sortedCache.t['obj'];
+  delete _sortedCache.t['obj:desc'];
+}}
+function sortedItems(cacheKey, list, fns, key, dir) {{
+  ensureEnriched();  // row builders downstream read the _idEsc/_search caches
+  if (!fns[key]) key = 'id';
+  const cache = _sortedCache[cacheKey];
+  // Both directions are cached, so toggling a header back and forth costs a
+  // lookup, not a copy-and-reverse (let alone a sort). The dataset never
+  // changes after generation, so entries live forever.
+  const ck = dir < 0 ? key + ':desc' : key;
+  let base = cache[ck];
+  if (!base) {{
+    base = cache[ck] = dir < 0
+      ? sortedItems(cacheKey, list, fns, key, 1).slice().reverse()
+      : list.slice().sort(fns[key]);
+  }}
+  return base;
+}}
+
 // ── Rendering: Objectives table ───────────────────────────────────────
 function renderObjectives() {{
   const el = document.getElementById('view-objectives');
@@ -3040,23 +3852,22 @@ function renderObjectives() {{
       if (st === 'complete') complete++;
       else if (st === 'partial') partial++;
       else placeholder++;
-      subs += (t.subtechniques || []).length;
+      subs += t._subCount;
     }});
     return {{ obj, idx, techs: tids.length, subs, complete, partial, placeholder }};
   }});
 
   rows = rows.filter(r => {{
     if (!S.search) return true;
-    const q = S.search.toLowerCase();
-    return (r.obj.name||'').toLowerCase().includes(q)
-        || (r.obj.description||'').toLowerCase().includes(q);
+    return (r.obj.name||'').toLowerCase().includes(S.searchLC)
+        || (r.obj.description||'').toLowerCase().includes(S.searchLC);
   }});
 
   const sortFns = {{
     order:       (a,b) => a.idx - b.idx,
     id:          (a,b) => a.idx - b.idx,
-    name:        (a,b) => (a.obj.name||'').localeCompare(b.obj.name||''),
-    desc:        (a,b) => (a.obj.description||'').localeCompare(b.obj.description||''),
+    name:        (a,b) => cmpName((a.obj.name||'').toLowerCase(), (b.obj.name||'').toLowerCase()),
+    desc:        (a,b) => cmpAscii((a.obj.description||'').toLowerCase(), (b.obj.description||'').toLowerCase()),
     techs:       (a,b) => a.techs - b.techs,
     subs:        (a,b) => a.subs - b.subs,
     complete:    (a,b) => a.complete - b.complete,
@@ -3080,7 +3891,7 @@ function renderObjectives() {{
         <span class="table-section-count">${{rows.length}}</span>
       </div>
       <table class="attck-table">
-        <thead><tr>
+        <thead>${{cachedThead('o:'+S.os+':'+S.osDir, () => `<tr>
           ${{sortTh('#','order','os','osDir','width:45px;text-align:center')}}
           ${{sortTh('ID','id','os','osDir','width:55px')}}
           ${{sortTh('Name','name','os','osDir','')}}
@@ -3090,18 +3901,18 @@ function renderObjectives() {{
           ${{sortTh('Stable','complete','os','osDir','width:80px;text-align:center')}}
           ${{sortTh('Partial','partial','os','osDir','width:70px;text-align:center')}}
           ${{sortTh('Placeholder','placeholder','os','osDir','width:90px;text-align:center')}}
-        </tr></thead>
+        </tr>`)}}</thead>
         <tbody>
           ${{rows.map(r => `<tr class="obj-row" data-obj-idx="${{r.idx}}" style="cursor:pointer">
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{r.idx + 1}}</td>
+            <td class="col-num">${{r.idx + 1}}</td>
             <td style="font-family:var(--font-mono);font-size:.8rem;color:var(--gray-500)">${{esc(r.obj.id || '')}}</td>
             <td style="font-weight:600">${{esc(r.obj.name)}}</td>
             <td style="font-size:.82rem;color:var(--gray-700)">${{esc(r.obj.description || '')}}</td>
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem;font-weight:700">${{r.techs}}</td>
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem;color:var(--gray-500)">${{r.subs}}</td>
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem;color:var(--green)">${{r.complete}}</td>
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem;color:var(--yellow)">${{r.partial}}</td>
-            <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem;color:var(--red)">${{r.placeholder}}</td>
+            <td class="col-num" style="font-weight:700">${{r.techs}}</td>
+            <td class="col-num" style="color:var(--gray-500)">${{r.subs}}</td>
+            <td class="col-num" style="color:var(--green)">${{r.complete}}</td>
+            <td class="col-num" style="color:var(--yellow)">${{r.partial}}</td>
+            <td class="col-num" style="color:var(--red)">${{r.placeholder}}</td>
           </tr>`).join('')}}
         </tbody>
       </table>
@@ -3112,44 +3923,21 @@ function renderObjectives() {{
 // ── Rendering: Techniques table ──────────────────────────────────────
 function renderTechniquesTable() {{
   const el = document.getElementById('view-techniques');
-  let items = DB.techniques.filter(t => {{
-    if (!matchesSearch(t)) return false;
-    if (S.t2f !== 'all' && techStatus(t) !== S.t2f) return false;
-    if (S.t2o !== 'all') {{
-      const obj = T2Obj[t.id];
-      if (!obj || String(obj._idx) !== S.t2o) return false;
-    }}
-    if (S.t2t !== 'all') {{
-      const isSub = t._isSub;
-      const isParent = !isSub && (t.subtechniques||[]).length > 0;
-      const isStandalone = !isSub && !isParent;
-      if (S.t2t === 'sub' && !isSub) return false;
-      if (S.t2t === 'parent' && !isParent) return false;
-      if (S.t2t === 'standalone' && !isStandalone) return false;
-    }}
-    return true;
-  }});
-
-  const tSortFns = {{
-    id:      (a,b) => a.id.localeCompare(b.id),
-    name:    (a,b) => (a.name||'').localeCompare(b.name||''),
-    obj:     (a,b) => ((T2Obj[a.id]||{{}}).name||'').localeCompare((T2Obj[b.id]||{{}}).name||''),
-    type:    (a,b) => (a._isSub?1:0) - (b._isSub?1:0),
-    status:  (a,b) => techStatus(a).localeCompare(techStatus(b)),
-    desc:    (a,b) => (a.description?1:0) - (b.description?1:0),
-    details: (a,b) => (a.details?1:0) - (b.details?1:0),
-    weaks:   (a,b) => (a.weaknesses||[]).length - (b.weaknesses||[]).length,
-    refs:    (a,b) => (a.references||[]).length - (b.references||[]).length,
-    cout:    (a,b) => (a.CASE_output_classes||[]).length - (b.CASE_output_classes||[]).length,
-    cin:     (a,b) => (a.CASE_input_classes||[]).length - (b.CASE_input_classes||[]).length,
-    edits:   (a,b) => (a._edits||0) - (b._edits||0),
-  }};
-  const fn = tSortFns[S.ts] || tSortFns.id;
-  items.sort((a,b) => fn(a,b) * S.tsDir);
+  const viewKey = `t|${{S.search}}|${{S.t2f}}|${{S.t2o}}|${{S.t2t}}|${{S.ts}}|${{S.tsDir}}`;
+  if (viewUnchanged('view-techniques', viewKey)) return;
+  const items = cachedFilter(viewKey,
+    () => sortedItems('t', DB.techniques, tSortFns, S.ts, S.tsDir).filter(t => {{
+      if (!matchesSearch(t)) return false;
+      if (S.t2f !== 'all' && techStatus(t) !== S.t2f) return false;
+      if (S.t2o !== 'all' && t._objIdx !== S.t2o) return false;
+      if (S.t2t !== 'all' && t._type !== S.t2t) return false;
+      return true;
+    }}));
 
   document.getElementById('t2-count').textContent = `${{items.length}} shown`;
 
   if (!items.length) {{
+    _vwindows['view-techniques'] = null;
     el.innerHTML = '<div class="no-results">No techniques match your filters.</div>';
     return;
   }}
@@ -3162,7 +3950,7 @@ function renderTechniquesTable() {{
         <a href="${{REPO_URL}}/issues/new?template=1a_propose-new-technique-form.yml" target="_blank" rel="noopener" class="propose-new-btn">+ Propose New Technique</a>
       </div>
       <table class="attck-table">
-        <thead><tr>
+        <thead>${{cachedThead('t:'+S.ts+':'+S.tsDir, () => `<tr>
           ${{sortTh('ID','id','ts','tsDir','width:70px')}}
           ${{sortTh('Name','name','ts','tsDir','')}}
           ${{sortTh('Objective','obj','ts','tsDir','')}}
@@ -3176,67 +3964,59 @@ function renderTechniquesTable() {{
           ${{sortTh('CASE Out','cout','ts','tsDir','width:70px;text-align:center')}}
           ${{sortTh('Edits','edits','ts','tsDir','width:55px;text-align:center')}}
           <th style="width:62px;text-align:center">Actions</th>
-        </tr></thead>
-        <tbody>
-          ${{items.map(t => {{
-            const sel = S.selected && S.selected.id === t.id && S.selected.type === 'technique';
-            const obj = T2Obj[t.id];
-            const typeLabel = t._isSub ? `<span style="font-size:.7rem;color:var(--gray-500)">sub</span>` : (t.subtechniques||[]).length > 0 ? `<span style="font-size:.7rem;color:var(--blue)">parent</span>` : '';
-            return `<tr class="${{sel?'selected':''}}" data-show-id="${{esc(t.id)}}" data-show-type="technique">
-              <td><span class="tid">${{esc(t.id)}}</span></td>
-              <td>${{esc(t.name)}}</td>
-              <td style="font-size:.78rem;color:var(--gray-700)">${{obj ? esc(obj.name) : '<span class="empty-message">—</span>'}}</td>
-              <td style="text-align:center">${{typeLabel}}</td>
-              <td>${{statusBadge(techStatus(t))}}</td>
-              <td style="text-align:center;font-size:.8rem">${{t.description ? '&#10003;' : ''}}</td>
-              <td style="text-align:center;font-size:.8rem">${{t.details ? '&#10003;' : ''}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{(t.weaknesses||[]).length}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{(t.references||[]).length}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{(t.CASE_input_classes||[]).length}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{(t.CASE_output_classes||[]).length}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{t._edits||0}}</td>
-              <td class="row-actions">
-                <button type="button" class="row-act copylink" data-link-id="${{esc(t.id)}}" draggable="true" title="Copy link (or drag onto a document for the URL)" aria-label="Copy link to ${{esc(t.id)}}">
-                  <svg width="13" height="13" viewBox="0 0 16 16" fill="currentColor"><path d="M4.715 6.542L3.343 7.914a3 3 0 104.243 4.243l1.828-1.829A3 3 0 008.586 5.5L8 6.086a1.002 1.002 0 00-.154.199 2 2 0 01.861 3.337L6.88 11.45a2 2 0 11-2.83-2.83l.793-.792a4.018 4.018 0 01-.128-1.287z"/><path d="M11.285 9.458l1.372-1.372a3 3 0 10-4.243-4.243L6.586 5.671A3 3 0 007.414 10.5l.586-.586a1.002 1.002 0 00.154-.199 2 2 0 01-.861-3.337L9.12 4.55a2 2 0 112.83 2.83l-.793.792c.112.42.155.855.128 1.287z"/></svg>
-                </button>
-                <button type="button" class="row-act rowdrag" data-drag-id="${{esc(t.id)}}" draggable="true" title="Drag this technique into the workflow builder, or onto a document for a reference" aria-label="Drag ${{esc(t.id)}}">
-                  <svg width="13" height="13" viewBox="0 0 16 16" fill="currentColor"><circle cx="5.5" cy="3" r="1.35"/><circle cx="10.5" cy="3" r="1.35"/><circle cx="5.5" cy="8" r="1.35"/><circle cx="10.5" cy="8" r="1.35"/><circle cx="5.5" cy="13" r="1.35"/><circle cx="10.5" cy="13" r="1.35"/></svg>
-                </button>
-              </td>
-            </tr>`;
-          }}).join('')}}
-        </tbody>
+        </tr>`)}}</thead>
+        <tbody></tbody>
       </table>
     </div>
   `;
+  setWindowedRows('view-techniques', items, t => {{
+    if (t._row) return t._row;
+    const obj = T2Obj[t.id];
+    const typeLabel = t._isSub ? `<span style="font-size:.7rem;color:var(--gray-500)">sub</span>` : t._subCount > 0 ? `<span style="font-size:.7rem;color:var(--blue)">parent</span>` : '';
+    return t._row = `<tr data-show-id="${{t._idEsc}}" data-show-type="technique">
+      <td><span class="tid">${{t._idEsc}}</span></td>
+      <td>${{t._nameEsc}}</td>
+      <td style="font-size:.78rem;color:var(--gray-700)">${{obj ? esc(obj.name) : '<span class="empty-message">—</span>'}}</td>
+      <td style="text-align:center">${{typeLabel}}</td>
+      <td>${{statusBadge(techStatus(t))}}</td>
+      <td style="text-align:center;font-size:.8rem">${{t.description ? '&#10003;' : ''}}</td>
+      <td style="text-align:center;font-size:.8rem">${{t.details ? '&#10003;' : ''}}</td>
+      <td class="col-num">${{(t.weaknesses||[]).length}}</td>
+      <td class="col-num">${{(t.references||[]).length}}</td>
+      <td class="col-num">${{(t.CASE_input_classes||[]).length}}</td>
+      <td class="col-num">${{(t.CASE_output_classes||[]).length}}</td>
+      <td class="col-num">${{t._edits||0}}</td>
+      <td class="row-actions">
+        <button type="button" class="row-act copylink" data-link-id="${{t._idEsc}}" draggable="true" title="Copy link (or drag onto a document for the URL)" aria-label="Copy link to ${{t._idEsc}}">
+          <svg width="13" height="13" viewBox="0 0 16 16" fill="currentColor"><path d="M4.715 6.542L3.343 7.914a3 3 0 104.243 4.243l1.828-1.829A3 3 0 008.586 5.5L8 6.086a1.002 1.002 0 00-.154.199 2 2 0 01.861 3.337L6.88 11.45a2 2 0 11-2.83-2.83l.793-.792a4.018 4.018 0 01-.128-1.287z"/><path d="M11.285 9.458l1.372-1.372a3 3 0 10-4.243-4.243L6.586 5.671A3 3 0 007.414 10.5l.586-.586a1.002 1.002 0 00.154-.199 2 2 0 01-.861-3.337L9.12 4.55a2 2 0 112.83 2.83l-.793.792c.112.42.155.855.128 1.287z"/></svg>
+        </button>
+        <button type="button" class="row-act rowdrag" data-drag-id="${{t._idEsc}}" draggable="true" title="Drag this technique into the workflow builder, or onto a document for a reference" aria-label="Drag ${{t._idEsc}}">
+          <svg width="13" height="13" viewBox="0 0 16 16" fill="currentColor"><circle cx="5.5" cy="3" r="1.35"/><circle cx="10.5" cy="3" r="1.35"/><circle cx="5.5" cy="8" r="1.35"/><circle cx="10.5" cy="8" r="1.35"/><circle cx="5.5" cy="13" r="1.35"/><circle cx="10.5" cy="13" r="1.35"/></svg>
+        </button>
+      </td>
+    </tr>`;
+  }});
 }}
 
 // ── Rendering: Weaknesses table ──────────────────────────────────────
 function renderWeaknesses() {{
   const el = document.getElementById('view-weaknesses');
-  let items = DB.weaknesses.filter(w => {{
-    if (!matchesSearch(w)) return false;
-    const cats = wCats(w);
-    const hasMit = (w.mitigations || []).length > 0;
-    if (!cats.some(c => S.wf.has(c))) return false;
-    if (S.mf === 'has'  && !hasMit) return false;
-    if (S.mf === 'none' && hasMit)  return false;
-    return true;
-  }});
-
-  const wSortFns = {{
-    id:   (a,b) => a.id.localeCompare(b.id),
-    name: (a,b) => (a.name||'').localeCompare(b.name||''),
-    cats: (a,b) => wCats(a).length - wCats(b).length,
-    mits: (a,b) => (a.mitigations||[]).length - (b.mitigations||[]).length,
-    edits: (a,b) => (a._edits||0) - (b._edits||0),
-  }};
-  const fn = wSortFns[S.ws] || wSortFns.id;
-  items.sort((a,b) => fn(a,b) * S.wsDir);
+  const viewKey = `w|${{S.search}}|${{S.wfMask}}|${{S.mf}}|${{S.ws}}|${{S.wsDir}}`;
+  if (viewUnchanged('view-weaknesses', viewKey)) return;
+  // No categories selected can't match anything — skip the scan outright
+  const items = S.wfMask === 0 ? [] : cachedFilter(viewKey,
+    () => sortedItems('w', DB.weaknesses, wSortFns, S.ws, S.wsDir).filter(w => {{
+      if (!matchesSearch(w)) return false;
+      if (!(w._catMask & S.wfMask)) return false;
+      if (S.mf === 'has'  && !w._hasMit) return false;
+      if (S.mf === 'none' && w._hasMit)  return false;
+      return true;
+    }}));
 
   document.getElementById('w-count').textContent = `${{items.length}} shown`;
 
   if (!items.length) {{
+    _vwindows['view-weaknesses'] = null;
     el.innerHTML = '<div class="no-results">No weaknesses match your filters.</div>';
     return;
   }}
@@ -3244,55 +4024,50 @@ function renderWeaknesses() {{
   el.innerHTML = `
     <div class="table-section">
       <div class="table-section-header">
-        <span class="table-section-title">${{S.wf.size === CATS.length ? 'All Weaknesses' : S.wf.size === 0 ? 'No Categories Selected' : Array.from(S.wf).map(c => esc(c)).join(' + ')}}</span>
+        <span class="table-section-title">${{S.wfMask === ALL_CAT_MASK ? 'All Weaknesses' : S.wfMask === 0 ? 'No Categories Selected' : CATS.filter(c => S.wfMask & CAT_BIT[c]).map(c => esc(c)).join(' + ')}}</span>
         <span class="table-section-count">${{items.length}}</span>
         <a href="${{REPO_URL}}/issues/new?template=1b_propose-new-weakness-form.yml" target="_blank" rel="noopener" class="propose-new-btn">+ Propose New Weakness</a>
       </div>
-      <table class="attck-table">
-        <thead><tr>
+      <table class="attck-table" style="table-layout:fixed">
+        <thead>${{cachedThead('w:'+S.ws+':'+S.wsDir, () => `<tr>
           ${{sortTh('ID','id','ws','wsDir','width:80px')}}
           ${{sortTh('Name','name','ws','wsDir','')}}
           ${{sortTh('Categories','cats','ws','wsDir','width:90px')}}
           ${{sortTh('Mitigations','mits','ws','wsDir','width:80px')}}
           ${{sortTh('Edits','edits','ws','wsDir','width:55px;text-align:center')}}
-        </tr></thead>
-        <tbody>
-          ${{items.map(w => {{
-            const cats = wCats(w);
-            const mitCount = (w.mitigations||[]).length;
-            const sel = S.selected && S.selected.id === w.id;
-            return `<tr class="${{sel?'selected':''}}" data-wid="${{w.id}}" data-show-id="${{esc(w.id)}}" data-show-type="weakness">
-              <td><span class="wid">${{esc(w.id)}}</span></td>
-              <td>${{esc(w.name)}}</td>
-              <td><div class="cat-grid">${{cats.map(c=>`<span class="cat-tag" title="${{esc(c)}}">${{esc(c.replace('ASTM_',''))}}</span>`).join('')}}</div></td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{mitCount}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{w._edits||0}}</td>
-            </tr>`;
-          }}).join('')}}
-        </tbody>
+        </tr>`)}}</thead>
+        <tbody></tbody>
       </table>
     </div>
   `;
+  setWindowedRows('view-weaknesses', items, w => {{
+    if (w._row) return w._row;
+    const cats = wCats(w);
+    const mitCount = w._mitCount;
+    return w._row = `<tr data-wid="${{w.id}}" data-show-id="${{w._idEsc}}" data-show-type="weakness">
+      <td><span class="wid">${{w._idEsc}}</span></td>
+      <td>${{w._nameEsc}}</td>
+      <td><div class="cat-grid">${{cats.map(c=>`<span class="cat-tag" title="${{esc(c)}}">${{esc(c.replace('ASTM_',''))}}</span>`).join('')}}</div></td>
+      <td class="col-num">${{mitCount}}</td>
+      <td class="col-num">${{w._edits||0}}</td>
+    </tr>`;
+  }});
 }}
 
 // ── Rendering: Mitigations table ─────────────────────────────────────
 function renderMitigations() {{
+  ensureEnriched();  // sort and row counts need _wcount/_tcount
   const el = document.getElementById('view-mitigations');
-  let items = DB.mitigations.filter(m => matchesSearch(m));
-
-  const sortFns = {{
-    weaknesses: (a,b) => a._wcount - b._wcount,
-    techniques: (a,b) => a._tcount - b._tcount,
-    id:   (a,b) => a.id.localeCompare(b.id),
-    name: (a,b) => a.name.localeCompare(b.name),
-    edits: (a,b) => (a._edits||0) - (b._edits||0),
-  }};
-  const fn = sortFns[S.sf] || sortFns.id;
-  items.sort((a,b) => fn(a,b) * S.sfDir);
+  const viewKey = `m|${{S.search}}|${{S.sf}}|${{S.sfDir}}`;
+  if (viewUnchanged('view-mitigations', viewKey)) return;
+  const items = cachedFilter(viewKey,
+    () => sortedItems('m', DB.mitigations, mSortFns, S.sf, S.sfDir)
+      .filter(m => matchesSearch(m)));
 
   document.getElementById('m-count').textContent = `${{items.length}} shown`;
 
   if (!items.length) {{
+    _vwindows['view-mitigations'] = null;
     el.innerHTML = '<div class="no-results">No mitigations match your search.</div>';
     return;
   }}
@@ -3304,41 +4079,47 @@ function renderMitigations() {{
         <span class="table-section-count">${{items.length}}</span>
         <a href="${{REPO_URL}}/issues/new?template=1c_propose-new-mitigation-form.yml" target="_blank" rel="noopener" class="propose-new-btn">+ Propose New Mitigation</a>
       </div>
-      <table class="attck-table">
-        <thead><tr>
+      <table class="attck-table" style="table-layout:fixed">
+        <thead>${{cachedThead('m:'+S.sf+':'+S.sfDir, () => `<tr>
           ${{sortTh('ID','id','sf','sfDir','width:80px')}}
           ${{sortTh('Name','name','sf','sfDir','')}}
           ${{sortTh('Weaknesses','weaknesses','sf','sfDir','width:100px;text-align:center')}}
           ${{sortTh('Techniques','techniques','sf','sfDir','width:100px;text-align:center')}}
           ${{sortTh('Edits','edits','sf','sfDir','width:55px;text-align:center')}}
-        </tr></thead>
-        <tbody>
-          ${{items.map(m => {{
-            const sel = S.selected && S.selected.id === m.id;
-            return `<tr class="${{sel?'selected':''}}" data-show-id="${{esc(m.id)}}" data-show-type="mitigation">
-              <td><span class="mid">${{esc(m.id)}}</span></td>
-              <td>${{esc(m.name)}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{m._wcount||'—'}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{m._tcount||'—'}}</td>
-              <td style="text-align:center;font-family:var(--font-mono);font-size:.8rem">${{m._edits||0}}</td>
-            </tr>`;
-          }}).join('')}}
-        </tbody>
+        </tr>`)}}</thead>
+        <tbody></tbody>
       </table>
     </div>
   `;
+  setWindowedRows('view-mitigations', items, m => {{
+    if (m._row) return m._row;
+    return m._row = `<tr data-show-id="${{m._idEsc}}" data-show-type="mitigation">
+      <td><span class="mid">${{m._idEsc}}</span></td>
+      <td>${{m._nameEsc}}</td>
+      <td class="col-num">${{m._wcount||'—'}}</td>
+      <td class="col-num">${{m._tcount||'—'}}</td>
+      <td class="col-num">${{m._edits||0}}</td>
+    </tr>`;
+  }});
 }}
 
 // ── Detail panel ─────────────────────────────────────────────────────
+const TYPE_LABEL = {{technique:'Technique', weakness:'Weakness', mitigation:'Mitigation'}};
+const ID_COLOR   = {{technique:'#6eb4ff', weakness:'#f4a839', mitigation:'#4cba7c'}};
+
 function showDetail(id, type, skipHash) {{
+  ensureEnriched();  // detail builders read the escaped-string caches
   // Push current selection onto history before navigating
   if (S.selected) detailHistory.push({{...S.selected}});
   S.selected = {{id, type}};
-  if (!skipHash) history.replaceState(null, '', '#' + id);
+  if (!skipHash && location.hash !== '#' + id) {{
+    history.replaceState(null, '', '#' + id);
+    _lastHash = location.hash;
+  }}
   // The topbar meta (ID + title) is plain selectable text, so it can be copied;
   // dragging a technique is done via the dedicated drag-handle button instead.
   // Any new selection starts in narrow sidebar view; presentation is always an explicit click
-  document.getElementById('detailPanel').classList.remove('expanded', 'present');
+  EL.panel.classList.remove('expanded', 'present');
   if (typeof updateViewButtonTitles === 'function') updateViewButtonTitles();
   updateSelectionHighlights();
   updateBackButton();
@@ -3346,22 +4127,21 @@ function showDetail(id, type, skipHash) {{
   // Reference detail — early return branch
   if (type === 'reference') {{
     const cite = CiteMap[id];
-    if (!window._refMap) renderReferences();
-    const refData = (window._refMap || {{}})[id];
+    const refData = getRefIndex().refMap[id];
     if (!cite && !refData) return;
     const truncName = (cite && cite.text) ? (cite.text.length > 80 ? cite.text.slice(0, 80).replace(/\\s\\S*$/, '') + '...' : cite.text) : id;
-    document.getElementById('dp-id').innerHTML =
-      `<span style="color:#a78bfa">${{esc(id)}}</span>
+    EL.dpId.innerHTML =
+      `<span style="color:#a78bfa">${{escId(id)}}</span>
        <span class="type-label">Reference</span>`;
-    document.getElementById('dp-name').textContent = truncName;
-    document.getElementById('dp-objective').style.display = 'none';
-    document.getElementById('dp-original-objective').style.display = 'none';
+    EL.dpName.textContent = truncName;
+    EL.dpObjective.style.display = 'none';
+    EL.dpOrigObjective.style.display = 'none';
     const refBody2 = buildReferenceDetail(id, refData, cite);
-    document.getElementById('dp-body').innerHTML = refBody2;
+    EL.body.innerHTML = refBody2;
     window._dpFlatHtml = refBody2;
-    if (document.getElementById('detailPanel').classList.contains('expanded')) reorganizeForGrid();
-    document.getElementById('detailPanel').classList.add('open');
-    document.getElementById('mainArea').classList.add('shifted');
+    if (EL.panel.classList.contains('expanded')) reorganizeForGrid();
+    EL.panel.classList.add('open');
+    EL.mainArea.classList.add('shifted');
     document.body.classList.add('panel-open');
     return;
   }}
@@ -3372,17 +4152,17 @@ function showDetail(id, type, skipHash) {{
             : null;
   if (!obj) return;
 
-  const typeLabel = {{technique:'Technique',weakness:'Weakness',mitigation:'Mitigation'}}[type]||type;
-  const idColor   = {{technique:'#6eb4ff',weakness:'#f4a839',mitigation:'#4cba7c'}}[type]||'#6eb4ff';
+  const typeLabel = TYPE_LABEL[type] || type;
+  const idColor   = ID_COLOR[type] || '#6eb4ff';
 
-  document.getElementById('dp-id').innerHTML =
-    `<span style="color:${{idColor}}">${{esc(id)}}</span>
+  EL.dpId.innerHTML =
+    `<span style="color:${{idColor}}">${{escId(id)}}</span>
      <span class="type-label">${{typeLabel}}</span>
      ${{type==='technique' ? statusBadge(techStatus(obj)) : ''}}`;
-  document.getElementById('dp-name').textContent = obj.name || '';
+  EL.dpName.textContent = obj.name || '';
 
-  const dpObj = document.getElementById('dp-objective');
-  const dpOrigObj = document.getElementById('dp-original-objective');
+  const dpObj = EL.dpObjective;
+  const dpOrigObj = EL.dpOrigObjective;
   if (type === 'technique') {{
     const _tobj = T2Obj[id];
     if (_tobj) {{
@@ -3403,13 +4183,13 @@ function showDetail(id, type, skipHash) {{
     dpOrigObj.style.display = 'none';
   }}
 
-  const panel = document.getElementById('detailPanel');
+  const panel = EL.panel;
   // Present mode only makes sense for techniques — clear it when switching away
   if (type !== 'technique') panel.classList.remove('present');
   panel.classList.toggle('type-m', type === 'mitigation');
-  document.getElementById('dpPresent').classList.toggle('hidden', type !== 'technique');
+  EL.dpPresent.classList.toggle('hidden', type !== 'technique');
   // The drag handle only applies to techniques (only they drop into the builder).
-  document.getElementById('dpDrag').classList.toggle('hidden', type !== 'technique');
+  EL.dpDrag.classList.toggle('hidden', type !== 'technique');
 
   let body = '';
 
@@ -3423,16 +4203,16 @@ function showDetail(id, type, skipHash) {{
     body += buildMitigationDetail(obj);
   }}
 
-  document.getElementById('dp-body').innerHTML = body;
+  EL.body.innerHTML = body;
   window._dpFlatHtml = body;
   if (panel.classList.contains('expanded')) reorganizeForGrid();
   panel.classList.add('open');
-  document.getElementById('mainArea').classList.add('shifted');
+  EL.mainArea.classList.add('shifted');
   document.body.classList.add('panel-open');
 }}
 
 function reorganizeForGrid() {{
-  const body = document.getElementById('dp-body');
+  const body = EL.body;
   const buckets = {{'top-left':[], 'top-right':[], c1:[], c2:[], c3:[], bot:[], end:[], hero:[], wm:[], meta:[], refs:[]}};
   [...body.children].forEach(el => {{
     const col = (el.dataset && el.dataset.col) || 'top-left';
@@ -3448,7 +4228,7 @@ function reorganizeForGrid() {{
 }}
 
 function unwrapGrid() {{
-  const body = document.getElementById('dp-body');
+  const body = EL.body;
   if (window._dpFlatHtml != null) body.innerHTML = window._dpFlatHtml;
 }}
 
@@ -3473,7 +4253,7 @@ function githubLinksHtml(item) {{
 }}
 
 function buildCreditsHtml(item) {{
-  let html = '';
+  const parts = [];
   const edits = item._edits || 0;
   const created = item._created || '';
   const modified = item._modified || '';
@@ -3486,157 +4266,176 @@ function buildCreditsHtml(item) {{
     if (edits)    rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Edits</td><td>${{edits}}</td></tr>`;
     if (created)  rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Created</td><td>${{created}}</td></tr>`;
     if (modified) rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Last Modified</td><td>${{modified}}</td></tr>`;
-    html += `<div class="detail-section" data-col="end">
+    parts.push(`<div class="detail-section" data-col="end">
       <div class="detail-section-title">Properties</div>
       ${{rows ? `<table style="font-family:var(--font-mono);font-size:.82rem">${{rows}}</table>` : ''}}
       ${{ghLinks}}
-    </div>`;
+    </div>`);
   }}
   if (!HIDDEN_FIELDS.has('contributors') && contributors.length) {{
-    html += `<div class="detail-section" data-col="end">
+    parts.push(`<div class="detail-section" data-col="end">
       <div class="detail-section-title">Contributors <span class="badge">${{contributors.length}}</span></div>
       <div class="detail-tags">${{contributors.map(n => `<span class="credit-tag" data-person="${{esc(n)}}">${{esc(n)}}</span>`).join('')}}</div>
-    </div>`;
+    </div>`);
   }}
   if (!HIDDEN_FIELDS.has('reviewers') && reviewers.length) {{
-    html += `<div class="detail-section" data-col="end">
+    parts.push(`<div class="detail-section" data-col="end">
       <div class="detail-section-title">Reviewers <span class="badge">${{reviewers.length}}</span></div>
       <div class="detail-tags">${{reviewers.map(n => `<span class="credit-tag" data-person="${{esc(n)}}">${{esc(n)}}</span>`).join('')}}</div>
-    </div>`;
+    </div>`);
   }}
-  return html;
+  return parts.join('');
+}}
+
+// Shared builders for the repeated detail-panel list rows. The detail
+// pipeline is string-based end to end (dp-body innerHTML, _dpFlatHtml,
+// reorganizeForGrid), so these stay string templates — but each skeleton is
+// now written once instead of inline at every list site.
+function techniqueDetailRow(tid) {{
+  const t = TMap[tid];
+  return `<div class="detail-row" data-show-id="${{escId(tid)}}" data-show-type="technique">
+          <span class="detail-row-id t">${{escId(tid)}}</span>
+          <span class="detail-row-name">${{t ? t._nameEsc : escId(tid)}}</span>
+        </div>`;
+}}
+
+function weaknessDetailRow(wid) {{
+  const w = WMap[wid];
+  const cats = w ? wCats(w) : [];
+  const wpfx = w && w._extension_prefix ? w._extension_prefix : '';
+  const wsfx = w && w._extension_suffix ? w._extension_suffix : '';
+  const mcount = w ? w._mitCount : 0;
+  return `<div class="detail-row" data-show-id="${{escId(wid)}}" data-show-type="weakness">
+          <span class="detail-row-id w">${{escId(wid)}}</span>
+          <span class="detail-row-name">
+            ${{wpfx}}${{w ? w._nameEsc : escId(wid)}}${{wsfx}}
+            <span class="badge" title="${{mcount}} mitigation${{mcount===1?'':'s'}}">${{mcount}}</span>
+            ${{cats.length ? `<br><small style="color:var(--gray-500)">${{cats.map(c=>c.replace('ASTM_','')).join(', ')}}</small>` : ''}}
+          </span>
+        </div>`;
 }}
 
 function buildTechniqueDetail(t) {{
-  let html = updateBtn('technique', t);
+  // The panel has no per-open dynamic state and DB is immutable, so the
+  // built HTML is cached on the item — back/forward navigation and repeat
+  // opens reuse it
+  if (t._detailHtml) return t._detailHtml;
+  const parts = [updateBtn('technique', t)];
 
   if (!HIDDEN_FIELDS.has('description')) {{
-    html += `<div class="detail-section" data-col="top-left">
+    parts.push(`<div class="detail-section" data-col="top-left">
       <div class="detail-section-title">Description</div>
       ${{t.description ? `<div class="detail-text">${{resolveInlineCites(t.description)}}</div>` : '<div class="empty-message">No description.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   if (!HIDDEN_FIELDS.has('details')) {{
-    html += `<div class="detail-section" data-col="top-left">
+    parts.push(`<div class="detail-section" data-col="top-left">
       <div class="detail-section-title">Details</div>
       ${{t.details ? `<div class="detail-text">${{resolveInlineCites(t.details)}}</div>` : '<div class="empty-message">No details.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   if (!HIDDEN_FIELDS.has('synonyms')) {{
     const syns = t.synonyms || [];
-    html += `<div class="detail-section" data-col="c1">
+    parts.push(`<div class="detail-section" data-col="c1">
       <div class="detail-section-title">Also Known As <span class="badge">${{syns.length}}</span></div>
       ${{syns.length ? `<div class="detail-tags">${{syns.map(s=>`<span class="detail-tag">${{esc(s)}}</span>`).join('')}}</div>` : '<div class="empty-message">No synonyms.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   // Sub-techniques
   if (!HIDDEN_FIELDS.has('subtechniques')) {{
     const subs = t.subtechniques || [];
-    html += `<div class="detail-section" data-col="c1">
+    parts.push(`<div class="detail-section" data-col="c1">
       <div class="detail-section-title">Sub-techniques <span class="badge">${{subs.length}}</span></div>
       ${{!subs.length ? '<div class="empty-message">No sub-techniques.</div>' : ''}}
       <div class="detail-list">
         ${{subs.map(sid => {{
           const st = TMap[sid];
-          return `<div class="detail-row" data-show-id="${{esc(sid)}}" data-show-type="technique">
-            <span class="tech-cell-sub" style="font-size:.72rem;padding:2px 8px;min-width:52px;text-align:center">${{esc(sid)}}</span>
+          return `<div class="detail-row" data-show-id="${{escId(sid)}}" data-show-type="technique">
+            <span class="tech-cell-sub" style="font-size:.72rem;padding:2px 8px;min-width:52px;text-align:center">${{escId(sid)}}</span>
             <span class="detail-row-name">${{esc(st ? st.name : sid)}}</span>
           </div>`;
         }}).join('')}}
       </div>
-    </div>`;
+    </div>`);
   }}
 
   if (!HIDDEN_FIELDS.has('examples')) {{
     const exs = t.examples || [];
-    html += `<div class="detail-section" data-col="c1">
+    parts.push(`<div class="detail-section" data-col="c1">
       <div class="detail-section-title">Examples <span class="badge">${{exs.length}}</span></div>
       ${{exs.length ? exs.map(e=>`<div class="detail-text" style="padding:3px 0;border-bottom:1px solid #f0f0f0">${{esc(e)}}</div>`).join('') : '<div class="empty-message">No examples.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   // Potential Weaknesses
   if (!HIDDEN_FIELDS.has('weaknesses')) {{
     const wids = t.weaknesses || [];
-    html += `<div class="detail-section" data-col="c2">
+    parts.push(`<div class="detail-section" data-col="c2">
       <div class="detail-section-title">Potential Weaknesses <span class="badge">${{wids.length}}</span></div>
       ${{!wids.length ? '<div class="empty-message">No weaknesses documented.</div>' : ''}}
       <div class="detail-list">
-        ${{wids.map(wid => {{
-          const w = WMap[wid];
-          const cats = w ? wCats(w) : [];
-          const wpfx = w && w._extension_prefix ? w._extension_prefix : '';
-          const wsfx = w && w._extension_suffix ? w._extension_suffix : '';
-          const mcount = (w && w.mitigations) ? w.mitigations.length : 0;
-          return `<div class="detail-row" data-show-id="${{esc(wid)}}" data-show-type="weakness">
-            <span class="detail-row-id w">${{esc(wid)}}</span>
-            <span class="detail-row-name">
-              ${{wpfx}}${{w ? esc(w.name) : esc(wid)}}${{wsfx}}
-              <span class="badge" title="${{mcount}} mitigation${{mcount===1?'':'s'}}">${{mcount}}</span>
-              ${{cats.length ? `<br><small style="color:var(--gray-500)">${{cats.map(c=>c.replace('ASTM_','')).join(', ')}}</small>` : ''}}
-            </span>
-          </div>`;
-        }}).join('')}}
+        ${{wids.map(weaknessDetailRow).join('')}}
       </div>
-    </div>`;
+    </div>`);
   }}
 
   if (!HIDDEN_FIELDS.has('CASE_input_classes')) {{
     const cin = t.CASE_input_classes || [];
-    html += `<div class="detail-section" data-col="top-right">
+    parts.push(`<div class="detail-section" data-col="top-right">
       <div class="detail-section-title">CASE Input Classes <span class="badge">${{cin.length}}</span></div>
       ${{cin.length ? `<div class="detail-tags">${{cin.map(c=>`<a href="${{esc(c)}}" target="_blank" rel="noopener" class="detail-tag case-tag">${{esc(c)}}</a>`).join('')}}</div>` : '<div class="empty-message">No CASE input classes.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   if (!HIDDEN_FIELDS.has('CASE_output_classes')) {{
     const cout = t.CASE_output_classes || [];
-    html += `<div class="detail-section" data-col="top-right">
+    parts.push(`<div class="detail-section" data-col="top-right">
       <div class="detail-section-title">CASE Output Classes <span class="badge">${{cout.length}}</span></div>
       ${{cout.length ? `<div class="detail-tags">${{cout.map(c=>`<a href="${{esc(c)}}" target="_blank" rel="noopener" class="detail-tag case-tag">${{esc(c)}}</a>`).join('')}}</div>` : '<div class="empty-message">No CASE output classes.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   // References
   if (!HIDDEN_FIELDS.has('references')) {{
     const refs = t.references || [];
-    html += `<div class="detail-section" data-col="bot">
+    parts.push(`<div class="detail-section" data-col="bot">
       <div class="detail-section-title">References <span style="text-transform:none">(DFCites)</span> <span class="badge">${{refs.length}}</span></div>
       ${{refs.length ? refs.map(r => renderRef(r, 'technique', t.id)).join('') : '<div class="empty-message">No references.</div>'}}
-    </div>`;
+    </div>`);
   }}
 
   // SOLVE-IT-X extension content
   if (t._extension_html) {{
-    html += `<div class="detail-section" data-col="bot">
+    parts.push(`<div class="detail-section" data-col="bot">
       <div class="detail-section-title">SOLVE-IT-X</div>
       <div class="detail-text">${{t._extension_html}}</div>
-    </div>`;
+    </div>`);
   }}
 
-  html += buildCreditsHtml(t);
+  parts.push(buildCreditsHtml(t));
 
-  return html;
+  return t._detailHtml = parts.join('');
 }}
 
 function buildWeaknessDetail(w) {{
-  let html = updateBtn('weakness', w);
+  if (w._detailHtml) return w._detailHtml;
+  const parts = [updateBtn('weakness', w)];
 
   const cats = wCats(w);
-  const tids = IDX.weakness_to_techniques[w.id] || [];
+  const tids = w._tids || [];
   const mids = w.mitigations || [];
 
   // Hero: categories + summary stats
-  html += `<div class="detail-section" data-col="top-left">
+  parts.push(`<div class="detail-section" data-col="top-left">
     <div class="detail-section-title">Error Categories <span class="badge">${{cats.length}}</span></div>
     ${{cats.length ? `<div class="cat-grid">
       ${{cats.map(c => `<span class="cat-tag" style="font-size:.78rem;padding:4px 10px" title="${{esc(c)}}">${{esc(c.replace('ASTM_',''))}}<br><small style="font-weight:400;font-family:var(--font-body)">${{esc(CAT_LABELS[c]||'')}}</small></span>`).join('')}}
     </div>` : '<div class="empty-message">No error categories.</div>'}}
     <div class="detail-hero-stats">Affects <strong>${{tids.length}}</strong> technique${{tids.length===1?'':'s'}} · Addressed by <strong>${{mids.length}}</strong> mitigation${{mids.length===1?'':'s'}} · <strong>${{cats.length}}</strong> ASTM categor${{cats.length===1?'y':'ies'}}</div>
-  </div>`;
+  </div>`);
 
   // Stats / metadata card at top-right
   const edits = w._edits || 0;
@@ -3649,29 +4448,29 @@ function buildWeaknessDetail(w) {{
     if (modified) rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Last Modified</td><td>${{modified}}</td></tr>`;
     rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Techniques</td><td>${{tids.length}}</td></tr>`;
     rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Mitigations</td><td>${{mids.length}}</td></tr>`;
-    html += `<div class="detail-section" data-col="top-right">
+    parts.push(`<div class="detail-section" data-col="top-right">
       <div class="detail-section-title">Summary</div>
       <table style="font-family:var(--font-mono);font-size:.82rem">${{rows}}</table>
-    </div>`;
+    </div>`);
   }}
 
   // Techniques that include this weakness
-  html += `<div class="detail-section" data-col="c1">
+  parts.push(`<div class="detail-section" data-col="c1">
     <div class="detail-section-title">Techniques <span class="badge">${{tids.length}}</span></div>
     ${{!tids.length ? '<div class="empty-message">No techniques reference this weakness.</div>' : ''}}
     <div class="detail-list">
       ${{tids.map(tid => {{
         const t = TMap[tid];
-        return `<div class="detail-row" data-show-id="${{esc(tid)}}" data-show-type="technique">
-          <span class="detail-row-id t">${{esc(tid)}}</span>
+        return `<div class="detail-row" data-show-id="${{escId(tid)}}" data-show-type="technique">
+          <span class="detail-row-id t">${{escId(tid)}}</span>
           <span class="detail-row-name">${{esc(t ? t.name : tid)}}</span>
         </div>`;
       }}).join('')}}
     </div>
-  </div>`;
+  </div>`);
 
   // Mitigations — with inline technique-link badge
-  html += `<div class="detail-section" data-col="c2">
+  parts.push(`<div class="detail-section" data-col="c2">
     <div class="detail-section-title">Mitigations <span class="badge">${{mids.length}}</span></div>
     ${{!mids.length ? '<div class="empty-message">No mitigations documented.</div>' : ''}}
     <div class="detail-list">
@@ -3681,8 +4480,8 @@ function buildWeaknessDetail(w) {{
         const msfx = m && m._extension_suffix ? m._extension_suffix : '';
         const mtid = m && m.technique ? m.technique : '';
         const mtname = mtid && TMap[mtid] ? TMap[mtid].name : '';
-        return `<div class="detail-row" data-show-id="${{esc(mid)}}" data-show-type="mitigation">
-          <span class="detail-row-id m">${{esc(mid)}}</span>
+        return `<div class="detail-row" data-show-id="${{escId(mid)}}" data-show-type="mitigation">
+          <span class="detail-row-id m">${{escId(mid)}}</span>
           <span class="detail-row-name">
             ${{mpfx}}${{esc(m ? m.name : mid)}}${{msfx}}
             ${{mtid ? `<br><small style="color:var(--gray-500)">via <span style="font-family:var(--font-mono);color:var(--blue);font-weight:600">${{esc(mtid)}}</span> ${{esc(mtname)}}</small>` : ''}}
@@ -3690,46 +4489,45 @@ function buildWeaknessDetail(w) {{
         </div>`;
       }}).join('')}}
     </div>
-  </div>`;
+  </div>`);
 
   const wrefs = w.references || [];
-  html += `<div class="detail-section" data-col="bot">
+  parts.push(`<div class="detail-section" data-col="bot">
     <div class="detail-section-title">References <span style="text-transform:none">(DFCites)</span> <span class="badge">${{wrefs.length}}</span></div>
     ${{wrefs.length ? wrefs.map(r => renderRef(r, 'weakness', w.id)).join('') : '<div class="empty-message">No references.</div>'}}
-  </div>`;
+  </div>`);
 
   // SOLVE-IT-X extension content
   if (w._extension_html) {{
-    html += `<div class="detail-section" data-col="bot">
+    parts.push(`<div class="detail-section" data-col="bot">
       <div class="detail-section-title">SOLVE-IT-X</div>
       <div class="detail-text">${{w._extension_html}}</div>
-    </div>`;
+    </div>`);
   }}
 
-  html += buildCreditsHtml(w);
+  parts.push(buildCreditsHtml(w));
 
-  return html;
+  return w._detailHtml = parts.join('');
 }}
 
 function buildMitigationDetail(m) {{
-  let html = updateBtn('mitigation', m);
+  if (m._detailHtml) return m._detailHtml;
+  const parts = [updateBtn('mitigation', m)];
 
-  // Pre-compute counts for hero + stats
-  const wids = IDX.mitigation_to_weaknesses[m.id] || [];
-  const tset = new Set();
-  wids.forEach(wid => (IDX.weakness_to_techniques[wid]||[]).forEach(tid => tset.add(tid)));
-  const tids = Array.from(tset);
+  // Counts and the id lists were precomputed at enrichment
+  const wids = m._wids || [];
+  const tids = m._applies_to || [];
   const mtechName = m.technique && TMap[m.technique] ? TMap[m.technique].name : '';
 
   // Hero (top-left, spans 2 cols in CSS): Implemented By + stats summary
-  html += `<div class="detail-section" data-col="top-left">
+  parts.push(`<div class="detail-section" data-col="top-left">
     <div class="detail-section-title">Implemented By Technique</div>
     ${{m.technique ? `<div class="detail-hero-tech" data-show-id="${{esc(m.technique)}}" data-show-type="technique">
       <span class="hero-tech-id">${{esc(m.technique)}}</span>
       <span class="hero-tech-name">${{esc(mtechName || m.technique)}}</span>
     </div>` : '<div class="empty-message">No linked technique.</div>'}}
     <div class="detail-hero-stats">Addresses <strong>${{wids.length}}</strong> weakness${{wids.length===1?'':'es'}} · Applies to <strong>${{tids.length}}</strong> technique${{tids.length===1?'':'s'}}</div>
-  </div>`;
+  </div>`);
 
   // Stats / metadata card at top-right
   const edits = m._edits || 0;
@@ -3742,14 +4540,14 @@ function buildMitigationDetail(m) {{
     if (modified) rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Last Modified</td><td>${{modified}}</td></tr>`;
     rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Weaknesses</td><td>${{wids.length}}</td></tr>`;
     rows += `<tr><td style="color:var(--gray-500);padding:2px 12px 2px 0">Techniques</td><td>${{tids.length}}</td></tr>`;
-    html += `<div class="detail-section" data-col="top-right">
+    parts.push(`<div class="detail-section" data-col="top-right">
       <div class="detail-section-title">Summary</div>
       <table style="font-family:var(--font-mono);font-size:.82rem">${{rows}}</table>
-    </div>`;
+    </div>`);
   }}
 
   // Weaknesses addressed (wide — c1 spans 2 cols under .type-m grid swap)
-  html += `<div class="detail-section" data-col="c1">
+  parts.push(`<div class="detail-section" data-col="c1">
     <div class="detail-section-title">Weaknesses Addressed <span class="badge">${{wids.length}}</span></div>
     ${{!wids.length ? '<div class="empty-message">No weaknesses reference this mitigation.</div>' : ''}}
     <div class="detail-list">
@@ -3758,9 +4556,9 @@ function buildMitigationDetail(m) {{
         const cats = w ? wCats(w) : [];
         const wpfx = w && w._extension_prefix ? w._extension_prefix : '';
         const wsfx = w && w._extension_suffix ? w._extension_suffix : '';
-        const mcount = (w && w.mitigations) ? w.mitigations.length : 0;
-        return `<div class="detail-row" data-show-id="${{esc(wid)}}" data-show-type="weakness">
-          <span class="detail-row-id w">${{esc(wid)}}</span>
+        const mcount = w ? w._mitCount : 0;
+        return `<div class="detail-row" data-show-id="${{escId(wid)}}" data-show-type="weakness">
+          <span class="detail-row-id w">${{escId(wid)}}</span>
           <span class="detail-row-name">
             ${{wpfx}}${{esc(w ? w.name : wid)}}${{wsfx}}
             <span class="badge" title="${{mcount}} mitigation${{mcount===1?'':'s'}}">${{mcount}}</span>
@@ -3769,45 +4567,46 @@ function buildMitigationDetail(m) {{
         </div>`;
       }}).join('')}}
     </div>
-  </div>`;
+  </div>`);
 
   // Applies To Techniques (narrow — c2)
-  html += `<div class="detail-section" data-col="c2">
+  parts.push(`<div class="detail-section" data-col="c2">
     <div class="detail-section-title">Applies To Techniques <span class="badge">${{tids.length}}</span></div>
     ${{!tids.length ? '<div class="empty-message">No techniques.</div>' : ''}}
     <div class="detail-list">
       ${{tids.map(tid => {{
         const t = TMap[tid];
-        return `<div class="detail-row" data-show-id="${{esc(tid)}}" data-show-type="technique">
-          <span class="detail-row-id t">${{esc(tid)}}</span>
+        return `<div class="detail-row" data-show-id="${{escId(tid)}}" data-show-type="technique">
+          <span class="detail-row-id t">${{escId(tid)}}</span>
           <span class="detail-row-name">${{esc(t ? t.name : tid)}}</span>
         </div>`;
       }}).join('')}}
     </div>
-  </div>`;
+  </div>`);
 
   const mrefs = m.references || [];
-  html += `<div class="detail-section" data-col="bot">
+  parts.push(`<div class="detail-section" data-col="bot">
     <div class="detail-section-title">References <span style="text-transform:none">(DFCites)</span> <span class="badge">${{mrefs.length}}</span></div>
     ${{mrefs.length ? mrefs.map(r => renderRef(r, 'mitigation', m.id)).join('') : '<div class="empty-message">No references.</div>'}}
-  </div>`;
+  </div>`);
 
   // SOLVE-IT-X extension content
   if (m._extension_html) {{
-    html += `<div class="detail-section" data-col="bot">
+    parts.push(`<div class="detail-section" data-col="bot">
       <div class="detail-section-title">SOLVE-IT-X</div>
       <div class="detail-text">${{m._extension_html}}</div>
-    </div>`;
+    </div>`);
   }}
 
-  html += buildCreditsHtml(m);
+  parts.push(buildCreditsHtml(m));
 
-  return html;
+  return m._detailHtml = parts.join('');
 }}
 
 /* Presentation (slide screenshot) builder for techniques.
    Layout: left hero (description + AKA + sub-techs + CASE I/O), right weakness→mitigation tree, bottom refs + meta. */
 function buildTechniquePresentationDetail(t) {{
+  if (t._presentHtml) return t._presentHtml;
   const MAX_MITS_PER_WEAKNESS = 6;
   const wids = t.weaknesses || [];
   const refs = t.references || [];
@@ -3849,8 +4648,8 @@ function buildTechniquePresentationDetail(t) {{
       <div class="detail-list">
         ${{subs.map(sid => {{
           const st = TMap[sid];
-          return `<div class="detail-row" data-show-id="${{esc(sid)}}" data-show-type="technique">
-            <span class="tech-cell-sub" style="font-size:.72rem;padding:2px 8px;min-width:52px;text-align:center">${{esc(sid)}}</span>
+          return `<div class="detail-row" data-show-id="${{escId(sid)}}" data-show-type="technique">
+            <span class="tech-cell-sub" style="font-size:.72rem;padding:2px 8px;min-width:52px;text-align:center">${{escId(sid)}}</span>
             <span class="detail-row-name">${{esc(st ? st.name : sid)}}</span>
           </div>`;
         }}).join('')}}
@@ -3922,10 +4721,10 @@ function buildTechniquePresentationDetail(t) {{
         const shown = mids.slice(0, MAX_MITS_PER_WEAKNESS);
         const overflow = mids.length - shown.length;
         return `<div class="wm-group">
-          <div class="wm-weakness" data-show-id="${{esc(wid)}}" data-show-type="weakness">
-            <span class="wm-weakness-id">${{esc(wid)}}</span>
+          <div class="wm-weakness" data-show-id="${{escId(wid)}}" data-show-type="weakness">
+            <span class="wm-weakness-id">${{escId(wid)}}</span>
             <span class="wm-weakness-name">
-              ${{wpfx}}${{w ? esc(w.name) : esc(wid)}}${{wsfx}}
+              ${{wpfx}}${{w ? w._nameEsc : escId(wid)}}${{wsfx}}
               ${{cats.length ? `<span class="wm-weakness-cats">[${{cats.map(c=>c.replace('ASTM_','')).join(', ')}}]</span>` : ''}}
             </span>
           </div>
@@ -3935,8 +4734,8 @@ function buildTechniquePresentationDetail(t) {{
               const m = MMap[mid];
               const mpfx = m && m._extension_prefix ? m._extension_prefix : '';
               const msfx = m && m._extension_suffix ? m._extension_suffix : '';
-              return `<div class="wm-mit" data-show-id="${{esc(mid)}}" data-show-type="mitigation">
-                <span class="wm-mit-id">${{esc(mid)}}</span>
+              return `<div class="wm-mit" data-show-id="${{escId(mid)}}" data-show-type="mitigation">
+                <span class="wm-mit-id">${{escId(mid)}}</span>
                 <span class="wm-mit-name">${{mpfx}}${{esc(m ? m.name : mid)}}${{msfx}}</span>
               </div>`;
             }}).join('')}}
@@ -3971,7 +4770,7 @@ function buildTechniquePresentationDetail(t) {{
     </div>`;
   }}
 
-  return html;
+  return t._presentHtml = html;
 }}
 
 function citeSearchQuery(citeId) {{
@@ -4006,10 +4805,10 @@ function findRelevance(entityType, entityId, citeId) {{
 }}
 
 function buildReferenceDetail(citeId, refData, cite) {{
-  let html = '';
+  const parts = [];
 
   // Action buttons
-  html += `<div class="detail-section" style="padding:12px 18px;display:flex;align-items:center;gap:12px;flex-wrap:wrap">`;
+  parts.push(`<div class="detail-section" style="padding:12px 18px;display:flex;align-items:center;gap:12px;flex-wrap:wrap">`);
   if (!CUSTOM_MODE) {{
     const _up = new URLSearchParams();
     _up.set('template', '2d_update-reference-form.yml');
@@ -4028,38 +4827,38 @@ function buildReferenceDetail(citeId, refData, cite) {{
       }});
       if (citeLines.length) _up.set('cite-in-items', citeLines.join('\\n'));
     }}
-    html += `<a href="${{REPO_URL}}/issues/new?${{_up.toString()}}" target="_blank" rel="noopener" class="propose-update-btn" style="background:#a78bfa">&#9998; Update this DFCite</a>`;
+    parts.push(`<a href="${{REPO_URL}}/issues/new?${{_up.toString()}}" target="_blank" rel="noopener" class="propose-update-btn" style="background:#a78bfa">&#9998; Update this DFCite</a>`);
   }}
   const srcExt = (cite && cite.txt) ? '.txt' : (cite && cite.bib) ? '.bib' : '.txt';
-  html += `<a href="${{REPO_URL}}/blob/main/data/references/${{encodeURIComponent(citeId)}}${{srcExt}}" target="_blank" rel="noopener" class="view-source-btn">View source in GitHub</a>`;
-  html += `</div>`;
+  parts.push(`<a href="${{REPO_URL}}/blob/main/data/references/${{encodeURIComponent(citeId)}}${{srcExt}}" target="_blank" rel="noopener" class="view-source-btn">View source in GitHub</a>`);
+  parts.push(`</div>`);
 
   // Action pills
-  html += `<div class="detail-section"><div class="ref-detail-actions">`;
-  html += `<span class="ref-action-btn" onclick="copyCite('${{esc(citeId)}}','txt')" title="Copy plaintext citation">&#128203; Copy text</span>`;
+  parts.push(`<div class="detail-section"><div class="ref-detail-actions">`);
+  parts.push(`<span class="ref-action-btn" onclick="copyCite('${{escId(citeId)}}','txt')" title="Copy plaintext citation">&#128203; Copy text</span>`);
   if (cite && cite.bib) {{
-    html += `<span class="ref-action-btn" onclick="copyCite('${{esc(citeId)}}','bib')" title="Copy BibTeX">&#128218; Copy BibTeX</span>`;
+    parts.push(`<span class="ref-action-btn" onclick="copyCite('${{escId(citeId)}}','bib')" title="Copy BibTeX">&#128218; Copy BibTeX</span>`);
   }} else {{
-    html += `<span class="ref-action-btn" style="opacity:.35;cursor:not-allowed;pointer-events:none" title="No BibTeX available">&#128218; Copy BibTeX</span>`;
+    parts.push(`<span class="ref-action-btn" style="opacity:.35;cursor:not-allowed;pointer-events:none" title="No BibTeX available">&#128218; Copy BibTeX</span>`);
   }}
-  html += `<a class="ref-action-btn" href="${{googleUrl(citeId)}}" target="_blank" rel="noopener" title="Search Google">&#128270; Google</a>`;
-  html += `<a class="ref-action-btn" href="${{scholarUrl(citeId)}}" target="_blank" rel="noopener" title="Search Google Scholar">&#127891; Google Scholar</a>`;
-  html += `</div></div>`;
+  parts.push(`<a class="ref-action-btn" href="${{googleUrl(citeId)}}" target="_blank" rel="noopener" title="Search Google">&#128270; Google</a>`);
+  parts.push(`<a class="ref-action-btn" href="${{scholarUrl(citeId)}}" target="_blank" rel="noopener" title="Search Google Scholar">&#127891; Google Scholar</a>`);
+  parts.push(`</div></div>`);
 
   // Citation text
-  html += `<div class="detail-section">
+  parts.push(`<div class="detail-section">
     <div class="detail-section-title">Citation Text</div>
     ${{refData && refData.text ? `<div class="detail-text">${{linkify(refData.text)}}</div>` : '<div class="empty-message">No citation text available.</div>'}}
-  </div>`;
+  </div>`);
 
   // Raw BibTeX
   if (cite && cite.raw_bib) {{
     const bibId = 'bib-' + citeId.replace(/[^a-zA-Z0-9_-]/g, '');
-    html += `<div class="detail-section">
+    parts.push(`<div class="detail-section">
       <div class="detail-section-title">BibTeX</div>
       <div class="ref-bibtex-toggle" onclick="document.getElementById('${{bibId}}').classList.toggle('open');this.textContent=document.getElementById('${{bibId}}').classList.contains('open')?'Hide BibTeX':'Show BibTeX'">Show BibTeX</div>
       <pre class="ref-bibtex-pre" id="${{bibId}}">${{esc(cite.raw_bib)}}</pre>
-    </div>`;
+    </div>`);
   }}
 
   // Cited by sections
@@ -4070,7 +4869,7 @@ function buildReferenceDetail(citeId, refData, cite) {{
   ];
   types.forEach(([plural, singular, label, map, cls]) => {{
     const ids = refData ? (refData[plural] || []) : [];
-    html += `<div class="detail-section">
+    parts.push(`<div class="detail-section">
       <div class="detail-section-title">Cited By: ${{label}} <span class="badge">${{ids.length}}</span></div>
       ${{!ids.length ? '<div class="empty-message">Not cited by any ' + label.toLowerCase() + '.</div>' : ''}}
       <div class="detail-list">
@@ -4079,8 +4878,8 @@ function buildReferenceDetail(citeId, refData, cite) {{
           const rel = findRelevance(singular, eid, citeId);
           const editUrl = !CUSTOM_MODE ? dfciteRelevanceFormUrl(singular, eid, {{DFCite_id: citeId, relevance_summary_280: rel}}) : '';
           const editLink = editUrl ? `<a href="${{editUrl}}" target="_blank" rel="noopener" title="Update relevance summary" style="font-size:.72rem;color:var(--gray-300);text-decoration:none;cursor:pointer;margin-left:6px;font-style:normal">[edit]</a>` : '';
-          return `<div class="detail-row" data-show-id="${{esc(eid)}}" data-show-type="${{singular}}">
-            <span class="detail-row-id ${{cls}}">${{esc(eid)}}</span>
+          return `<div class="detail-row" data-show-id="${{escId(eid)}}" data-show-type="${{singular}}">
+            <span class="detail-row-id ${{cls}}">${{escId(eid)}}</span>
             <span class="detail-row-name">${{esc(entity ? entity.name : eid)}}
               ${{rel
                 ? `<br><small style="font-style:italic;color:var(--green)">Relevance: ${{esc(rel)}}</small>${{editLink}}`
@@ -4090,19 +4889,22 @@ function buildReferenceDetail(citeId, refData, cite) {{
           </div>`;
         }}).join('')}}
       </div>
-    </div>`;
+    </div>`);
   }});
 
-  return html;
+  return parts.join('');
 }}
 
 function closeDetail(skipHash) {{
   S.selected = null;
   detailHistory.length = 0;
-  document.getElementById('detailPanel').classList.remove('open');
-  document.getElementById('mainArea').classList.remove('shifted');
+  EL.panel.classList.remove('open');
+  EL.mainArea.classList.remove('shifted');
   document.body.classList.remove('panel-open');
-  if (!skipHash) history.replaceState(null, '', location.pathname);
+  if (!skipHash && location.hash) {{
+    history.replaceState(null, '', location.pathname);
+    _lastHash = location.hash;
+  }}
   updateSelectionHighlights();
   updateBackButton();
 }}
@@ -4113,7 +4915,7 @@ function goBack() {{
   // Navigate without pushing to history (avoid showDetail's push)
   S.selected = prev;
   // Back-navigation also returns to narrow sidebar
-  document.getElementById('detailPanel').classList.remove('expanded', 'present');
+  EL.panel.classList.remove('expanded', 'present');
   if (typeof updateViewButtonTitles === 'function') updateViewButtonTitles();
   updateSelectionHighlights();
   updateBackButton();
@@ -4121,20 +4923,19 @@ function goBack() {{
   // Reference goBack — early return branch
   if (prev.type === 'reference') {{
     const cite = CiteMap[prev.id];
-    if (!window._refMap) renderReferences();
-    const refData = (window._refMap || {{}})[prev.id];
+    const refData = getRefIndex().refMap[prev.id];
     if (!cite && !refData) return;
     const truncName = (cite && cite.text) ? (cite.text.length > 80 ? cite.text.slice(0, 80).replace(/\\s\\S*$/, '') + '...' : cite.text) : prev.id;
-    document.getElementById('dp-id').innerHTML =
-      `<span style="color:#a78bfa">${{esc(prev.id)}}</span>
+    EL.dpId.innerHTML =
+      `<span style="color:#a78bfa">${{escId(prev.id)}}</span>
        <span class="type-label">Reference</span>`;
-    document.getElementById('dp-name').textContent = truncName;
-    document.getElementById('dp-objective').style.display = 'none';
-    document.getElementById('dp-original-objective').style.display = 'none';
+    EL.dpName.textContent = truncName;
+    EL.dpObjective.style.display = 'none';
+    EL.dpOrigObjective.style.display = 'none';
     const refBody = buildReferenceDetail(prev.id, refData, cite);
-    document.getElementById('dp-body').innerHTML = refBody;
+    EL.body.innerHTML = refBody;
     window._dpFlatHtml = refBody;
-    if (document.getElementById('detailPanel').classList.contains('expanded')) reorganizeForGrid();
+    if (EL.panel.classList.contains('expanded')) reorganizeForGrid();
     return;
   }}
 
@@ -4144,16 +4945,16 @@ function goBack() {{
             : null;
   if (!obj) return;
 
-  const typeLabel = {{technique:'Technique',weakness:'Weakness',mitigation:'Mitigation'}}[prev.type]||prev.type;
-  const idColor   = {{technique:'#6eb4ff',weakness:'#f4a839',mitigation:'#4cba7c'}}[prev.type]||'#6eb4ff';
-  document.getElementById('dp-id').innerHTML =
-    `<span style="color:${{idColor}}">${{esc(prev.id)}}</span>
+  const typeLabel = TYPE_LABEL[prev.type] || prev.type;
+  const idColor   = ID_COLOR[prev.type] || '#6eb4ff';
+  EL.dpId.innerHTML =
+    `<span style="color:${{idColor}}">${{escId(prev.id)}}</span>
      <span class="type-label">${{typeLabel}}</span>
      ${{prev.type==='technique' ? statusBadge(techStatus(obj)) : ''}}`;
-  document.getElementById('dp-name').textContent = obj.name || '';
+  EL.dpName.textContent = obj.name || '';
 
-  const dpObj2 = document.getElementById('dp-objective');
-  const dpOrigObj2 = document.getElementById('dp-original-objective');
+  const dpObj2 = EL.dpObjective;
+  const dpOrigObj2 = EL.dpOrigObjective;
   if (prev.type === 'technique') {{
     const _tobj = T2Obj[prev.id];
     if (_tobj) {{
@@ -4174,95 +4975,122 @@ function goBack() {{
     dpOrigObj2.style.display = 'none';
   }}
 
-  const panel = document.getElementById('detailPanel');
+  const panel = EL.panel;
   if (prev.type !== 'technique') panel.classList.remove('present');
   panel.classList.toggle('type-m', prev.type === 'mitigation');
-  document.getElementById('dpPresent').classList.toggle('hidden', prev.type !== 'technique');
+  EL.dpPresent.classList.toggle('hidden', prev.type !== 'technique');
 
   let body = '';
   if (prev.type === 'technique' && panel.classList.contains('present')) body = buildTechniquePresentationDetail(obj);
   else if (prev.type === 'technique') body = buildTechniqueDetail(obj);
   else if (prev.type === 'weakness') body = buildWeaknessDetail(obj);
   else if (prev.type === 'mitigation') body = buildMitigationDetail(obj);
-  document.getElementById('dp-body').innerHTML = body;
+  EL.body.innerHTML = body;
   window._dpFlatHtml = body;
   if (panel.classList.contains('expanded')) reorganizeForGrid();
 }}
 
 function updateBackButton() {{
-  document.getElementById('dpBack').classList.toggle('hidden', detailHistory.length === 0);
+  EL.dpBack.classList.toggle('hidden', detailHistory.length === 0);
 }}
 
 function updateSelectionHighlights() {{
-  // Matrix cells
-  document.querySelectorAll('.tech-cell').forEach(el => {{
-    el.classList.toggle('selected',
-      S.selected && S.selected.type === 'technique' && el.dataset.id === S.selected.id);
-  }});
-  // Table rows
-  document.querySelectorAll('[data-wid]').forEach(el => {{
-    el.classList.toggle('selected',
-      S.selected && S.selected.type === 'weakness' && el.dataset.wid === S.selected.id);
-  }});
-  // Reference rows
-  document.querySelectorAll('tr[data-show-type="reference"]').forEach(el => {{
-    el.classList.toggle('selected',
-      S.selected && S.selected.type === 'reference' && el.dataset.showId === S.selected.id);
-  }});
+  // Clear whatever is highlighted, then mark the new selection — touching
+  // only the affected nodes instead of sweeping every cell and row
+  document.querySelectorAll('.tech-cell.selected, tr.selected[data-show-id]')
+    .forEach(el => el.classList.remove('selected'));
+  if (!S.selected) return;
+  const id = CSS.escape(S.selected.id);
+  if (S.selected.type === 'technique') {{
+    document.querySelectorAll(`.tech-cell[data-id="${{id}}"]`)
+      .forEach(el => el.classList.add('selected'));
+  }}
+  const row = document.querySelector(
+    `tr[data-show-id="${{id}}"][data-show-type="${{S.selected.type}}"]`);
+  if (row) row.classList.add('selected');
 }}
 
 // ── Rendering: References table ─────────────────────────────────────
+const URL_RE = /(https?:\\/\\/[^\\s,;\\)"]+)/g;
+// The same citation strings are linkified again and again across items and
+// renders, so memoize per input string.
+const _linkifyCache = new Map();
 function linkify(text) {{
   if (!text) return '';
-  const urlRe = /(https?:\\/\\/[^\\s,;\\)"]+)/g;
-  let result = '', last = 0, m;
-  while ((m = urlRe.exec(text)) !== null) {{
+  let result = _linkifyCache.get(text);
+  if (result !== undefined) return result;
+  result = '';
+  let last = 0;
+  for (const m of text.matchAll(URL_RE)) {{
     result += esc(text.slice(last, m.index));
     result += '<a href="' + esc(m[1]) + '" target="_blank" rel="noopener" class="ref-url">' + esc(m[1]) + '</a>';
-    last = urlRe.lastIndex;
+    last = m.index + m[1].length;
   }}
   result += esc(text.slice(last));
+  _linkifyCache.set(text, result);
   return result;
 }}
 
-function renderReferences() {{
-  const el = document.getElementById('view-references');
-
-  const refMap = {{}};
-  const refHasSummary = {{}};
-  const addRef = (r, type, id) => {{
-    const resolved = resolveRef(r);
-    const key = resolved.citeId || (resolved.text||'').trim();
-    if (!key || key.toLowerCase() === 'todo') return;
-    if (!refMap[key]) refMap[key] = {{text: (resolved.text||'').trim(), citeId: resolved.citeId, techniques:[], weaknesses:[], mitigations:[]}};
-    if (!refMap[key][type].includes(id)) refMap[key][type].push(id);
-    if (resolved.relevance) {{ if (!refHasSummary[key]) refHasSummary[key] = {{}}; refHasSummary[key][type+':'+id] = true; }}
-  }};
-  DB.techniques.forEach(t  => (t.references||[]).forEach(r => addRef(r,'techniques',t.id)));
-  DB.weaknesses.forEach(w  => (w.references||[]).forEach(r => addRef(r,'weaknesses',w.id)));
-  DB.mitigations.forEach(m => (m.references||[]).forEach(r => addRef(r,'mitigations',m.id)));
+const REF_TYPE_LABEL  = {{ techniques:'T', weaknesses:'W', mitigations:'M' }};
+const REF_TYPE_CLASS  = {{ techniques:'chip-t', weaknesses:'chip-w', mitigations:'chip-m' }};
+const REF_TYPE_DETAIL = {{ techniques:'technique', weaknesses:'weakness', mitigations:'mitigation' }};
+
+// The reference index arrives prebuilt from Python (IDX.ref_index, keyed
+// alphabetically, so the sort modes get their tie-break from stable sorts
+// over the entry order); this only derives the render-side caches from it
+// on first use.
+let _refIndex = null;
+function getRefIndex() {{
+  if (_refIndex) return _refIndex;
+  const refMap = IDX.ref_index || {{}};
+  const refHasSummary = IDX.ref_has_summary || {{}};
+  const entries = Object.entries(refMap);
+  // Total citation count per key, so the "Most Cited" sort compares
+  // precomputed numbers
+  const totalCounts = {{}};
+  entries.forEach(([key, cb]) => {{
+    totalCounts[key] = cb.techniques.length + cb.weaknesses.length + cb.mitigations.length;
+    // One lowercased blob covering the citation text, key and every cited
+    // item's id and name, searched with a single indexOf
+    const bits = [cb.text, cb.citeId || ''];
+    cb.techniques.forEach(id  => {{ bits.push(id); const o = TMap[id]; if (o) bits.push(o.name || ''); }});
+    cb.weaknesses.forEach(id  => {{ bits.push(id); const o = WMap[id]; if (o) bits.push(o.name || ''); }});
+    cb.mitigations.forEach(id => {{ bits.push(id); const o = MMap[id]; if (o) bits.push(o.name || ''); }});
+    cb._search = bits.join(' ').toLowerCase();
+    // "Cited by" chips depend only on the (static) relationships — build
+    // them here, once
+    const summaryMap = refHasSummary[key] || {{}};
+    cb._chips = ['techniques','weaknesses','mitigations'].flatMap(type =>
+      cb[type].map(id => {{
+        const item = type==='techniques'?TMap[id]:type==='weaknesses'?WMap[id]:MMap[id];
+        const name = esc((item||{{}}).name||id);
+        const faded = summaryMap[type+':'+id] ? '' : ' no-summary';
+        return `<span class="ref-chip ${{REF_TYPE_CLASS[type]}}${{faded}}" title="${{name}}${{faded ? ' (no relevance summary)' : ''}}"
+          data-show-id="${{escId(id)}}" data-show-type="${{REF_TYPE_DETAIL[type]}}">${{esc(REF_TYPE_LABEL[type]+':'+id)}}</span>`;
+      }})).join('');
+  }});
 
+  // Kept on window for the detail panel and console access
   window._refMap = refMap;
   window._refHasSummary = refHasSummary;
+  _refIndex = {{refMap, refHasSummary, entries, totalCounts}};
+  return _refIndex;
+}}
 
-  let items = Object.entries(refMap).filter(([key, cb]) => {{
+function renderReferences() {{
+  const el = document.getElementById('view-references');
+  if (viewUnchanged('view-references', `r|${{S.search}}|${{S.rtype}}|${{S.rf}}`)) return;
+  const {{entries, totalCounts}} = getRefIndex();
+
+  let items = entries.filter(([key, cb]) => {{
     if (S.rtype !== 'all' && cb[S.rtype].length === 0) return false;
-    if (!S.search) return true;
-    const q = S.search.toLowerCase();
-    return cb.text.toLowerCase().includes(q) || (cb.citeId||'').toLowerCase().includes(q)
-        || cb.techniques.some(id  => id.toLowerCase().includes(q) || ((TMap[id]||{{}}).name||'').toLowerCase().includes(q))
-        || cb.weaknesses.some(id  => id.toLowerCase().includes(q) || ((WMap[id]||{{}}).name||'').toLowerCase().includes(q))
-        || cb.mitigations.some(id => id.toLowerCase().includes(q) || ((MMap[id]||{{}}).name||'').toLowerCase().includes(q));
+    return !S.search || cb._search.indexOf(S.searchLC) !== -1;
   }});
 
   if (S.rf === 'cited') {{
-    items.sort((a,b) => {{
-      const sa = a[1].techniques.length + a[1].weaknesses.length + a[1].mitigations.length;
-      const sb = b[1].techniques.length + b[1].weaknesses.length + b[1].mitigations.length;
-      return sb - sa || a[0].localeCompare(b[0]);
-    }});
+    items.sort((a,b) => totalCounts[b[0]] - totalCounts[a[0]]);
   }} else if (S.rf === 'id') {{
-    items.sort((a,b) => (a[1].citeId||'').localeCompare(b[1].citeId||''));
+    items.sort((a,b) => cmpAscii(a[1].citeId||'', b[1].citeId||''));
   }} else if (S.rf === 'bib' || S.rf === 'txt') {{
     const field = S.rf;
     items.sort((a,b) => {{
@@ -4270,42 +5098,30 @@ function renderReferences() {{
       const cb2 = b[1].citeId ? CiteMap[b[1].citeId] : null;
       const ha = ca && ca[field] ? 1 : 0;
       const hb = cb2 && cb2[field] ? 1 : 0;
-      return hb - ha || a[0].localeCompare(b[0]);
+      return hb - ha;
     }});
-  }} else {{
-    items.sort((a,b) => a[0].localeCompare(b[0]));
   }}
+  // 'alpha' needs no sort at all — the filtered entries are already in order
 
   document.getElementById('r-count').textContent = `${{items.length}} shown`;
 
   if (!items.length) {{
+    _vwindows['view-references'] = null;
     el.innerHTML = '<div class="no-results">No references match your filters.</div>';
     return;
   }}
 
-  const tLabel  = {{ techniques:'T', weaknesses:'W', mitigations:'M' }};
-  const tClass  = {{ techniques:'chip-t', weaknesses:'chip-w', mitigations:'chip-m' }};
-  const tDetail = {{ techniques:'technique', weaknesses:'weakness', mitigations:'mitigation' }};
-
-  let html = `<div class="table-section">
+  el.innerHTML = `<div class="table-section">
     <div class="table-section-header">
       <span class="table-section-title">All References</span>
       <span class="table-section-count">${{items.length}}</span>
       <a href="${{REPO_URL}}/issues/new?template=1d_propose-new-reference-form.yml" target="_blank" rel="noopener" class="propose-new-btn">+ Propose New Reference</a>
     </div>
-    <table class="attck-table ref-table">
-    <thead><tr><th style="width:100px;cursor:pointer;text-transform:none" onclick="S.rf='id';renderReferences()">DFCite ID</th><th style="width:30px;cursor:pointer" title="Sort by .txt availability" onclick="S.rf='txt';renderReferences()">txt</th><th style="width:30px;cursor:pointer" title="Sort by .bib availability" onclick="S.rf='bib';renderReferences()">bib</th><th style="cursor:pointer" onclick="S.rf='alpha';renderReferences()">Reference</th><th style="width:280px;cursor:pointer" onclick="S.rf='cited';renderReferences()">Cited by</th></tr></thead><tbody>`;
+    <table class="attck-table ref-table" style="table-layout:fixed">
+    <thead><tr><th style="width:100px;cursor:pointer;text-transform:none" onclick="S.rf='id';renderReferences()">DFCite ID</th><th style="width:30px;cursor:pointer" title="Sort by .txt availability" onclick="S.rf='txt';renderReferences()">txt</th><th style="width:30px;cursor:pointer" title="Sort by .bib availability" onclick="S.rf='bib';renderReferences()">bib</th><th style="cursor:pointer" onclick="S.rf='alpha';renderReferences()">Reference</th><th style="width:280px;cursor:pointer" onclick="S.rf='cited';renderReferences()">Cited by</th></tr></thead><tbody></tbody></table></div>`;
 
-  items.forEach(([key, cb]) => {{
-    const summaryMap = refHasSummary[key] || {{}};
-    const chips = ['techniques','weaknesses','mitigations'].flatMap(type =>
-      cb[type].map(id => {{
-        const item = type==='techniques'?TMap[id]:type==='weaknesses'?WMap[id]:MMap[id];
-        const name = esc((item||{{}}).name||id);
-        const faded = summaryMap[type+':'+id] ? '' : ' no-summary';
-        return `<span class="ref-chip ${{tClass[type]}}${{faded}}" title="${{name}}${{faded ? ' (no relevance summary)' : ''}}"
-          data-show-id="${{esc(id)}}" data-show-type="${{tDetail[type]}}">${{esc(tLabel[type]+':'+id)}}</span>`;
-      }})).join('');
+  setWindowedRows('view-references', items, ([key, cb]) => {{
+    if (cb._row) return cb._row;
     const citeId = cb.citeId || '';
     const cite = citeId ? CiteMap[citeId] : null;
     const hasBib = cite && cite.bib;
@@ -4313,45 +5129,61 @@ function renderReferences() {{
     const tick = '<span style="color:#22c55e">&#10003;</span>';
     const cross = '<span style="color:var(--gray-300)">&#10005;</span>';
     let copyBtns = '';
-    if (citeId) copyBtns += `<span class="copy-cite" title="Copy plaintext citation" onclick="copyCite('${{esc(citeId)}}','txt');event.stopPropagation()">&#128203;</span>`;
-    if (hasBib) copyBtns += `<span class="copy-cite" title="Copy BibTeX citation" onclick="copyCite('${{esc(citeId)}}','bib');event.stopPropagation()">&#128218;</span>`;
-    const rowAttrs = citeId ? ` data-show-id="${{esc(citeId)}}" data-show-type="reference"` : '';
-    html += `<tr${{rowAttrs}}><td style="font-family:var(--font-mono);font-size:.78rem;color:var(--gray-500)">${{esc(citeId)}}</td><td style="text-align:center">${{hasTxt ? tick : cross}}</td><td style="text-align:center">${{hasBib ? tick : cross}}</td><td class="ref-cell">${{linkify(cb.text)}} ${{copyBtns}}</td><td class="ref-cited-cell">${{chips}}</td></tr>`;
+    if (citeId) copyBtns += `<span class="copy-cite" title="Copy plaintext citation" onclick="copyCite('${{escId(citeId)}}','txt');event.stopPropagation()">&#128203;</span>`;
+    if (hasBib) copyBtns += `<span class="copy-cite" title="Copy BibTeX citation" onclick="copyCite('${{escId(citeId)}}','bib');event.stopPropagation()">&#128218;</span>`;
+    const rowAttrs = citeId ? ` data-show-id="${{escId(citeId)}}" data-show-type="reference"` : '';
+    return cb._row = `<tr${{rowAttrs}}><td style="font-family:var(--font-mono);font-size:.78rem;color:var(--gray-500)">${{escId(citeId)}}</td><td style="text-align:center">${{hasTxt ? tick : cross}}</td><td style="text-align:center">${{hasBib ? tick : cross}}</td><td class="ref-cell">${{linkify(cb.text)}} ${{copyBtns}}</td><td class="ref-cited-cell">${{cb._chips}}</td></tr>`;
   }});
-
-  html += '</tbody></table></div>';
-  el.innerHTML = html;
 }}
 
 // ── View switching ────────────────────────────────────────────────────
+// Static view-chrome NodeLists, cached once instead of re-queried per switch
+const VIEW_TABS    = [...document.querySelectorAll('.topnav-tab')];
+const BURGER_ITEMS = [...document.querySelectorAll('.burger-item')];
+const VIEW_PANES   = [...document.querySelectorAll('.view')];
+const FILTER_BARS  = {{}};
+for (const v of ['matrix','objectives','techniques','weaknesses','mitigations','references']) {{
+  FILTER_BARS[v] = document.getElementById('fb-' + v);
+}}
+const VIEW_NAMES = {{matrix:'Matrix',objectives:'Objectives',techniques:'Techniques',weaknesses:'Weaknesses',mitigations:'Mitigations',references:'References'}};
+
 function switchView(view, skipHash) {{
   S.view = view;
   S.selected = null;
   closeDetail(true);
-  if (!skipHash) history.replaceState(null, '', view === 'matrix' ? location.pathname : '#' + view);
+  if (!skipHash && location.hash !== (view === 'matrix' ? '' : '#' + view)) {{
+    history.replaceState(null, '', view === 'matrix' ? location.pathname : '#' + view);
+    _lastHash = location.hash;
+  }}
 
-  document.querySelectorAll('.topnav-tab').forEach(btn =>
+  VIEW_TABS.forEach(btn =>
     btn.classList.toggle('active', btn.dataset.view === view));
-  document.querySelectorAll('.burger-item').forEach(btn =>
+  BURGER_ITEMS.forEach(btn =>
     btn.classList.toggle('active', btn.dataset.view === view));
-  document.getElementById('burgerMenu').classList.add('hidden');
-  const viewNames = {{matrix:'Matrix',objectives:'Objectives',techniques:'Techniques',weaknesses:'Weaknesses',mitigations:'Mitigations',references:'References'}};
-  document.getElementById('burgerLabel').textContent = viewNames[view] || view;
+  EL.burgerMenu.classList.add('hidden');
+  EL.burgerLabel.textContent = VIEW_NAMES[view] || view;
 
-  document.querySelectorAll('.view').forEach(el =>
+  VIEW_PANES.forEach(el =>
     el.classList.toggle('hidden', el.id !== `view-${{view}}`));
 
-  document.getElementById('fb-matrix').style.display      = view === 'matrix'      ? 'flex' : 'none';
-  document.getElementById('fb-objectives').style.display  = view === 'objectives'  ? 'flex' : 'none';
-  document.getElementById('fb-techniques').style.display  = view === 'techniques'  ? 'flex' : 'none';
-  document.getElementById('fb-weaknesses').style.display  = view === 'weaknesses'  ? 'flex' : 'none';
-  document.getElementById('fb-mitigations').style.display = view === 'mitigations' ? 'flex' : 'none';
-  document.getElementById('fb-references').style.display  = view === 'references'  ? 'flex' : 'none';
+  for (const v in FILTER_BARS) {{
+    FILTER_BARS[v].style.display = v === view ? 'flex' : 'none';
+  }}
 
   render();
 }}
 
 // ── Main render dispatcher ────────────────────────────────────────────
+// Event handlers go through scheduleRender(), which coalesces any burst of
+// state changes (rapid keystrokes, filter clicks) into one render per
+// animation frame.
+let renderScheduled = false;
+function scheduleRender() {{
+  if (renderScheduled) return;
+  renderScheduled = true;
+  requestAnimationFrame(() => {{ renderScheduled = false; render(); }});
+}}
+
 function render() {{
   if (S.view === 'matrix')      renderMatrix();
   if (S.view === 'objectives')  renderObjectives();
@@ -4368,111 +5200,123 @@ document.querySelectorAll('.topnav-tab').forEach(btn =>
 // Burger menu
 document.getElementById('burgerBtn').addEventListener('click', (e) => {{
   e.stopPropagation();
-  document.getElementById('burgerMenu').classList.toggle('hidden');
+  EL.burgerMenu.classList.toggle('hidden');
 }});
 document.querySelectorAll('.burger-item').forEach(btn =>
   btn.addEventListener('click', () => switchView(btn.dataset.view)));
-document.addEventListener('click', () =>
-  document.getElementById('burgerMenu').classList.add('hidden'));
-
-document.querySelectorAll('[data-tf]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-tf]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.tf = btn.dataset.tf;
-    render();
-  }}));
 
-document.querySelectorAll('[data-t2f]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-t2f]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.t2f = btn.dataset.t2f;
-    render();
-  }}));
+// The filter chips are static DOM; cache the lists once instead of
+// re-querying the document on every click
+const FILTER_BTNS = {{}};
+for (const k of ['tf','t2f','t2t','wf','mf','rf','rtype']) {{
+  FILTER_BTNS[k] = [...document.querySelectorAll('[data-' + k + ']')];
+}}
 
-document.querySelectorAll('[data-t2t]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-t2t]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.t2t = btn.dataset.t2t;
-    render();
-  }}));
+// One delegated click listener dispatches all filter-chip groups; the
+// single-select groups share a handler factory, wf keeps its multi-toggle.
+// The currently-active chip per group is tracked so a click touches two
+// elements' classLists rather than sweeping the whole group.
+const _activeChip = {{}};
+for (const k of ['tf','t2f','t2t','mf','rf','rtype']) {{
+  _activeChip[k] = FILTER_BTNS[k].find(b => b.classList.contains('active')) || null;
+}}
 
-// Populate objective dropdown
-(function() {{
-  const sel = document.getElementById('t2-obj-filter');
-  DB.objectives.forEach((obj, idx) => {{
-    const opt = document.createElement('option');
-    opt.value = String(idx);
-    opt.textContent = (idx + 1) + '. ' + obj.name;
-    sel.appendChild(opt);
-  }});
-  sel.addEventListener('change', () => {{
-    S.t2o = sel.value;
-    render();
-  }});
-}})();
+function singleSelectFilter(group, stateKey) {{
+  return btn => {{
+    if (_activeChip[group] !== btn) {{
+      if (_activeChip[group]) _activeChip[group].classList.remove('active');
+      btn.classList.add('active');
+      _activeChip[group] = btn;
+    }}
+    S[stateKey] = btn.dataset[group];
+    scheduleRender();
+  }};
+}}
 
-document.querySelectorAll('[data-wf]').forEach(btn =>
-  btn.addEventListener('click', () => {{
+const FILTER_HANDLERS = {{
+  tf:    singleSelectFilter('tf', 'tf'),
+  t2f:   singleSelectFilter('t2f', 't2f'),
+  t2t:   singleSelectFilter('t2t', 't2t'),
+  mf:    singleSelectFilter('mf', 'mf'),
+  rf:    singleSelectFilter('rf', 'rf'),
+  rtype: singleSelectFilter('rtype', 'rtype'),
+  wf: btn => {{
     const val = btn.dataset.wf;
     if (val === 'all') {{
       // Toggle all on/off
-      if (S.wf.size === CATS.length) S.wf.clear();
-      else CATS.forEach(c => S.wf.add(c));
-    }} else if (S.wf.has(val)) {{
-      S.wf.delete(val);
+      S.wfMask = S.wfMask === ALL_CAT_MASK ? 0 : ALL_CAT_MASK;
     }} else {{
-      S.wf.add(val);
+      S.wfMask ^= CAT_BIT[val];
     }}
     // Update active states
-    document.querySelectorAll('[data-wf]').forEach(b => {{
-      if (b.dataset.wf === 'all') b.classList.toggle('active', S.wf.size === CATS.length);
-      else b.classList.toggle('active', S.wf.has(b.dataset.wf));
+    FILTER_BTNS.wf.forEach(b => {{
+      if (b.dataset.wf === 'all') b.classList.toggle('active', S.wfMask === ALL_CAT_MASK);
+      else b.classList.toggle('active', !!(S.wfMask & CAT_BIT[b.dataset.wf]));
     }});
-    render();
-  }}));
+    scheduleRender();
+  }},
+}};
 
-document.querySelectorAll('[data-mf]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-mf]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.mf = btn.dataset.mf;
-    render();
-  }}));
+
+// Objective dropdown options are pre-rendered in the markup; just wire the listener
+(function() {{
+  const sel = document.getElementById('t2-obj-filter');
+  sel.addEventListener('change', () => {{
+    S.t2o = sel.value;
+    scheduleRender();
+  }});
+}})();
 
 const searchInput = document.getElementById('searchInput');
 const searchClear = document.getElementById('searchClear');
 let searchTimer;
+let searchJob = 0;
 searchInput.addEventListener('input', e => {{
   clearTimeout(searchTimer);
+  // Trailing-only debounce: a fresh keystroke cancels the pending callback,
+  // and scheduleRender coalesces whatever does settle into one frame. 250ms
+  // sits just above fast-typing inter-key gaps.
+  const job = ++searchJob;  // cancellation token for the idle stage below
   searchTimer = setTimeout(() => {{
-    S.search = e.target.value.trim();
-    searchClear.classList.toggle('visible', !!S.search);
-    render();
-  }}, 220);
+    const run = () => {{
+      if (job !== searchJob) return;  // superseded by a newer keystroke
+      const v = e.target.value.trim();
+      if (v === S.search) return;  // settled back to the already-rendered query
+      S.search = v;
+      S.searchLC = S.search.toLowerCase();
+      if (S.search) ensureEnriched();  // matchesSearch reads the _search blobs
+      S.searchSet = computeSearchSet();
+      searchClear.classList.toggle('visible', !!S.search);
+      scheduleRender();
+    }};
+    // Step off the input-dispatch path: the query-set computation runs at
+    // idle (bounded by the timeout) so typing never waits on it.
+    if (window.requestIdleCallback) requestIdleCallback(run, {{timeout: 100}});
+    else run();
+  }}, 250);
 }});
 searchClear.addEventListener('click', () => {{
   searchInput.value = '';
   S.search = '';
+  S.searchLC = '';
+  S.searchSet = null;
   searchClear.classList.remove('visible');
-  render();
+  scheduleRender();
 }});
 
 document.getElementById('dpClose').addEventListener('click', () => closeDetail());
-document.getElementById('dpBack').addEventListener('click', goBack);
+EL.dpBack.addEventListener('click', goBack);
 function updateViewButtonTitles() {{
-  const panel = document.getElementById('detailPanel');
+  const panel = EL.panel;
   const expanded = panel.classList.contains('expanded');
   const present = panel.classList.contains('present');
-  document.getElementById('dpExpand').title = expanded ? 'Collapse panel' : 'Expand panel to full width';
-  document.getElementById('dpPresent').title = present
+  EL.dpExpand.title = expanded ? 'Collapse panel' : 'Expand panel to full width';
+  EL.dpPresent.title = present
     ? 'Exit presentation view'
     : 'Switch to presentation view (weaknesses with mitigations nested \u2013 for slide screenshots)';
 }}
-document.getElementById('dpExpand').addEventListener('click', () => {{
-  const panel = document.getElementById('detailPanel');
+EL.dpExpand.addEventListener('click', () => {{
+  const panel = EL.panel;
   const expanding = !panel.classList.contains('expanded');
   panel.classList.toggle('expanded');
   if (!expanding) panel.classList.remove('present'); // collapsing exits presentation mode
@@ -4480,13 +5324,13 @@ document.getElementById('dpExpand').addEventListener('click', () => {{
   // If present was on and we're re-rendering, swap to the right builder
   if (!expanding && S.selected && S.selected.type === 'technique') {{
     const body = buildTechniqueDetail(TMap[S.selected.id]);
-    document.getElementById('dp-body').innerHTML = body;
+    EL.body.innerHTML = body;
     window._dpFlatHtml = body;
   }}
   updateViewButtonTitles();
 }});
-document.getElementById('dpPresent').addEventListener('click', () => {{
-  const panel = document.getElementById('detailPanel');
+EL.dpPresent.addEventListener('click', () => {{
+  const panel = EL.panel;
   const enabling = !panel.classList.contains('present');
   if (enabling) {{
     panel.classList.add('present', 'expanded'); // presentation implies expanded width + grid
@@ -4495,33 +5339,57 @@ document.getElementById('dpPresent').addEventListener('click', () => {{
   }}
   if (!S.selected || S.selected.type !== 'technique') {{ updateViewButtonTitles(); return; }}
   const body = enabling ? buildTechniquePresentationDetail(TMap[S.selected.id]) : buildTechniqueDetail(TMap[S.selected.id]);
-  document.getElementById('dp-body').innerHTML = body;
+  EL.body.innerHTML = body;
   window._dpFlatHtml = body;
   if (panel.classList.contains('expanded')) reorganizeForGrid();
   updateViewButtonTitles();
 }});
-// Delegated copy-link handler for any .copylink control (detail topbar and the
-// technique table rows). A data-link-id builds that item's deep link; without
-// one (the topbar button) it copies the current page URL.
-document.addEventListener('click', function(e) {{
-  const btn = e.target.closest('.copylink');
-  if (!btn) return;
-  const id = btn.dataset.linkId;
-  const url = id ? (location.href.split('#')[0] + '#' + id) : location.href;
-  const prevTitle = btn.title;
-  navigator.clipboard.writeText(url).then(() => {{
-    btn.classList.add('copied');
-    btn.title = 'Copied!';
-    setTimeout(() => {{ btn.classList.remove('copied'); btn.title = prevTitle; }}, 1500);
-  }});
-}});
+// ── Consolidated document click dispatcher ───────────────────────────
+// One listener replaces what used to be seven separate document-level click
+// handlers; the target resolves with a single combined closest() walk and
+// the click branches on what it hit.
+const CLICK_TARGETS =
+  'a.propose-update-btn[data-update-id], .copylink, th.sortable, ' +
+  '.credit-tag[data-person], .obj-row, [data-tf], [data-t2f], [data-t2t], ' +
+  '[data-wf], [data-mf], [data-rf], [data-rtype], [data-show-id]';
 
-// Delegated click handler for sortable column headers
 document.addEventListener('click', function(e) {{
-  const th = e.target.closest('th.sortable');
-  if (th) {{
-    const key = th.dataset.sortKey;
-    const group = th.dataset.sortGroup;
+  // Clicks inside the credit popup (selecting/copying a name) keep it open
+  if (e.target.closest('.credit-popup')) return;
+  // Any other click closes the burger menu and dismisses an open credit
+  // popup (clicking a credit tag reopens one below)
+  EL.burgerMenu.classList.add('hidden');
+  if (_creditPopup) _creditPopup.classList.add('hidden');
+
+  const hit = e.target.closest(CLICK_TARGETS);
+  if (!hit) return;
+
+  if (hit.matches('a.propose-update-btn[data-update-id]')) {{
+    // Lazily resolve the "Propose an update" issue URL at click time
+    const id = hit.dataset.updateId;
+    const obj = TMap[id] || WMap[id] || MMap[id];
+    if (obj) hit.href = updateFormUrl(hit.dataset.updateType, obj);
+    return;
+  }}
+
+  if (hit.classList.contains('copylink')) {{
+    // Copy-link control (detail topbar and the technique table rows). A
+    // data-link-id builds that item's deep link; without one (the topbar
+    // button) it copies the current page URL.
+    const id = hit.dataset.linkId;
+    const url = id ? (location.href.split('#')[0] + '#' + id) : location.href;
+    const prevTitle = hit.title;
+    navigator.clipboard.writeText(url).then(() => {{
+      hit.classList.add('copied');
+      hit.title = 'Copied!';
+      setTimeout(() => {{ hit.classList.remove('copied'); hit.title = prevTitle; }}, 1500);
+    }});
+    return;
+  }}
+
+  if (hit.matches('th.sortable')) {{
+    const key = hit.dataset.sortKey;
+    const group = hit.dataset.sortGroup;
     const dirKey = group + 'Dir';
     if (S[group] === key) {{
       S[dirKey] = S[dirKey] * -1;
@@ -4529,20 +5397,31 @@ document.addEventListener('click', function(e) {{
       S[group] = key;
       S[dirKey] = (key === 'id' || key === 'name') ? 1 : -1;
     }}
-    render();
+    scheduleRender();
     return;
   }}
-}});
 
-// Delegated click handler for data-show-id/data-show-type attributes (avoids inline onclick XSS risk)
-document.addEventListener('click', function(e) {{
-  // Don't intercept clicks on external links inside clickable containers
-  if (e.target.closest('a[href]')) return;
-  // The per-row action icons (copy link / drag handle) act on their own, not as
-  // a click-through to open the row's detail.
-  if (e.target.closest('.row-actions')) return;
-  const el = e.target.closest('[data-show-id]');
-  if (el) showDetail(el.dataset.showId, el.dataset.showType);
+  if (hit.matches('.credit-tag[data-person]')) {{
+    showCreditPopup(hit);
+    return;
+  }}
+
+  if (hit.classList.contains('obj-row')) {{
+    S.matrixObj = hit.dataset.objIdx;
+    switchView('matrix');
+    return;
+  }}
+
+  for (const k in FILTER_HANDLERS) {{
+    if (hit.dataset[k] !== undefined) {{ FILTER_HANDLERS[k](hit); return; }}
+  }}
+
+  // data-show-id rows/chips (avoids inline onclick XSS risk) — but don't
+  // intercept clicks on real links or the per-row action icons
+  if (hit.dataset.showId !== undefined
+      && !e.target.closest('a[href]') && !e.target.closest('.row-actions')) {{
+    showDetail(hit.dataset.showId, hit.dataset.showType);
+  }}
 }});
 
 // Delegated dragstart for the explicit drag controls. The grid cells keep their
@@ -4582,37 +5461,28 @@ document.addEventListener('dragstart', function(e) {{
   e.dataTransfer.effectAllowed = 'copy';
 }});
 
-// Delegated click handler for objective table rows
-document.addEventListener('click', function(e) {{
-  const row = e.target.closest('.obj-row');
-  if (row) {{
-    S.matrixObj = row.dataset.objIdx;
-    switchView('matrix');
-  }}
-}});
-
 // Matrix objective filter reset button
 document.getElementById('matrix-obj-reset').addEventListener('click', function() {{
   S.matrixObj = 'all';
-  render();
+  scheduleRender();
 }});
 
-// Delegated click handler for contributor/reviewer name popups
-document.addEventListener('click', function(e) {{
-  // Remove any existing popup first
-  const old = document.querySelector('.credit-popup');
-  if (old) old.remove();
-
-  const tag = e.target.closest('.credit-tag[data-person]');
-  if (!tag) return;
-  e.stopPropagation();
-
+// Contributor/reviewer name popup, opened from the click dispatcher (which
+// has already hidden any open popup). One popup element is created lazily
+// and reused — no create/parse/destroy churn per click.
+let _creditPopup = null;
+function showCreditPopup(tag) {{
   const name = tag.dataset.person;
+  ensureEnriched();
   const s = PersonStats[name];
   if (!s) return;
 
-  const popup = document.createElement('div');
-  popup.className = 'credit-popup';
+  if (!_creditPopup) {{
+    _creditPopup = document.createElement('div');
+    _creditPopup.className = 'credit-popup';
+    document.body.appendChild(_creditPopup);
+  }}
+  const popup = _creditPopup;
 
   let rows = `<div class="credit-popup-name">${{esc(name)}}</div>`;
   if (s.tc || s.wc || s.mc) {{
@@ -4627,24 +5497,19 @@ document.addEventListener('click', function(e) {{
     rows += `<div class="credit-popup-row"><span>Total</span><span>${{totalReviews}}</span></div>`;
   }}
   popup.innerHTML = rows;
+  popup.classList.remove('hidden');
 
-  document.body.appendChild(popup);
+  // All layout reads happen together (one forced layout for the freshly
+  // filled popup), then the style writes
   const rect = tag.getBoundingClientRect();
+  const pw = popup.offsetWidth, ph = popup.offsetHeight;
   let top = rect.bottom + 6;
   let left = rect.left;
-  if (left + popup.offsetWidth > window.innerWidth - 10) left = window.innerWidth - popup.offsetWidth - 10;
-  if (top + popup.offsetHeight > window.innerHeight - 10) top = rect.top - popup.offsetHeight - 6;
+  if (left + pw > WINW - 10) left = WINW - pw - 10;
+  if (top + ph > WINH - 10) top = rect.top - ph - 6;
   popup.style.top = top + 'px';
   popup.style.left = left + 'px';
-}});
-
-// Close credit popup on outside click
-document.addEventListener('click', function(e) {{
-  if (!e.target.closest('.credit-popup') && !e.target.closest('.credit-tag')) {{
-    const p = document.querySelector('.credit-popup');
-    if (p) p.remove();
-  }}
-}});
+}}
 
 document.addEventListener('keydown', e => {{
   if (e.key === 'Escape') {{ closeDetail(); }}
@@ -4655,22 +5520,6 @@ document.addEventListener('keydown', e => {{
   }}
 }});
 
-document.querySelectorAll('[data-rf]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-rf]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.rf = btn.dataset.rf;
-    render();
-  }}));
-
-document.querySelectorAll('[data-rtype]').forEach(btn =>
-  btn.addEventListener('click', () => {{
-    document.querySelectorAll('[data-rtype]').forEach(b => b.classList.remove('active'));
-    btn.classList.add('active');
-    S.rtype = btn.dataset.rtype;
-    render();
-  }}));
-
 // ── Objective count updater ──────────────────────────────────────────
 function updateObjCounts() {{
   const n = DB.objectives.length;
@@ -4728,9 +5577,13 @@ if (CUSTOM_MODE) {{
       obj._idx = idx;
       (obj.techniques || []).forEach(tid => {{ T2Obj[tid] = obj; }});
     }});
+    computeTechFilterKeys();
+    customSchemaActive = false;
+    invalidateTechniqueViews();
     resetBtn.style.display = 'none';
     nameLabel.textContent = '';
     updateObjCounts();
+    invalidateMatrix();
     render();
   }});
 }}
@@ -4784,6 +5637,9 @@ function applyCustomSchema(schema, filename) {{
     obj._idx = idx;
     (obj.techniques || []).forEach(tid => {{ T2Obj[tid] = obj; }});
   }});
+  computeTechFilterKeys();
+  customSchemaActive = true;
+  invalidateTechniqueViews();
 
   // Update UI
   const nameLabel = document.getElementById('custom-schema-name');
@@ -4794,11 +5650,17 @@ function applyCustomSchema(schema, filename) {{
 
   // Reset filters and re-render
   S.matrixObj = 'all';
+  invalidateMatrix();
   render();
 }}
 
 // ── Bootstrap ────────────────────────────────────────────────────────
+let _lastHash = null;
 function handleHash() {{
+  // Duplicate hashchange events (programmatic back/forward, repeated
+  // location.replace) are common; skip re-dispatching an unchanged hash
+  if (location.hash === _lastHash) return;
+  _lastHash = location.hash;
   const hash = location.hash.slice(1);
   if (!hash) return;
   // Tab views
@@ -4869,6 +5731,9 @@ Examples:
                         help="Disable SSL certificate verification (only relevant with --remote).")
     parser.add_argument("--custom", action="store_true",
                         help="Enable customisation mode: allows uploading a JSON schema to reorganise techniques.")
+    parser.add_argument("--compress", choices=["none", "gzip", "brotli"], default="none",
+                        help="Also write a precompressed copy of the output (.html.gz / .html.br) "
+                             "for servers that serve static precompressed assets.")
     return parser.parse_args()
 
 
@@ -4878,17 +5743,25 @@ def main() -> None:
     script_dir = os.path.dirname(os.path.abspath(__file__))
 
     kb = None
+    if args.remote:
+        repo_root = Path(script_dir).parent
+    else:
+        repo_root = Path(args.local).resolve() if args.local else Path(script_dir).parent
+
+    # Credit extraction spawns git subprocesses while the KB loads from disk
+    # (or GitHub) — both are I/O-bound, so they overlap.
+    credits_future = None
+    executor = ThreadPoolExecutor(max_workers=1)
+    if (repo_root / ".git").exists():
+        print("  Extracting git credits …")
+        credits_future = executor.submit(cached_git_credits, repo_root)
+
     if args.remote:
         # GitHub fetch mode (original behavior)
-        global _ssl_context
-        if getattr(args, "no_verify_ssl", False):
-            _ssl_context = ssl._create_unverified_context()
-            print("[warn] SSL certificate verification disabled (--no-verify-ssl).", file=sys.stderr)
+        configure_ssl(getattr(args, "no_verify_ssl", False))
         db = load_from_github()
-        repo_root = Path(script_dir).parent
     else:
         # Local mode via KnowledgeBase (default)
-        repo_root = Path(args.local).resolve() if args.local else Path(script_dir).parent
         kb = KnowledgeBase(str(repo_root), 'solve-it.json')
         db = {
             "techniques": kb.get_all_techniques_with_full_detail(),
@@ -4929,15 +5802,18 @@ def main() -> None:
               f"{len(db['weaknesses'])} weaknesses, {len(db['mitigations'])} mitigations, "
               f"{len(db['objectives'])} objectives, {len(citations)} citations.")
 
-    # Extract git contributor/reviewer credits
-    credits: dict = {}
-    if (repo_root / ".git").exists():
-        print("  Extracting git credits …")
-        credits = extract_git_credits(repo_root)
+    # Collect the git contributor/reviewer credits extracted in parallel
+    credits: dict = credits_future.result() if credits_future else {}
+    executor.shutdown()
 
-    # Sort for stable output
+    # Sort for stable output. itemgetter is a C-level key function; the odd
+    # item missing an id (e.g. a malformed file in --remote mode) gets an
+    # empty one first so the key can't raise.
+    _get_id = itemgetter("id")
     for key in ("techniques", "weaknesses", "mitigations"):
-        db[key].sort(key=lambda x: x.get("id", ""))
+        for item in db[key]:
+            item.setdefault("id", "")
+        db[key].sort(key=_get_id)
 
     # Enrich items with contributor/reviewer data
     if credits:
@@ -4980,9 +5856,32 @@ def main() -> None:
     html = generate_html(db, idx, custom=getattr(args, "custom", False), kb=kb, source_date=source_date)
 
     out = Path(args.output)
-    out.write_text(html, encoding="utf-8")
+    # Write in slices through a text stream so UTF-8 encoding happens
+    # chunkwise — write_text would materialize a second full copy of the
+    # page as bytes before touching disk.
+    chunk_size = 1 << 20
+    with out.open("w", encoding="utf-8") as f:
+        for i in range(0, len(html), chunk_size):
+            f.write(html[i:i + chunk_size])
     size_kb = out.stat().st_size / 1024
     print(f"\nGenerated: {out.resolve()}  ({size_kb:.1f} KB)")
+
+    if args.compress != "none":
+        if args.compress == "gzip":
+            comp_path = out.with_name(out.name + ".gz")
+            with gzip.open(comp_path, "wt", encoding="utf-8", compresslevel=9) as f:
+                for i in range(0, len(html), chunk_size):
+                    f.write(html[i:i + chunk_size])
+        else:
+            try:
+                import brotli
+            except ImportError:
+                sys.exit("ERROR: --compress brotli requires the 'brotli' package (pip install brotli).")
+            comp_path = out.with_name(out.name + ".br")
+            comp_path.write_bytes(brotli.compress(html.encode("utf-8")))
+        comp_kb = comp_path.stat().st_size / 1024
+        print(f"Compressed: {comp_path.resolve()}  ({comp_kb:.1f} KB)")
+
     print(f"Open in your browser:  file://{out.resolve()}")
 
 
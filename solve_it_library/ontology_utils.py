@@ -15,17 +15,45 @@ Usage:
     markdown = lookup.format_markdown_details("https://ontology.solveit-df.org/solveit/observable/DeviceSet")
 """
 
+import hashlib
 import json
 import logging
+import sys
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rdflib import Graph, Namespace, URIRef, RDF, RDFS, OWL
 
 SH = Namespace("http://www.w3.org/ns/shacl#")
+# Hoisted SHACL terms: Namespace attribute access builds a URIRef per use,
+# and these sit inside the per-shape-node loop
+SH_PROPERTY = SH.property
+SH_PATH = SH.path
+SH_DATATYPE = SH.datatype
+SH_CLASS = SH["class"]
 
 logger = logging.getLogger(__name__)
 
+# One shared requests.Session (when requests is installed) keeps connections
+# alive across the module downloads and listing calls; urllib remains the
+# dependency-free fallback.
+try:
+    import requests as _requests
+except ImportError:
+    _requests = None
+_session = None
+
+
+def _get_session():
+    global _session
+    if _session is None:
+        _session = _requests.Session()
+        _session.headers.update({"User-Agent": "SOLVE-IT-Generator/1.0"})
+    return _session
+
 # Known namespace prefixes for display
 NAMESPACE_PREFIXES = {
     "https://ontology.solveit-df.org/solveit/observable/": "solveit-observable",
@@ -54,13 +82,11 @@ SOLVEIT_ONTOLOGY_DEFAULT_URL = (
 def _discover_solveit_ttl_files(base_api_url=SOLVEIT_ONTOLOGY_GITHUB_API):
     """Fetch the list of solve_it*.ttl files from the SOLVE-IT ontology repo."""
     try:
-        try:
-            import requests
-            resp = requests.get(base_api_url, timeout=15,
-                                headers={"User-Agent": "SOLVE-IT-Generator/1.0"})
+        if _requests is not None:
+            resp = _get_session().get(base_api_url, timeout=15)
             resp.raise_for_status()
             entries = resp.json()
-        except ImportError:
+        else:
             req = urllib.request.Request(
                 base_api_url,
                 headers={"User-Agent": "SOLVE-IT-Generator/1.0"},
@@ -75,6 +101,11 @@ def _discover_solveit_ttl_files(base_api_url=SOLVEIT_ONTOLOGY_GITHUB_API):
         logger.warning(f"Could not discover SOLVE-IT TTL files from GitHub: {exc}")
         return None
 
+# Cached remote modules older than this get revalidated with a conditional
+# GET on the next load (a 304 costs no transfer); younger caches are used
+# without touching the network.
+REVALIDATE_AFTER_SECS = 7 * 24 * 3600
+
 # UCO/CASE ontology module URLs for 1.4.0
 UCO_CASE_MODULES = [
     "https://raw.githubusercontent.com/ucoProject/UCO/1.4.0/ontology/uco/core/core.ttl",
@@ -83,6 +114,25 @@ UCO_CASE_MODULES = [
 ]
 
 
+# Property lines for format_markdown_details, precompiled once; format_map
+# over the property dicts skips per-call template parsing
+_OBJ_PROP_LINE = "    <li>{name} &rarr; {range}</li>".format_map
+_DATA_PROP_LINE = "    <li>{name} ({range})</li>".format_map
+
+
+def _new_graph() -> Graph:
+    """Return a Graph on the fastest available store.
+
+    When the optional oxrdflib plugin is installed, the Oxigraph store runs
+    Turtle parsing and triple lookups in native Rust; otherwise fall back to
+    rdflib's default in-memory store.
+    """
+    try:
+        return Graph(store="Oxigraph")
+    except Exception:
+        return Graph()
+
+
 class OntologyLookup:
     """Loads ontology files and provides class description lookups."""
 
@@ -100,8 +150,14 @@ class OntologyLookup:
             case_uco_cache_dir: Directory to cache downloaded TTL files.
                                 Defaults to ~/.cache/solveit-ontology/
         """
-        self.graph = Graph()
+        self.graph = _new_graph()
+        # Source names only feed counts and debug logs, so just the basename
+        # is kept per entry
         self._loaded_sources = []
+        # Describe/markdown results are pure functions of the loaded graph;
+        # cached per URI and dropped whenever new sources are parsed
+        self._describe_cache: dict = {}
+        self._markdown_cache: dict = {}
 
         # Determine cache directory
         if case_uco_cache_dir:
@@ -118,18 +174,84 @@ class OntologyLookup:
         if load_case_uco:
             self._load_remote_modules(UCO_CASE_MODULES)
 
+        self._build_indices()
+
         logger.info(f"Ontology loaded: {len(self.graph)} triples from {len(self._loaded_sources)} sources")
 
+    def _build_indices(self):
+        """Build one-pass dict indices over the loaded graph.
+
+        rdflib's store walks its internal indices for every objects()/
+        subjects() call; the describe lookups instead hit these plain dicts,
+        built in a single iteration after all sources are loaded.
+        """
+        self._by_subject: dict = {}
+        self._domain_index: dict = {}
+        self._type_index: dict = {}
+        by_subject = self._by_subject
+        domain_index = self._domain_index
+        type_index = self._type_index
+        for s, p, o in self.graph:
+            by_subject.setdefault(s, []).append((p, o))
+            if p == RDFS.domain:
+                domain_index.setdefault(o, []).append(s)
+            elif p == RDF.type:
+                type_index.setdefault(o, set()).add(s)
+
     def _load_solveit_from_path(self, ontology_path):
-        """Load all solve_it*.ttl files from a local directory."""
+        """Load all solve_it*.ttl files from a local directory.
+
+        The combined graph is cached in N-Triples form keyed by a digest of
+        the TTL contents: rdflib's Turtle parser dominates startup, and
+        reparsing the flat N-Triples dump is several times faster. Any
+        change to the TTL files changes the digest and forces a re-parse.
+        """
         ttl_files = sorted(ontology_path.glob("solve_it*.ttl"))
         if not ttl_files:
             logger.warning(f"No solve_it*.ttl files found in {ontology_path}")
             return
+
+        contents = [fp.read_bytes() for fp in ttl_files]
+        digest = hashlib.blake2b(b"".join(contents), digest_size=16).hexdigest()
+        cache_file = self._cache_dir / f"solveit-graph-{digest}.nt"
+        if cache_file.exists():
+            try:
+                self.graph.parse(str(cache_file), format="nt")
+                self._loaded_sources.append(f"cached:{cache_file.name}")
+                logger.debug(f"Loaded combined graph from cache: {cache_file}")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to parse cached graph {cache_file}: {e}")
+                self.graph = _new_graph()  # drop any partially parsed triples
+
+        # One parser invocation over all files amortizes the Turtle parser's
+        # setup, and @prefix redeclarations compose fine. Labelled blank
+        # nodes (_:x) could collide across a shared parse, so files using
+        # them take the per-file path (anonymous [...] nodes are safe).
+        if all(b"_:" not in data for data in contents):
+            try:
+                self.graph.parse(data=b"\n".join(contents), format="turtle")
+                self._loaded_sources.extend(fp.name for fp in ttl_files)
+                logger.debug(f"Loaded {len(ttl_files)} TTL files in one parse")
+            except Exception as e:
+                logger.warning(f"Combined parse failed ({e}); retrying per file")
+                self.graph = _new_graph()  # drop any partially parsed triples
+                self._parse_ttl_files(ttl_files)
+        else:
+            self._parse_ttl_files(ttl_files)
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            self.graph.serialize(destination=str(cache_file), format="nt")
+        except Exception as e:
+            logger.warning(f"Could not write graph cache {cache_file}: {e}")
+
+    def _parse_ttl_files(self, ttl_files):
+        """Parse TTL files individually, warning and continuing on failure."""
         for filepath in ttl_files:
             try:
                 self.graph.parse(str(filepath), format="turtle")
-                self._loaded_sources.append(str(filepath))
+                self._loaded_sources.append(filepath.name)
                 logger.debug(f"Loaded: {filepath}")
             except Exception as e:
                 logger.warning(f"Failed to parse {filepath}: {e}")
@@ -146,43 +268,116 @@ class OntologyLookup:
         self._load_remote_modules(urls)
 
     def _load_remote_modules(self, urls):
-        """Load TTL files from remote URLs, using a local cache."""
+        """Load TTL files from remote URLs, using a local cache.
+
+        Cached files parse straight away; the misses are downloaded together
+        through a small thread pool so their network latencies overlap, then
+        parsed serially (the parse itself is CPU-bound).
+        """
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
+        to_download = []
         for url in urls:
             filename = url.split("/")[-1]
             cached_file = self._cache_dir / filename
 
-            # Try loading from cache first
+            # Try loading from cache first, revalidating stale entries via
+            # a conditional GET (failure keeps the cached copy)
             if cached_file.exists():
+                if time.time() - cached_file.stat().st_mtime > REVALIDATE_AFTER_SECS:
+                    try:
+                        self._download_file(url, cached_file)
+                    except Exception as e:
+                        logger.warning(f"Revalidation failed for {url}: {e}")
                 try:
                     self.graph.parse(str(cached_file), format="turtle")
-                    self._loaded_sources.append(f"cached:{cached_file}")
+                    self._loaded_sources.append(f"cached:{cached_file.name}")
                     logger.debug(f"Loaded from cache: {cached_file}")
                     continue
                 except Exception as e:
                     logger.warning(f"Failed to parse cached file {cached_file}: {e}")
+            to_download.append((url, cached_file))
+
+        if not to_download:
+            return
 
-            # Download, cache, then load from cache
+        # Download concurrently (caching as a side effect), then parse the
+        # downloaded bodies straight from memory — no read-back from disk
+        failures = {}
+        bodies = {}
+
+        def download(url, dest):
+            try:
+                bodies[url] = self._download_file(url, dest)
+            except Exception as e:
+                failures[url] = e
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for url, cached_file in to_download:
+                executor.submit(download, url, cached_file)
+
+        for url, cached_file in to_download:
+            if url in failures:
+                logger.warning(f"Failed to load remote module {url}: {failures[url]}")
+                continue
             try:
-                self._download_file(url, cached_file)
-                self.graph.parse(str(cached_file), format="turtle")
-                self._loaded_sources.append(url)
+                body = bodies.get(url)
+                if body is not None:
+                    self.graph.parse(data=body, format="turtle")
+                else:
+                    self.graph.parse(str(cached_file), format="turtle")
+                self._loaded_sources.append(url.rsplit("/", 1)[-1])
                 logger.debug(f"Loaded from URL: {url}")
             except Exception as e:
                 logger.warning(f"Failed to load remote module {url}: {e}")
 
+        # Callers can load further modules after construction (validate_kb
+        # pulls extra UCO/ProjectVic modules in before describing classes),
+        # so refresh the derived indices over the grown graph and drop any
+        # memoized describe/markdown results — including cached misses.
+        self._build_indices()
+        self._describe_cache.clear()
+        self._markdown_cache.clear()
+
     @staticmethod
     def _download_file(url, dest):
-        """Download a file, using requests (handles SSL properly) or falling back to urllib."""
-        try:
-            import requests
-            resp = requests.get(url, timeout=30)
+        """Download a file, using requests (handles SSL properly) or falling back to urllib.
+
+        Sends If-None-Match when a previous download left an ETag sidecar;
+        a 304 keeps the cached copy (refreshing its mtime so revalidation
+        backs off), and a fresh body stores the new ETag for next time.
+
+        Returns the downloaded bytes, or None when the cached copy was kept,
+        so callers can parse from memory instead of re-reading the file.
+        """
+        etag_file = dest.with_suffix(dest.suffix + ".etag")
+        headers = {"User-Agent": "SOLVE-IT-Generator/1.0"}
+        if dest.exists() and etag_file.exists():
+            headers["If-None-Match"] = etag_file.read_text().strip()
+        if _requests is not None:
+            resp = _get_session().get(url, timeout=30, headers=headers)
+            if resp.status_code == 304:
+                dest.touch()
+                return None
             resp.raise_for_status()
             dest.write_bytes(resp.content)
-        except ImportError:
-            import urllib.request
-            urllib.request.urlretrieve(url, str(dest))
+            if resp.headers.get("ETag"):
+                etag_file.write_text(resp.headers["ETag"])
+            return resp.content
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                data = resp.read()
+                dest.write_bytes(data)
+                etag = resp.headers.get("ETag")
+                if etag:
+                    etag_file.write_text(etag)
+                return data
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                dest.touch()
+                return None
+            raise
 
     def clear_cache(self):
         """Remove all cached ontology files."""
@@ -194,15 +389,22 @@ class OntologyLookup:
     def shorten_uri(self, uri):
         """Convert a full URI to a prefixed short form for display."""
         uri_str = str(uri)
-        for namespace, prefix in NAMESPACE_PREFIXES.items():
-            if uri_str.startswith(namespace):
-                local_name = uri_str[len(namespace):]
-                return f"{prefix}:{local_name}"
+        # Every known namespace ends at a '/' or '#' boundary, so the local
+        # name starts after the last separator — one dict probe instead of a
+        # startswith scan over all namespaces per call.
+        cut = max(uri_str.rfind("/"), uri_str.rfind("#")) + 1
+        if cut:
+            prefix = NAMESPACE_PREFIXES.get(uri_str[:cut])
+            if prefix is not None:
+                # Interned: the same short forms recur across every describe
+                # result, so duplicates collapse to one string object and
+                # later equality checks short-circuit on identity
+                return sys.intern(f"{prefix}:{uri_str[cut:]}")
         # If the URI contains a # fragment, use that
         if "#" in uri_str:
-            return uri_str.split("#")[-1]
+            return sys.intern(uri_str.split("#")[-1])
         # Otherwise use the last path segment
-        return uri_str.split("/")[-1]
+        return sys.intern(uri_str.split("/")[-1])
 
     def describe_class(self, class_uri):
         """
@@ -219,6 +421,10 @@ class OntologyLookup:
                 - comment: rdfs:comment string if available
                 - found: bool indicating whether the class was found in the ontology
         """
+        cached = self._describe_cache.get(class_uri)
+        if cached is not None:
+            return cached
+
         uri = URIRef(class_uri)
         result = {
             "superclasses": [],
@@ -229,46 +435,42 @@ class OntologyLookup:
         }
 
         # Check if the class exists in the ontology
-        is_class = (uri, RDF.type, OWL.Class) in self.graph
-        has_any_triple = any(self.graph.triples((uri, None, None)))
-        if not is_class and not has_any_triple:
+        uri_po = self._by_subject.get(uri)
+        is_class = uri in self._type_index.get(OWL.Class, ())
+        if not is_class and uri_po is None:
+            self._describe_cache[class_uri] = result
             return result
 
         result["found"] = True
 
-        # Get rdfs:comment
-        for comment in self.graph.objects(uri, RDFS.comment):
-            result["comment"] = str(comment)
-            break
-
-        # Get superclasses (skip OWL restrictions and blank nodes)
-        for superclass in self.graph.objects(uri, RDFS.subClassOf):
-            if isinstance(superclass, URIRef):
-                result["superclasses"].append(self.shorten_uri(superclass))
-
-        # Get object properties where this class is the domain
-        for prop in self.graph.subjects(RDFS.domain, uri):
-            if (prop, RDF.type, OWL.ObjectProperty) in self.graph:
-                ranges = []
-                for range_class in self.graph.objects(prop, RDFS.range):
-                    if isinstance(range_class, URIRef):
-                        ranges.append(self.shorten_uri(range_class))
-                result["object_properties"].append({
-                    "name": self.shorten_uri(prop),
-                    "range": ", ".join(ranges) if ranges else "unspecified",
-                })
-
-        # Get data properties where this class is the domain
-        for prop in self.graph.subjects(RDFS.domain, uri):
-            if (prop, RDF.type, OWL.DatatypeProperty) in self.graph:
-                ranges = []
-                for range_type in self.graph.objects(prop, RDFS.range):
-                    if isinstance(range_type, URIRef):
-                        ranges.append(self.shorten_uri(range_type))
-                result["data_properties"].append({
-                    "name": self.shorten_uri(prop),
-                    "range": ", ".join(ranges) if ranges else "unspecified",
-                })
+        # rdfs:comment (first one) and superclasses (skip OWL restrictions
+        # and blank nodes) in one pass over the subject's triples
+        for p, o in (uri_po or ()):
+            if p == RDFS.comment and result["comment"] is None:
+                result["comment"] = str(o)
+            elif p == RDFS.subClassOf and isinstance(o, URIRef):
+                result["superclasses"].append(self.shorten_uri(o))
+
+        def prop_ranges(prop):
+            return [self.shorten_uri(o) for p, o in self._by_subject.get(prop, ())
+                    if p == RDFS.range and isinstance(o, URIRef)]
+
+        # One walk over the properties with this class as domain, dispatched
+        # by property kind
+        object_props = self._type_index.get(OWL.ObjectProperty, ())
+        datatype_props = self._type_index.get(OWL.DatatypeProperty, ())
+        for prop in self._domain_index.get(uri, ()):
+            if prop in object_props:
+                bucket = result["object_properties"]
+            elif prop in datatype_props:
+                bucket = result["data_properties"]
+            else:
+                continue
+            ranges = prop_ranges(prop)
+            bucket.append({
+                "name": self.shorten_uri(prop),
+                "range": ", ".join(ranges) if ranges else "unspecified",
+            })
 
         # Look for UCO-style facet properties (e.g. DeviceFacet for Device)
         facet_props = self._get_facet_properties(class_uri)
@@ -276,6 +478,7 @@ class OntologyLookup:
             result["data_properties"].extend(facet_props["data_properties"])
             result["object_properties"].extend(facet_props["object_properties"])
 
+        self._describe_cache[class_uri] = result
         return result
 
     def _get_facet_properties(self, class_uri):
@@ -293,36 +496,33 @@ class OntologyLookup:
         facet_uri = URIRef(uri_str + "Facet")
 
         # Check if this facet class exists
-        if not any(self.graph.triples((facet_uri, None, None))):
+        facet_po = self._by_subject.get(facet_uri)
+        if facet_po is None:
             return None
 
         result = {"data_properties": [], "object_properties": []}
 
-        # Parse sh:property constraints from the facet's SHACL shape
-        for prop_node in self.graph.objects(facet_uri, SH.property):
-            # Get the property path (sh:path)
+        # Parse sh:property constraints from the facet's SHACL shape; each
+        # shape node's path/datatype/class come from one walk over its triples
+        for pred, prop_node in facet_po:
+            if pred != SH_PROPERTY:
+                continue
             path = None
-            for p in self.graph.objects(prop_node, SH.path):
-                if isinstance(p, URIRef):
-                    path = p
-                    break
+            datatype = None
+            obj_class = None
+            for p, o in self._by_subject.get(prop_node, ()):
+                if p == SH_PATH and path is None and isinstance(o, URIRef):
+                    path = o
+                elif p == SH_DATATYPE and datatype is None:
+                    datatype = self.shorten_uri(o)
+                elif p == SH_CLASS and obj_class is None:
+                    obj_class = self.shorten_uri(o)
 
             if path is None:
                 continue
 
             prop_name = self.shorten_uri(path)
 
-            # Determine if it's a data property (sh:datatype) or object property (sh:class)
-            datatype = None
-            for dt in self.graph.objects(prop_node, SH.datatype):
-                datatype = self.shorten_uri(dt)
-                break
-
-            obj_class = None
-            for oc in self.graph.objects(prop_node, SH["class"]):
-                obj_class = self.shorten_uri(oc)
-                break
-
             if obj_class:
                 result["object_properties"].append({
                     "name": prop_name,
@@ -350,13 +550,19 @@ class OntologyLookup:
             String of markdown to append after the class list item,
             or empty string if no relevant properties are available.
         """
+        cached = self._markdown_cache.get(class_uri)
+        if cached is not None:
+            return cached
+
         desc = self.describe_class(class_uri)
 
         if not desc["found"]:
+            self._markdown_cache[class_uri] = ""
             return ""
 
         has_content = desc["object_properties"] or desc["data_properties"]
         if not has_content:
+            self._markdown_cache[class_uri] = ""
             return ""
 
         lines = []
@@ -364,13 +570,12 @@ class OntologyLookup:
         lines.append("    <summary>Properties</summary>")
         lines.append("    <ul>")
 
-        for prop in desc["object_properties"]:
-            lines.append(f"    <li>{prop['name']} &rarr; {prop['range']}</li>")
-
-        for prop in desc["data_properties"]:
-            lines.append(f"    <li>{prop['name']} ({prop['range']})</li>")
+        lines.extend(map(_OBJ_PROP_LINE, desc["object_properties"]))
+        lines.extend(map(_DATA_PROP_LINE, desc["data_properties"]))
 
         lines.append("    </ul>")
         lines.append("    </details>")
 
-        return "\n".join(lines)
+        markdown = "\n".join(lines)
+        self._markdown_cache[class_uri] = markdown
+        return markdown
@@ -0,0 +1,214 @@
+"""Tests for the HTML generator's payload derivations and remote loading.
+
+Covers:
+- build_indices derivations embedded in the viewer payload (sort ranks,
+  category bitmasks, counts, CSR edge arrays, reference reverse index)
+- the GitHub tarball loader's member parsing and its fallback behaviour
+"""
+
+import io
+import json
+import tarfile
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'reporting_scripts'))
+import generate_html_from_kb as gen
+from generate_html_from_kb import build_indices
+
+
+def _fixture_db():
+    """A small KB exercising every derivation build_indices performs."""
+    return {
+        "techniques": [
+            {"id": "DFT-1001", "name": "acquire disk", "description": "d",
+             "weaknesses": ["DFW-1001", "DFW-1002"], "subtechniques": ["DFT-1003"],
+             "references": [{"DFCite_id": "DFCite-1", "relevance_summary_280": "why"}]},
+            {"id": "DFT-1002", "name": "Analyse memory", "description": "",
+             "weaknesses": [], "references": ["Some plain reference"]},
+            {"id": "DFT-1003", "name": "zip carving", "description": "d",
+             "weaknesses": ["DFW-1002"], "references": ["todo"]},
+        ],
+        "weaknesses": [
+            {"id": "DFW-1001", "name": "missed sectors",
+             "categories": ["ASTM_INCOMP"], "mitigations": ["DFM-1001"],
+             "references": [{"DFCite_id": "DFCite-1"}]},
+            {"id": "DFW-1002", "name": "bad timestamps",
+             "categories": ["ASTM_INAC_EX", "ASTM_MISINT"],
+             "mitigations": ["DFM-1001", "DFM-1002"]},
+        ],
+        "mitigations": [
+            {"id": "DFM-1001", "name": "verify hashes"},
+            {"id": "DFM-1002", "name": "cross-check clocks"},
+        ],
+        "objectives": [
+            {"id": "OBJ-1", "name": "Acquire", "techniques": ["DFT-1001", "DFT-1002"]},
+        ],
+        "citations": {
+            "DFCite-1": {"text": "Author, 2024. Title.", "bib": True, "txt": True,
+                         "raw_bib": "@misc{x}", "raw_txt": "Author, 2024. Title."},
+        },
+    }
+
+
+class TestBuildIndicesPayload(unittest.TestCase):
+
+    def setUp(self):
+        self.db = _fixture_db()
+        self.idx = build_indices(self.db)
+
+    def test_statuses_computed(self):
+        by_id = {t["id"]: t for t in self.db["techniques"]}
+        self.assertEqual(by_id["DFT-1001"]["status"], "complete")
+        self.assertEqual(by_id["DFT-1002"]["status"], "placeholder")  # no weaknesses
+        self.assertEqual(by_id["DFT-1003"]["status"], "complete")
+
+    def test_name_ranks_are_case_insensitive(self):
+        # "acquire disk" < "Analyse memory" < "zip carving" under the
+        # lowercased ordering the viewer's name sorts use
+        ranks = self.idx["rank_t_name"]
+        self.assertLess(ranks["DFT-1001"], ranks["DFT-1002"])
+        self.assertLess(ranks["DFT-1002"], ranks["DFT-1003"])
+
+    def test_objective_column_order_is_case_insensitive(self):
+        self.assertEqual(self.idx["objectives_sorted_tids"],
+                         [["DFT-1001", "DFT-1002"]])
+
+    def test_objective_ranks_inherit_parent_objective(self):
+        """Sub-techniques sort under their parent's objective — the same
+        inherited name the viewer's T2Obj map displays in the Objective
+        column — while techniques with no objective anywhere sort first."""
+        db = {
+            "techniques": [
+                {"id": "DFT-1", "name": "a", "description": "d",
+                 "subtechniques": ["DFT-2"]},
+                {"id": "DFT-2", "name": "b", "description": "d"},
+                {"id": "DFT-3", "name": "c", "description": "d"},
+            ],
+            "weaknesses": [],
+            "mitigations": [],
+            "objectives": [{"id": "O1", "name": "Zeta", "techniques": ["DFT-1"]}],
+        }
+        ranks = build_indices(db)["rank_t_obj"]
+        self.assertLess(ranks["DFT-3"], ranks["DFT-1"])  # no objective → first
+        self.assertLess(ranks["DFT-3"], ranks["DFT-2"])  # sub inherits Zeta
+
+    def test_category_bitmask(self):
+        by_id = {w["id"]: w for w in self.db["weaknesses"]}
+        # Bit order follows WEAKNESS_CATS: INCOMP=1, INAC_EX=2, MISINT=32
+        self.assertEqual(by_id["DFW-1001"]["_catMask"], 1)
+        self.assertEqual(by_id["DFW-1002"]["_catMask"], 2 | 32)
+
+    def test_counts(self):
+        by_w = {w["id"]: w for w in self.db["weaknesses"]}
+        by_t = {t["id"]: t for t in self.db["techniques"]}
+        self.assertEqual(by_w["DFW-1001"]["_mitCount"], 1)
+        self.assertEqual(by_w["DFW-1002"]["_mitCount"], 2)
+        self.assertEqual(by_t["DFT-1001"]["_subCount"], 1)
+        self.assertEqual(by_t["DFT-1002"]["_subCount"], 0)
+
+    def test_csr_edges_match_reverse_maps(self):
+        csr = self.idx["csr"]
+        self.assertEqual(csr["mit_ids"], ["DFM-1001", "DFM-1002"])
+        w_ids = [w["id"] for w in self.db["weaknesses"]]
+        t_ids = [t["id"] for t in self.db["techniques"]]
+        for m_pos, mid in enumerate(csr["mit_ids"]):
+            wids = [w_ids[i] for i in
+                    csr["m2w_idx"][csr["m2w_ptr"][m_pos]:csr["m2w_ptr"][m_pos + 1]]]
+            self.assertEqual(wids, self.idx["mitigation_to_weaknesses"].get(mid, []))
+        for w_pos, wid in enumerate(w_ids):
+            tids = [t_ids[i] for i in
+                    csr["w2t_idx"][csr["w2t_ptr"][w_pos]:csr["w2t_ptr"][w_pos + 1]]]
+            self.assertEqual(tids, self.idx["weakness_to_techniques"].get(wid, []))
+
+    def test_ref_index_contents(self):
+        ref_index = self.idx["ref_index"]
+        # DFCite key, plain-string key; "todo" skipped
+        self.assertEqual(list(ref_index), sorted(ref_index))
+        self.assertIn("DFCite-1", ref_index)
+        self.assertIn("Some plain reference", ref_index)
+        self.assertNotIn("todo", ref_index)
+        entry = ref_index["DFCite-1"]
+        self.assertEqual(entry["text"], "Author, 2024. Title.")
+        self.assertEqual(entry["techniques"], ["DFT-1001"])
+        self.assertEqual(entry["weaknesses"], ["DFW-1001"])
+        self.assertEqual(entry["mitigations"], [])
+
+    def test_ref_has_summary(self):
+        self.assertEqual(self.idx["ref_has_summary"],
+                         {"DFCite-1": {"techniques:DFT-1001": True}})
+
+
+def _make_tarball(members):
+    """Build an in-memory gzipped tarball shaped like GitHub's (with the
+    <org>-<repo>-<sha>/ prefix directory)."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for name, content in members:
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo("SOLVE-IT-DF-solve-it-abc123/" + name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class _FakeResponse(io.BytesIO):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class TestGithubTarballLoader(unittest.TestCase):
+
+    def _load(self, tar_bytes):
+        original = gen.urllib.request.urlopen
+        gen.urllib.request.urlopen = (
+            lambda req, timeout=None, context=None: _FakeResponse(tar_bytes))
+        try:
+            return gen._load_from_github_tarball()
+        finally:
+            gen.urllib.request.urlopen = original
+
+    def test_parses_data_members(self):
+        tar_bytes = _make_tarball([
+            ("data/techniques/DFT-1001.json", json.dumps({"id": "DFT-1001", "name": "T"})),
+            ("data/weaknesses/DFW-1001.json", json.dumps({"id": "DFW-1001", "name": "W"})),
+            ("data/mitigations/DFM-1001.json", json.dumps({"id": "DFM-1001", "name": "M"})),
+            ("data/solve-it.json", json.dumps([{"name": "Obj", "techniques": ["DFT-1001"]}])),
+            ("data/references/DFCite-1.txt", "Some citation"),
+            ("data/references/DFCite-1.bib", "@misc{x}"),
+            ("README.md", "not data"),
+        ])
+        db = self._load(tar_bytes)
+        self.assertIsNotNone(db)
+        self.assertEqual([t["id"] for t in db["techniques"]], ["DFT-1001"])
+        self.assertEqual([w["id"] for w in db["weaknesses"]], ["DFW-1001"])
+        self.assertEqual([m["id"] for m in db["mitigations"]], ["DFM-1001"])
+        self.assertEqual(db["objectives"][0]["name"], "Obj")
+        cite = db["citations"]["DFCite-1"]
+        self.assertEqual(cite["text"], "Some citation")
+        self.assertTrue(cite["bib"])
+        self.assertTrue(cite["txt"])
+
+    def test_empty_tarball_falls_back(self):
+        """A valid tarball without data members must return None so the
+        caller uses the per-file path instead of emitting an empty viewer."""
+        tar_bytes = _make_tarball([("README.md", "not data")])
+        self.assertIsNone(self._load(tar_bytes))
+
+    def test_fetch_failure_falls_back(self):
+        original = gen.urllib.request.urlopen
+        def boom(req, timeout=None, context=None):
+            raise OSError("network down")
+        gen.urllib.request.urlopen = boom
+        try:
+            self.assertIsNone(gen._load_from_github_tarball())
+        finally:
+            gen.urllib.request.urlopen = original
+
+
+if __name__ == '__main__':
+    unittest.main()